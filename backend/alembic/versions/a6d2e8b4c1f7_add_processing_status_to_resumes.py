@@ -0,0 +1,40 @@
+"""add_processing_status_to_resumes
+
+Revision ID: a6d2e8b4c1f7
+Revises: f5c1d8a4e9b2
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d2e8b4c1f7'
+down_revision: Union[str, None] = 'f5c1d8a4e9b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create ENUM type
+    resume_status_enum = sa.Enum('PROCESSING', 'READY', 'FAILED', name='resumestatus')
+    resume_status_enum.create(op.get_bind(), checkfirst=True)
+
+    # Every existing resume was processed synchronously
+    op.add_column('resumes', sa.Column('status', resume_status_enum, server_default='READY', nullable=False))
+    op.alter_column('resumes', 'status', server_default=None)
+    op.add_column('resumes', sa.Column('processing_error', sa.String(), nullable=True))
+
+    # The file is stored by the processing job, after the row exists
+    op.alter_column('resumes', 'file_url', existing_type=sa.VARCHAR(), nullable=True)
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM resumes WHERE file_url IS NULL")
+    op.alter_column('resumes', 'file_url', existing_type=sa.VARCHAR(), nullable=False)
+    op.drop_column('resumes', 'processing_error')
+    op.drop_column('resumes', 'status')
+    sa.Enum(name='resumestatus').drop(op.get_bind(), checkfirst=True)
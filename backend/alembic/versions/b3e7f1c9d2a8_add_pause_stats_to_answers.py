@@ -0,0 +1,26 @@
+"""add pause_stats to answers
+
+Revision ID: b3e7f1c9d2a8
+Revises: a6d2e8b4c1f7
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e7f1c9d2a8'
+down_revision: Union[str, None] = 'a6d2e8b4c1f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('answers', sa.Column('pause_stats', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('answers', 'pause_stats')
@@ -0,0 +1,65 @@
+"""add_user_analytics_rollup_tables
+
+Revision ID: b7e2d4f1a9c3
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2d4f1a9c3'
+down_revision: Union[str, None] = 'a1b2c3d4e5f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rollup rows are seeded lazily from history on first read
+    # (see app.services.analytics_service.get_user_analytics), so no backfill here.
+    op.create_table('user_analytics',
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('interviews_completed', sa.Integer(), nullable=False),
+    sa.Column('questions_practiced', sa.Integer(), nullable=False),
+    sa.Column('scored_interviews', sa.Integer(), nullable=False),
+    sa.Column('score_sum', sa.Float(), nullable=False),
+    sa.Column('first_scores', sa.JSON(), nullable=False),
+    sa.Column('recent_scores', sa.JSON(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_table('user_category_stats',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('category', sa.String(), nullable=False),
+    sa.Column('score_sum', sa.Float(), nullable=False),
+    sa.Column('answer_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'category', name='uq_user_category_stats_user_category')
+    )
+    op.create_index(op.f('ix_user_category_stats_user_id'), 'user_category_stats', ['user_id'], unique=False)
+
+    # Same lockdown as the other public tables; the backend role bypasses RLS
+    for table in ('user_analytics', 'user_category_stats'):
+        op.execute(f'ALTER TABLE {table} ENABLE ROW LEVEL SECURITY;')
+        op.execute(f"""
+            CREATE POLICY {table}_deny_public
+            ON {table}
+            FOR ALL
+            TO public
+            USING (false);
+        """)
+
+
+def downgrade() -> None:
+    for table in ('user_analytics', 'user_category_stats'):
+        op.execute(f'DROP POLICY IF EXISTS {table}_deny_public ON {table};')
+    op.drop_index(op.f('ix_user_category_stats_user_id'), table_name='user_category_stats')
+    op.drop_table('user_category_stats')
+    op.drop_table('user_analytics')
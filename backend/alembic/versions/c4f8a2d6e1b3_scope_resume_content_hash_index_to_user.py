@@ -0,0 +1,29 @@
+"""scope resume content_hash index to user
+
+Revision ID: c4f8a2d6e1b3
+Revises: b3e7f1c9d2a8
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f8a2d6e1b3'
+down_revision: Union[str, None] = 'b3e7f1c9d2a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Parse reuse only looks within the uploading user's resumes
+    op.create_index('ix_resumes_user_id_content_hash', 'resumes', ['user_id', 'content_hash'], unique=False)
+    op.drop_index('ix_resumes_content_hash', table_name='resumes')
+
+
+def downgrade() -> None:
+    op.create_index('ix_resumes_content_hash', 'resumes', ['content_hash'], unique=False)
+    op.drop_index('ix_resumes_user_id_content_hash', table_name='resumes')
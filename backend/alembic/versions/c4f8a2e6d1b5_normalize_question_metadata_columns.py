@@ -0,0 +1,79 @@
+"""normalize_question_metadata_columns
+
+Revision ID: c4f8a2e6d1b5
+Revises: b7e2d4f1a9c3
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f8a2e6d1b5'
+down_revision: Union[str, None] = 'b7e2d4f1a9c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('questions', sa.Column('question_type', sa.String(), nullable=True))
+    op.add_column('questions', sa.Column('category', sa.String(), nullable=True))
+    op.add_column('questions', sa.Column('difficulty', sa.String(), nullable=True))
+
+    op.create_table('question_skill_tags',
+    sa.Column('question_id', sa.Integer(), nullable=False),
+    sa.Column('skill', sa.String(), nullable=False),
+    sa.ForeignKeyConstraint(['question_id'], ['questions.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('question_id', 'skill')
+    )
+
+    # Backfill from the question_context JSON blob
+    op.execute("""
+        UPDATE questions SET
+            question_type = question_context->>'question_type',
+            category = question_context->>'category',
+            difficulty = question_context->>'difficulty'
+        WHERE question_context IS NOT NULL;
+    """)
+    op.execute("""
+        INSERT INTO question_skill_tags (question_id, skill)
+        SELECT DISTINCT q.id, tag.skill
+        FROM questions q,
+             json_array_elements_text(
+                 CASE WHEN json_typeof(q.question_context->'skill_tags') = 'array'
+                      THEN q.question_context->'skill_tags'
+                      ELSE '[]'::json
+                 END
+             ) AS tag(skill)
+        WHERE tag.skill <> '';
+    """)
+
+    # Create indexes after the backfill so it doesn't pay for index maintenance
+    op.create_index(op.f('ix_questions_question_type'), 'questions', ['question_type'], unique=False)
+    op.create_index(op.f('ix_questions_category'), 'questions', ['category'], unique=False)
+    op.create_index(op.f('ix_questions_difficulty'), 'questions', ['difficulty'], unique=False)
+    op.create_index(op.f('ix_question_skill_tags_skill'), 'question_skill_tags', ['skill'], unique=False)
+
+    op.execute('ALTER TABLE question_skill_tags ENABLE ROW LEVEL SECURITY;')
+    op.execute("""
+        CREATE POLICY question_skill_tags_deny_public
+        ON question_skill_tags
+        FOR ALL
+        TO public
+        USING (false);
+    """)
+
+
+def downgrade() -> None:
+    op.execute('DROP POLICY IF EXISTS question_skill_tags_deny_public ON question_skill_tags;')
+    op.drop_index(op.f('ix_question_skill_tags_skill'), table_name='question_skill_tags')
+    op.drop_table('question_skill_tags')
+    op.drop_index(op.f('ix_questions_difficulty'), table_name='questions')
+    op.drop_index(op.f('ix_questions_category'), table_name='questions')
+    op.drop_index(op.f('ix_questions_question_type'), table_name='questions')
+    op.drop_column('questions', 'difficulty')
+    op.drop_column('questions', 'category')
+    op.drop_column('questions', 'question_type')
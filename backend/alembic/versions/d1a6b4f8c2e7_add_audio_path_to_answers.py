@@ -0,0 +1,27 @@
+"""add audio_path to answers
+
+Revision ID: d1a6b4f8c2e7
+Revises: c4f8a2d6e1b3
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1a6b4f8c2e7'
+down_revision: Union[str, None] = 'c4f8a2d6e1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Path within the private answer-audio bucket; links are signed on request
+    op.add_column('answers', sa.Column('audio_path', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('answers', 'audio_path')
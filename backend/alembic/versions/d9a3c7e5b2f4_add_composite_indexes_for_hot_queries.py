@@ -0,0 +1,58 @@
+"""add_composite_indexes_for_hot_queries
+
+Revision ID: d9a3c7e5b2f4
+Revises: c4f8a2e6d1b5
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9a3c7e5b2f4'
+down_revision: Union[str, None] = 'c4f8a2e6d1b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Single-column indexes that duplicate a primary key
+REDUNDANT_PK_INDEXES = [
+    ('ix_users_id', 'users', 'id'),
+    ('ix_resumes_id', 'resumes', 'id'),
+    ('ix_interviews_id', 'interviews', 'id'),
+    ('ix_questions_id', 'questions', 'id'),
+    ('ix_answers_id', 'answers', 'id'),
+    ('ix_subscriptions_id', 'subscriptions', 'id'),
+]
+
+
+def upgrade() -> None:
+    op.create_index('ix_interviews_user_id_status_created_at', 'interviews', ['user_id', 'status', 'created_at'], unique=False)
+    op.create_index('ix_interviews_user_id_id', 'interviews', ['user_id', 'id'], unique=False)
+    op.create_index('ix_resumes_user_id_id', 'resumes', ['user_id', 'id'], unique=False)
+    op.create_index('ix_questions_interview_id_order_number', 'questions', ['interview_id', 'order_number'], unique=False)
+
+    # Now covered by the leading column of the composite indexes above
+    op.drop_index('ix_interviews_user_id', table_name='interviews')
+    op.drop_index('ix_resumes_user_id', table_name='resumes')
+    op.drop_index('ix_questions_interview_id', table_name='questions')
+
+    for index_name, table_name, _ in REDUNDANT_PK_INDEXES:
+        op.drop_index(index_name, table_name=table_name)
+
+
+def downgrade() -> None:
+    for index_name, table_name, column in REDUNDANT_PK_INDEXES:
+        op.create_index(index_name, table_name, [column], unique=False)
+
+    op.create_index('ix_questions_interview_id', 'questions', ['interview_id'], unique=False)
+    op.create_index('ix_resumes_user_id', 'resumes', ['user_id'], unique=False)
+    op.create_index('ix_interviews_user_id', 'interviews', ['user_id'], unique=False)
+
+    op.drop_index('ix_questions_interview_id_order_number', table_name='questions')
+    op.drop_index('ix_resumes_user_id_id', table_name='resumes')
+    op.drop_index('ix_interviews_user_id_id', table_name='interviews')
+    op.drop_index('ix_interviews_user_id_status_created_at', table_name='interviews')
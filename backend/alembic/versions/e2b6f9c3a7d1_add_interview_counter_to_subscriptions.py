@@ -0,0 +1,43 @@
+"""add_interview_counter_to_subscriptions
+
+Revision ID: e2b6f9c3a7d1
+Revises: d9a3c7e5b2f4
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b6f9c3a7d1'
+down_revision: Union[str, None] = 'd9a3c7e5b2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('subscriptions', sa.Column('interviews_created', sa.Integer(), server_default='0', nullable=False))
+
+    # Seed the counter from existing history
+    op.execute("""
+        UPDATE subscriptions s
+        SET interviews_created = counts.total
+        FROM (SELECT user_id, COUNT(*) AS total FROM interviews GROUP BY user_id) counts
+        WHERE counts.user_id = s.user_id
+    """)
+
+    # Users who created interviews before their subscription row existed
+    op.execute("""
+        INSERT INTO subscriptions (user_id, plan, status, interviews_created)
+        SELECT i.user_id, 'free', 'active', COUNT(*)
+        FROM interviews i
+        WHERE NOT EXISTS (SELECT 1 FROM subscriptions s WHERE s.user_id = i.user_id)
+        GROUP BY i.user_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('subscriptions', 'interviews_created')
@@ -0,0 +1,30 @@
+"""add_content_hash_to_resumes
+
+Revision ID: f5c1d8a4e9b2
+Revises: e2b6f9c3a7d1
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5c1d8a4e9b2'
+down_revision: Union[str, None] = 'e2b6f9c3a7d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing rows stay NULL; the extracted text wasn't stored, so they
+    # can't be hashed after the fact
+    op.add_column('resumes', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_index('ix_resumes_content_hash', 'resumes', ['content_hash'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_resumes_content_hash', table_name='resumes')
+    op.drop_column('resumes', 'content_hash')
@@ -1,7 +1,11 @@
 import jwt
 import httpx
+import asyncio
 import base64
-from typing import Dict, Any
+import hashlib
+import time
+from typing import Dict, Any, Optional
+from cachetools import TLRUCache
 from app.logging_config import logger
 from app.config import settings
 from jwt.algorithms import RSAAlgorithm
@@ -10,15 +14,44 @@ from jwt.algorithms import RSAAlgorithm
 _jwks_cache = None
 _jwks_cache_time = 0.0
 _JWKS_TTL = 3600  # re-fetch JWKS once per hour
+_JWKS_REFRESH_AFTER = 3000  # refresh in the background before the TTL runs out
+_jwks_refresh_task: Optional[asyncio.Task] = None
 
+_TOKEN_LEEWAY = 60  # Allow 60 seconds of clock skew
+_VERIFIED_TOKEN_CACHE_SIZE = 4096
 
-async def get_jwks():
-    global _jwks_cache, _jwks_cache_time
-    import time
-    now = time.monotonic()
-    if _jwks_cache is not None and (now - _jwks_cache_time) < _JWKS_TTL:
-        return _jwks_cache
+# Parsed RSA public keys by kid, rebuilt whenever the JWKS is re-fetched
+_signing_keys: Dict[str, Any] = {}
+
+# Verified token payloads by token hash; each entry expires with its token
+_verified_tokens = TLRUCache(
+    maxsize=_VERIFIED_TOKEN_CACHE_SIZE,
+    ttu=lambda _key, payload, _now: payload["exp"] + _TOKEN_LEEWAY,
+    timer=time.time,
+)
+
+# One pooled client for all Clerk calls so requests reuse warm connections
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    return _http_client
+
+
+async def close_http_client():
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
+
+def _jwks_url() -> str:
     publishable_key = settings.NEXT_PUBLIC_CLERK_PUBLISHABLE_KEY or ""
 
     if publishable_key.startswith("pk_test_"):
@@ -29,7 +62,6 @@ async def get_jwks():
         except Exception as e:
             logger.error(f"Failed to decode Clerk domain: {e}")
             domain = encoded_domain.rstrip('$')
-        jwks_url = f"https://{domain}/.well-known/jwks.json"
     else:
         encoded_domain = publishable_key.replace("pk_live_", "")
         try:
@@ -37,24 +69,82 @@ async def get_jwks():
             domain = decoded_bytes.decode('utf-8').rstrip('$')
         except Exception:
             domain = encoded_domain.rstrip('$')
-        jwks_url = f"https://{domain}/.well-known/jwks.json"
 
+    return f"https://{domain}/.well-known/jwks.json"
+
+
+async def _fetch_jwks():
+    global _jwks_cache, _jwks_cache_time
+    jwks_url = _jwks_url()
     logger.info(f"Fetching JWKS from: {jwks_url}")
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(jwks_url)
-        if response.status_code != 200:
-            raise ValueError(f"Failed to fetch JWKS: {response.status_code}")
+    response = await get_http_client().get(jwks_url)
+    if response.status_code != 200:
+        raise ValueError(f"Failed to fetch JWKS: {response.status_code}")
+
+    _jwks_cache = response.json()
+    _jwks_cache_time = time.monotonic()
+    _signing_keys.clear()
+    return _jwks_cache
+
+
+def _refresh_jwks() -> asyncio.Task:
+    """Start a JWKS fetch, or join the one already in flight"""
+    global _jwks_refresh_task
+    if _jwks_refresh_task is None or _jwks_refresh_task.done():
+        _jwks_refresh_task = asyncio.create_task(_fetch_jwks())
+        _jwks_refresh_task.add_done_callback(_log_refresh_failure)
+    return _jwks_refresh_task
+
+
+def _log_refresh_failure(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"JWKS refresh failed: {task.exception()}")
+
 
-        _jwks_cache = response.json()
-        _jwks_cache_time = now
+async def get_jwks():
+    age = time.monotonic() - _jwks_cache_time
+
+    if _jwks_cache is not None and age < _JWKS_TTL:
+        if age >= _JWKS_REFRESH_AFTER:
+            # Close to expiry: refresh without making this request wait
+            _refresh_jwks()
         return _jwks_cache
 
+    # Cold or expired cache: every concurrent caller awaits the same fetch
+    return await asyncio.shield(_refresh_jwks())
+
+
+async def _get_signing_key(kid: str):
+    """Get the parsed public key for a kid, parsing each JWK only once"""
+    jwks = await get_jwks()
+
+    signing_key = _signing_keys.get(kid)
+    if signing_key is None:
+        for key in jwks.get("keys", []):
+            if key.get("kid") == kid:
+                signing_key = RSAAlgorithm.from_jwk(key)
+                _signing_keys[kid] = signing_key
+                break
+
+    return signing_key
+
+
+def _token_cache_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
 
 async def verify_clerk_token(token: str) -> Dict[str, Any]:
     if not settings.CLERK_SECRET_KEY:
         raise ValueError("CLERK_SECRET_KEY not set")
 
+    # Tokens are reused for every request in a session; skip re-verifying
+    # the signature until the token expires.
+    cache_key = _token_cache_key(token)
+    cached = _verified_tokens.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         unverified_header = jwt.get_unverified_header(token)
         kid = unverified_header.get("kid")
@@ -62,14 +152,7 @@ async def verify_clerk_token(token: str) -> Dict[str, Any]:
         if not kid:
             raise ValueError("No kid in token header")
 
-        jwks = await get_jwks()
-        keys = jwks.get("keys", [])
-
-        signing_key = None
-        for key in keys:
-            if key.get("kid") == kid:
-                signing_key = RSAAlgorithm.from_jwk(key)
-                break
+        signing_key = await _get_signing_key(kid)
 
         if not signing_key:
             raise ValueError(f"No matching key found for kid: {kid}")
@@ -79,9 +162,12 @@ async def verify_clerk_token(token: str) -> Dict[str, Any]:
             signing_key,
             algorithms=["RS256"],
             options={"verify_signature": True, "verify_aud": False},
-            leeway=60  # Allow 60 seconds of clock skew
+            leeway=_TOKEN_LEEWAY
         )
 
+        if isinstance(decoded.get("exp"), (int, float)):
+            _verified_tokens[cache_key] = decoded
+
         logger.info(f"Clerk token verified for user: {decoded.get('sub')}")
         return decoded
 
@@ -102,14 +188,13 @@ async def get_clerk_user(user_id: str) -> Dict[str, Any]:
     if not clerk_secret_key:
         raise ValueError("CLERK_SECRET_KEY not set")
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"https://api.clerk.com/v1/users/{user_id}",
-            headers={"Authorization": f"Bearer {clerk_secret_key}"}
-        )
+    response = await get_http_client().get(
+        f"https://api.clerk.com/v1/users/{user_id}",
+        headers={"Authorization": f"Bearer {clerk_secret_key}"}
+    )
 
-        if response.status_code != 200:
-            logger.error(f"Failed to fetch Clerk user: {response.text}")
-            raise ValueError(f"Failed to fetch user from Clerk: {response.status_code}")
+    if response.status_code != 200:
+        logger.error(f"Failed to fetch Clerk user: {response.text}")
+        raise ValueError(f"Failed to fetch user from Clerk: {response.status_code}")
 
-        return response.json()
+    return response.json()
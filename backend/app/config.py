@@ -21,6 +21,11 @@ class Settings(BaseSettings):
     NEXT_PUBLIC_CLERK_PUBLISHABLE_KEY: str | None = None
     CLERK_WEBHOOK_SECRET: str | None = None
 
+    # Authenticated user cache
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_USE_REDIS: bool = False
+
     # JWT Authentication (Legacy)
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
@@ -84,6 +89,11 @@ class Settings(BaseSettings):
             warnings.warn("DEBUG should be False in production environment", UserWarning)
         return v
 
+    # File Storage: "supabase", "local" (files under STORAGE_LOCAL_PATH) or "memory"
+    STORAGE_BACKEND: str = "supabase"
+    STORAGE_LOCAL_PATH: str = "storage"
+    STORAGE_LOCAL_BASE_URL: str = "http://localhost:8000/storage"
+
     # File Upload
     MAX_UPLOAD_SIZE: int = 10485760
     ALLOWED_EXTENSIONS: str = "pdf"
@@ -91,11 +101,34 @@ class Settings(BaseSettings):
     # Audio
     MAX_AUDIO_DURATION: int = 300
     AUDIO_FORMAT: str = "wav"
+    # Answer audio is transcoded to mono Opus with ffmpeg before archival and STT
+    AUDIO_TRANSCODE_ENABLED: bool = True
+    AUDIO_OPUS_BITRATE: str = "24k"
+    AUDIO_TRANSCODE_WORKERS: int = 2
+    # Trim leading/trailing silence and shorten long pauses while transcoding
+    AUDIO_TRIM_SILENCE: bool = True
+
+    # Transcribed answers by recording hash, so resubmissions skip STT
+    TRANSCRIPT_CACHE_TTL_SECONDS: int = 3600
+    TRANSCRIPT_CACHE_MAX_SIZE: int = 1000
+    TRANSCRIPT_CACHE_USE_REDIS: bool = True
 
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 60
     RATE_LIMIT_PER_HOUR: int = 1000
 
+    # Outbound AI provider limits (per worker process), see services/ai_governor.py
+    GEMINI_MAX_CONCURRENT: int = 8
+    GEMINI_REQUESTS_PER_MINUTE: int = 300
+    GEMINI_TOKENS_PER_MINUTE: int = 1000000
+    GROQ_MAX_CONCURRENT: int = 4
+    GROQ_REQUESTS_PER_MINUTE: int = 60
+    OPENAI_MAX_CONCURRENT: int = 4
+    OPENAI_REQUESTS_PER_MINUTE: int = 50
+    # Consecutive failures before a provider's calls fail fast, and how long until it's probed again
+    AI_BREAKER_FAILURE_THRESHOLD: int = 5
+    AI_BREAKER_RECOVERY_SECONDS: int = 30
+
     @property
     def cors_origins(self) -> List[str]:
         """Parse CORS origins from comma-separated string"""
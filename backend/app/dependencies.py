@@ -6,6 +6,8 @@ from app.supabase_client import get_supabase
 from app.clerk_client import verify_clerk_token, get_clerk_user
 from app.database import get_db
 from app.models.user import User
+from app.services.analytics_service import invalidate_user_analytics
+from app.services.user_cache import user_cache
 from app.logging_config import logger
 from app.config import settings
 
@@ -41,12 +43,11 @@ async def get_current_user(
     logger.debug("Authenticating user request")
 
     clerk_key = settings.CLERK_SECRET_KEY
-    logger.info(f"CLERK_SECRET_KEY present: {bool(clerk_key)}")
 
     # Try Clerk authentication first (if CLERK_SECRET_KEY is set)
     if clerk_key:
         try:
-            logger.info("=== Attempting Clerk authentication ===")
+            logger.debug("Attempting Clerk authentication")
 
             # Verify the JWT token
             jwt_payload = await verify_clerk_token(token)
@@ -57,11 +58,17 @@ async def get_current_user(
 
             logger.debug(f"Clerk token verified for user: {clerk_user_id}")
 
+            # Fastest path: user seen recently — no database work at all
+            cached_user = await user_cache.get(clerk_user_id)
+            if cached_user:
+                return AuthenticatedUser(cached_user, token)
+
             # Fast path: user already exists in local DB — no Clerk API call needed
             try:
                 local_user = db.query(User).filter(User.id == clerk_user_id).first()
                 if local_user:
                     logger.debug(f"Local user found: {local_user.email}")
+                    await user_cache.set(local_user)
                     return AuthenticatedUser(local_user, token)
             except (OperationalError, SQLTimeoutError) as db_error:
                 logger.warning(f"Database unavailable during auth fast path: {db_error}")
@@ -130,9 +137,11 @@ async def get_current_user(
                     db.query(Subscription).filter(Subscription.user_id == old_user_id).update(
                         {Subscription.user_id: clerk_user_adapted.id}
                     )
+                    invalidate_user_analytics(old_user_id, db)
 
                     db.delete(existing_user)
                     db.commit()
+                    await user_cache.invalidate(old_user_id)
                     db.refresh(local_user)
                     logger.info("User migration completed successfully")
                 elif existing_user:
@@ -149,6 +158,7 @@ async def get_current_user(
                     db.refresh(local_user)
                     logger.info("Local user created successfully")
 
+                await user_cache.set(local_user)
                 return AuthenticatedUser(local_user, token)
             except (OperationalError, SQLTimeoutError) as db_error:
                 logger.warning(f"Database unavailable during auth (user will be authenticated without local sync): {db_error}")
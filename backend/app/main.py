@@ -9,6 +9,7 @@ from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from app.config import settings
 from app.database import get_db
+from app.upload_limits import UploadSizeLimitMiddleware
 from app.routers import auth, test, resumes, interviews, audio, evaluation, analytics, billing, webhooks
 from app.websocket.interview_handler import sio
 from app.logging_config import logger
@@ -99,6 +100,9 @@ async def log_requests(request: Request, call_next):
             content={"detail": "Internal server error"}
         )
 
+# Reject oversized uploads before their bodies are read
+app.add_middleware(UploadSizeLimitMiddleware, max_upload_size=settings.MAX_UPLOAD_SIZE)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -118,6 +122,15 @@ app.include_router(analytics.router)
 app.include_router(billing.router)
 app.include_router(webhooks.router)
 
+if settings.STORAGE_BACKEND == "local":
+    if settings.ENVIRONMENT == "development":
+        # Serve locally stored files at the URLs LocalStorageBackend hands out.
+        # Unauthenticated, so every user's files are readable: development only.
+        from fastapi.staticfiles import StaticFiles
+        app.mount("/storage", StaticFiles(directory=settings.STORAGE_LOCAL_PATH, check_dir=False), name="storage")
+    else:
+        logger.warning("Local storage files are only served at /storage in development")
+
 
 @app.on_event("startup")
 async def startup_event():
@@ -129,8 +142,11 @@ async def startup_event():
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Log application shutdown"""
+    """Log application shutdown and close pooled clients"""
+    from app.clerk_client import close_http_client
+
     logger.info(f"Shutting down {settings.APP_NAME}")
+    await close_http_client()
 
 
 @app.get("/")
@@ -1,8 +1,9 @@
 from app.models.user import User
 from app.models.resume import Resume
 from app.models.interview import Interview
-from app.models.question import Question
+from app.models.question import Question, QuestionSkillTag
 from app.models.answer import Answer
 from app.models.subscription import Subscription
+from app.models.analytics import UserAnalytics, UserCategoryStats
 
-__all__ = ["User", "Resume", "Interview", "Question", "Answer", "Subscription"]
+__all__ = ["User", "Resume", "Interview", "Question", "QuestionSkillTag", "Answer", "Subscription", "UserAnalytics", "UserCategoryStats"]
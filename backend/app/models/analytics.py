@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Float, UniqueConstraint
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class UserAnalytics(Base):
+    """Per-user analytics rollup, updated when an interview completes or its evaluation commits"""
+    __tablename__ = "user_analytics"
+
+    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    interviews_completed = Column(Integer, nullable=False, default=0)
+    questions_practiced = Column(Integer, nullable=False, default=0)
+    scored_interviews = Column(Integer, nullable=False, default=0)  # Interviews with an overall score
+    score_sum = Column(Float, nullable=False, default=0.0)
+    first_scores = Column(JSON, nullable=False, default=list)  # First 3 scored interviews (improvement rate)
+    recent_scores = Column(JSON, nullable=False, default=list)  # Last 10 scored interviews (score history)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class UserCategoryStats(Base):
+    """Per-user, per-question-category answer score rollup"""
+    __tablename__ = "user_category_stats"
+    __table_args__ = (UniqueConstraint("user_id", "category", name="uq_user_category_stats_user_category"),)
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    category = Column(String, nullable=False)
+    score_sum = Column(Float, nullable=False, default=0.0)
+    answer_count = Column(Integer, nullable=False, default=0)
@@ -7,10 +7,12 @@ from app.database import Base
 class Answer(Base):
     __tablename__ = "answers"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     question_id = Column(Integer, ForeignKey("questions.id"), nullable=False, index=True)
     transcript = Column(String, nullable=False)
     audio_duration_seconds = Column(Float, nullable=True)
+    audio_path = Column(String, nullable=True)  # In the private answer-audio bucket
+    pause_stats = Column(JSON, nullable=True)
     evaluation = Column(JSON, nullable=True)
     score = Column(Float, nullable=True)
     answered_at = Column(DateTime(timezone=True), server_default=func.now())
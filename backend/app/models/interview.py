@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Float, Enum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Float, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -19,9 +19,15 @@ class InterviewType(str, enum.Enum):
 
 class Interview(Base):
     __tablename__ = "interviews"
-
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)  # UUID string
+    __table_args__ = (
+        # Analytics: a user's interviews by status in chronological order
+        Index("ix_interviews_user_id_status_created_at", "user_id", "status", "created_at"),
+        # Keyset-paginated listing of a user's interviews
+        Index("ix_interviews_user_id_id", "user_id", "id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False)  # UUID string
     resume_id = Column(Integer, ForeignKey("resumes.id"), nullable=False)
     interview_type = Column(Enum(InterviewType), default=InterviewType.STANDARD, nullable=False, index=True)
     job_description = Column(String, nullable=True)  # Nullable for resume_grill type
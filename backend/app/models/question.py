@@ -1,17 +1,66 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 
 
 class Question(Base):
     __tablename__ = "questions"
+    __table_args__ = (
+        # An interview's questions in order, and lookup of the next question
+        Index("ix_questions_interview_id_order_number", "interview_id", "order_number"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    interview_id = Column(Integer, ForeignKey("interviews.id"), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    interview_id = Column(Integer, ForeignKey("interviews.id"), nullable=False)
     question_text = Column(String, nullable=False)
     question_context = Column(JSON, nullable=True)  # Category, difficulty, reasoning
     order_number = Column(Integer, nullable=False)  # Question order (1-10)
 
+    # Promoted from question_context so analytics can group and filter in SQL
+    question_type = Column(String, nullable=True, index=True)
+    category = Column(String, nullable=True, index=True)
+    difficulty = Column(String, nullable=True, index=True)
+
     # Relationships
     interview = relationship("Interview", back_populates="questions")
     answers = relationship("Answer", back_populates="question", cascade="all, delete-orphan")
+    skill_tags = relationship("QuestionSkillTag", back_populates="question", cascade="all, delete-orphan", passive_deletes=True)
+
+    @staticmethod
+    def values_from_generated(order_number: int, question_data) -> dict:
+        """
+        Column values for a generated question (dict or plain text)
+
+        Copies type, category and difficulty out of the generated payload
+        into their columns. Skill tags are returned under "skill_tags" for
+        insertion into question_skill_tags; anything other than a list of
+        non-empty strings in the payload is ignored.
+        """
+        question_text = question_data.get("question_text") if isinstance(question_data, dict) else str(question_data)
+
+        if not question_text:
+            raise ValueError(f"Question {order_number} missing question_text: {question_data}")
+
+        context = question_data if isinstance(question_data, dict) else {"question_text": question_text}
+        skill_tags = context.get("skill_tags")
+        if not isinstance(skill_tags, list):
+            skill_tags = []
+
+        return {
+            "question_text": question_text,
+            "question_context": context,
+            "order_number": order_number,
+            "question_type": context.get("question_type"),
+            "category": context.get("category"),
+            "difficulty": context.get("difficulty"),
+            "skill_tags": list(dict.fromkeys(skill for skill in skill_tags if isinstance(skill, str) and skill)),
+        }
+
+
+class QuestionSkillTag(Base):
+    __tablename__ = "question_skill_tags"
+
+    question_id = Column(Integer, ForeignKey("questions.id", ondelete="CASCADE"), primary_key=True)
+    skill = Column(String, primary_key=True, index=True)
+
+    question = relationship("Question", back_populates="skill_tags")
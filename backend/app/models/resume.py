@@ -1,16 +1,32 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+import enum
 from app.database import Base
 
 
+class ResumeStatus(str, enum.Enum):
+    PROCESSING = "processing"  # Uploaded, being parsed and stored
+    READY = "ready"
+    FAILED = "failed"
+
+
 class Resume(Base):
     __tablename__ = "resumes"
+    __table_args__ = (
+        # Keyset-paginated listing of a user's resumes
+        Index("ix_resumes_user_id_id", "user_id", "id"),
+        # Reuse of a user's earlier parse of identical text
+        Index("ix_resumes_user_id_content_hash", "user_id", "content_hash"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)  # UUID string
-    file_url = Column(String, nullable=False)  # URL to PDF in storage
+    id = Column(Integer, primary_key=True)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False)  # UUID string
+    file_url = Column(String, nullable=True)  # URL to PDF in storage, set once processing stores it
     parsed_data = Column(JSON, nullable=True)  # AI-parsed resume data
+    status = Column(Enum(ResumeStatus), default=ResumeStatus.READY, nullable=False)
+    processing_error = Column(String, nullable=True)  # Why processing failed
+    content_hash = Column(String(64), nullable=True)  # SHA-256 of extracted text, reuses parsed_data
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
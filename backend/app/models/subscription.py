@@ -7,13 +7,14 @@ from app.database import Base
 class Subscription(Base):
     __tablename__ = "subscriptions"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(String, ForeignKey("users.id"), unique=True, nullable=False, index=True)
     stripe_customer_id = Column(String, nullable=True, unique=True, index=True)
     stripe_subscription_id = Column(String, nullable=True, unique=True)
     plan = Column(String, default="free")  # "free" or "premium"
     status = Column(String, default="active")  # "active", "canceled", "past_due"
     current_period_end = Column(DateTime(timezone=True), nullable=True)
+    interviews_created = Column(Integer, nullable=False, default=0, server_default="0")  # lifetime, never decremented
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
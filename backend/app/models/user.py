@@ -8,7 +8,7 @@ from app.database import Base
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(String, primary_key=True, index=True)  # Supabase uses UUID strings
+    id = Column(String, primary_key=True)  # Supabase uses UUID strings
     email = Column(String, unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=True)  # Nullable since Supabase handles auth
     full_name = Column(String, nullable=True)
@@ -18,3 +18,5 @@ class User(Base):
     # Relationships
     resumes = relationship("Resume", back_populates="user", cascade="all, delete-orphan")
     interviews = relationship("Interview", back_populates="user", cascade="all, delete-orphan")
+    analytics = relationship("UserAnalytics", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    category_stats = relationship("UserCategoryStats", cascade="all, delete-orphan", passive_deletes=True)
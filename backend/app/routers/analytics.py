@@ -3,14 +3,13 @@ Analytics endpoints for tracking progress and insights
 """
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
 from datetime import datetime, timedelta
 
 from app.database import get_db
 from app.dependencies import get_current_user
-from app.models.interview import Interview, InterviewStatus
-from app.models.question import Question
-from app.models.answer import Answer
+from app.models.analytics import UserAnalytics, UserCategoryStats
+from app.services.analytics_service import get_user_analytics
 
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
 
@@ -31,42 +30,33 @@ async def get_dashboard_stats(
     """
     from app.models.resume import Resume
 
-    # Count resumes
-    total_resumes = db.query(func.count(Resume.id)).filter(
-        Resume.user_id == current_user.id
-    ).scalar() or 0
-
-    # Count completed interviews
-    total_interviews = db.query(func.count(Interview.id)).filter(
-        Interview.user_id == current_user.id,
-        Interview.status == "completed"
-    ).scalar() or 0
-
-    # Count total questions practiced (from completed interviews)
-    completed_interview_ids = db.query(Interview.id).filter(
-        Interview.user_id == current_user.id,
-        Interview.status == "completed"
-    ).all()
-
-    interview_ids = [i[0] for i in completed_interview_ids]
+    resume_count = (
+        select(func.count(Resume.id))
+        .where(Resume.user_id == current_user.id)
+        .scalar_subquery()
+        .label("total_resumes")
+    )
 
-    total_questions = db.query(func.count(Question.id)).filter(
-        Question.interview_id.in_(interview_ids)
-    ).scalar() if interview_ids else 0
+    # Rollup row and resume count in a single SELECT — one round-trip
+    row = db.query(UserAnalytics, resume_count).filter(
+        UserAnalytics.user_id == current_user.id
+    ).first()
 
-    # Calculate average score
-    avg_score_result = db.query(func.avg(Interview.overall_score)).filter(
-        Interview.user_id == current_user.id,
-        Interview.status == "completed",
-        Interview.overall_score.isnot(None)
-    ).scalar()
+    if row:
+        rollup, total_resumes = row
+    else:
+        rollup = get_user_analytics(current_user.id, db)
+        total_resumes = db.query(resume_count).scalar()
 
-    average_score = round(avg_score_result, 1) if avg_score_result else None
+    average_score = (
+        round(rollup.score_sum / rollup.scored_interviews, 1)
+        if rollup.scored_interviews else None
+    )
 
     return {
-        "resumes_uploaded": total_resumes,
-        "interviews_completed": total_interviews,
-        "questions_practiced": total_questions,
+        "resumes_uploaded": total_resumes or 0,
+        "interviews_completed": rollup.interviews_completed,
+        "questions_practiced": rollup.questions_practiced,
         "average_score": average_score
     }
 
@@ -87,14 +77,9 @@ async def get_progress(
     - Improvement rate
     - AI-generated insights
     """
-    # Get all completed interviews for the user
-    interviews = db.query(Interview).filter(
-        Interview.user_id == current_user.id,
-        Interview.status == InterviewStatus.COMPLETED,
-        Interview.overall_score.isnot(None)
-    ).order_by(Interview.created_at).all()
-
-    if not interviews:
+    rollup = get_user_analytics(current_user.id, db)
+
+    if not rollup.scored_interviews:
         return {
             "total_interviews": 0,
             "average_score": None,
@@ -105,58 +90,41 @@ async def get_progress(
             "insights": []
         }
 
-    # Calculate total interviews and average score
-    total_interviews = len(interviews)
-    scores = [i.overall_score for i in interviews if i.overall_score is not None]
-    average_score = sum(scores) / len(scores) if scores else None
+    total_interviews = rollup.scored_interviews
+    average_score = rollup.score_sum / rollup.scored_interviews
 
     # Calculate improvement rate (compare last 3 vs first 3 interviews)
     improvement_rate = None
-    if len(scores) >= 6:
-        first_three_avg = sum(scores[:3]) / 3
-        last_three_avg = sum(scores[-3:]) / 3
+    if total_interviews >= 6:
+        first_three_avg = sum(e["score"] for e in rollup.first_scores) / len(rollup.first_scores)
+        last_three_avg = sum(e["score"] for e in rollup.recent_scores[-3:]) / 3
         if first_three_avg > 0:
             improvement_rate = ((last_three_avg - first_three_avg) / first_three_avg) * 100
 
     # Score history (last 10 interviews)
     score_history = [
         {
-            "date": interview.completed_at.isoformat() if interview.completed_at else interview.created_at.isoformat(),
-            "score": interview.overall_score,
-            "interview_id": interview.id
+            "date": entry["date"],
+            "score": entry["score"],
+            "interview_id": entry["interview_id"]
         }
-        for interview in interviews[-10:]
+        for entry in rollup.recent_scores
     ]
+    scores = [entry["score"] for entry in rollup.recent_scores]
+
+    # Category performance from the per-category rollup
+    category_rows = db.query(UserCategoryStats).filter(
+        UserCategoryStats.user_id == current_user.id,
+        UserCategoryStats.answer_count > 0
+    ).all()
 
-    # Category performance — single join query instead of N+1
-    category_stats = {}
-
-    interview_ids = [i.id for i in interviews]
-    if interview_ids:
-        rows = (
-            db.query(Question.question_context, Answer.score)
-            .join(Answer, Answer.question_id == Question.id)
-            .filter(
-                Question.interview_id.in_(interview_ids),
-                Answer.score.isnot(None)
-            )
-            .all()
-        )
-        for question_context, score in rows:
-            category = (question_context or {}).get('question_type', 'general')
-            if category not in category_stats:
-                category_stats[category] = {'scores': [], 'count': 0}
-            category_stats[category]['scores'].append(score)
-            category_stats[category]['count'] += 1
-
-    # Convert to list format
     category_performance = [
         {
-            "category": category,
-            "average_score": sum(data['scores']) / len(data['scores']),
-            "count": data['count']
+            "category": row.category,
+            "average_score": row.score_sum / row.answer_count,
+            "count": row.answer_count
         }
-        for category, data in category_stats.items()
+        for row in category_rows
     ]
 
     # Sort by average score descending
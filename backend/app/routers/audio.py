@@ -5,12 +5,13 @@ from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Form
 from fastapi.responses import Response
 from pydantic import BaseModel
 from typing import Optional
-import tempfile
 import os
 
+from app.config import settings
 from app.dependencies import get_current_user
+from app.upload_limits import save_upload_to_tempfile
 from app.services.text_to_speech import text_to_speech_service
-from app.services.speech_to_text import speech_to_text_service
+from app.services.speech_to_text import speech_to_text_service, AudioTooLongError
 
 
 router = APIRouter(prefix="/audio", tags=["audio"])
@@ -87,25 +88,27 @@ async def speech_to_text(
                 detail=f"Unsupported audio format. Allowed: {', '.join(allowed_types)}"
             )
 
-        audio_bytes = await audio_file.read()
-
-        with tempfile.NamedTemporaryFile(
-            delete=True,
+        audio_path = await save_upload_to_tempfile(
+            audio_file,
+            settings.MAX_UPLOAD_SIZE,
             suffix=os.path.splitext(audio_file.filename)[1]
-        ) as temp_file:
-            temp_file.write(audio_bytes)
-            temp_file.flush()
+        )
 
-            result = await speech_to_text_service.transcribe_audio(
-                audio_file_path=temp_file.name,
+        try:
+            result = await speech_to_text_service.transcribe_long_audio(
+                audio_file_path=audio_path,
                 language=language
             )
-
-            return TranscriptionResponse(
-                text=result["text"],
-                duration=result.get("duration"),
-                language=result.get("language")
-            )
+        except AudioTooLongError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        finally:
+            os.unlink(audio_path)
+
+        return TranscriptionResponse(
+            text=result["text"],
+            duration=result.get("duration"),
+            language=result.get("language")
+        )
 
     except HTTPException:
         raise
@@ -5,7 +5,7 @@ from pydantic import BaseModel
 from app.database import get_db
 from app.dependencies import get_current_user
 from app.services.stripe_service import create_checkout_session, create_portal_session
-from app.services.subscription_service import get_or_create_subscription, get_lifetime_interview_count
+from app.services.subscription_service import get_or_create_subscription, get_entitlement
 from app.config import settings
 from app.logging_config import logger
 
@@ -22,7 +22,7 @@ async def get_billing_status(
     current_user=Depends(get_current_user)
 ):
     sub = get_or_create_subscription(current_user.id, db)
-    interviews_used = get_lifetime_interview_count(current_user.id, db)
+    interviews_used = get_entitlement(current_user.id, db).interviews_used
     logger.info(f"Billing status for {current_user.id}: plan={sub.plan} status={sub.status}")
 
     return {
@@ -21,6 +21,8 @@ from app.services.evaluation_service import (
 )
 from app.services.interview_service import generate_ideal_answer
 from app.services.subscription_service import check_premium_feature
+from app.services.storage_service import StorageService
+from app.services.analytics_service import record_interview_evaluation, question_category
 
 router = APIRouter(prefix="/evaluation", tags=["Evaluation"])
 limiter = Limiter(key_func=get_remote_address)
@@ -49,6 +51,8 @@ async def evaluate_interview_background(interview_id: int, db: Session):
         ).order_by(Question.order_number).all()
 
         evaluations = []
+        score_changes = []
+        previous_overall_score = interview.overall_score
 
         # Evaluate each answer
         for question in questions:
@@ -75,13 +79,16 @@ async def evaluate_interview_background(interview_id: int, db: Session):
             # Analyze speaking patterns
             speaking_analysis = analyze_speaking_patterns(
                 transcript=answer.transcript,
-                audio_duration_seconds=answer.audio_duration_seconds
+                audio_duration_seconds=answer.audio_duration_seconds,
+                pause_stats=answer.pause_stats
             )
             evaluation['speaking_analysis'] = speaking_analysis
 
             # Store evaluation in answer
+            previous_score = answer.score
             answer.evaluation = evaluation
             answer.score = evaluation.get('score', 0)
+            score_changes.append((question_category(question), previous_score, answer.score))
 
             # Store question category and skill tags for insights
             evaluation['question_category'] = question.question_context.get('category', 'general')
@@ -98,6 +105,8 @@ async def evaluate_interview_background(interview_id: int, db: Session):
         insights = await generate_interview_insights(evaluations, interview.jd_analysis or {})
         skill_performance = aggregate_skill_performance(evaluations)
 
+        record_interview_evaluation(db, interview, previous_overall_score, score_changes)
+
         # Commit all changes
         db.commit()
 
@@ -189,6 +198,7 @@ async def get_evaluation_results(
                 "difficulty": question.question_context.get('difficulty', 'medium'),
                 "skill_tags": question.question_context.get('skill_tags', []),
                 "answer_transcript": answer.transcript,
+                "audio_url": await StorageService.get_audio_url(answer.audio_path) if answer.audio_path else None,
                 "score": answer.score,
                 "evaluation": answer.evaluation,
                 "has_evaluation": answer.evaluation is not None
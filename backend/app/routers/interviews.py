@@ -1,22 +1,65 @@
-from fastapi import APIRouter, HTTPException, Depends, status, Request
+from fastapi import APIRouter, HTTPException, Depends, status, Request, Query
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
+from typing import List, Optional
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
 from app.database import get_db
 from app.dependencies import get_current_user
 from app.models.interview import Interview, InterviewStatus, InterviewType
-from app.models.resume import Resume
-from app.models.question import Question
+from app.models.resume import Resume, ResumeStatus
+from app.models.question import Question, QuestionSkillTag
 from app.services.interview_service import analyze_job_description, generate_interview_questions, generate_resume_grill_questions
 from app.services.company_research_service import generate_company_specific_questions
-from app.services.subscription_service import check_interview_limit, check_question_limit, check_premium_feature
+from app.services.subscription_service import check_interview_limit, check_question_limit, check_premium_feature, invalidate_entitlement, record_interview_created
+from app.services.analytics_service import invalidate_user_analytics
 from app.logging_config import logger
 
 router = APIRouter(prefix="/interviews", tags=["Interviews"])
 limiter = Limiter(key_func=get_remote_address)
 
+# Characters of the job description included in list responses
+JD_PREVIEW_LENGTH = 100
+
+
+def insert_generated_questions(db: Session, interview_id: int, questions: list) -> List[int]:
+    """
+    Insert generated questions and their skill tags in bulk
+
+    Questions go in as a single multi-row INSERT ... RETURNING id, followed
+    by one executemany for the skill tags. Runs inside the caller's
+    transaction; the caller commits.
+
+    Returns:
+        Question ids in the same order as questions
+    """
+    rows = []
+    skill_tags = []
+    for idx, question_data in enumerate(questions):
+        values = Question.values_from_generated(idx, question_data)
+        skill_tags.append(values.pop("skill_tags"))
+        rows.append({"interview_id": interview_id, **values})
+
+    if not rows:
+        return []
+
+    # RETURNING order isn't guaranteed for multi-row inserts; map back by order_number
+    returned = db.execute(insert(Question).returning(Question.id, Question.order_number), rows).all()
+    id_by_order = {order_number: question_id for question_id, order_number in returned}
+    question_ids = [id_by_order[row["order_number"]] for row in rows]
+
+    tag_rows = [
+        {"question_id": question_id, "skill": skill}
+        for question_id, skills in zip(question_ids, skill_tags)
+        for skill in skills
+    ]
+    if tag_rows:
+        db.execute(insert(QuestionSkillTag), tag_rows)
+
+    return question_ids
+
 
 class CreateInterviewRequest(BaseModel):
     resume_id: int
@@ -56,6 +99,12 @@ async def create_interview(
                 detail="Resume not found"
             )
 
+        if resume.status != ResumeStatus.READY:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Resume is still processing" if resume.status == ResumeStatus.PROCESSING else "Resume processing failed"
+            )
+
         # Analyze job description
         jd_analysis = await analyze_job_description(interview_request.job_description)
 
@@ -86,28 +135,30 @@ async def create_interview(
             status=InterviewStatus.PENDING
         )
         db.add(interview)
-        db.commit()
-        db.refresh(interview)
 
-        # Save questions to database
+        # Save interview and questions in one transaction
         try:
-            for idx, question_data in enumerate(questions):
-                # Handle both formats: object with question_text key or direct text
-                question_text = question_data.get("question_text") if isinstance(question_data, dict) else str(question_data)
-
-                if not question_text:
-                    raise ValueError(f"Question {idx} missing question_text: {question_data}")
-
-                question = Question(
-                    interview_id=interview.id,
-                    question_text=question_text,
-                    question_context=question_data if isinstance(question_data, dict) else {"question_text": question_text},
-                    order_number=idx
-                )
-                db.add(question)
-
+            db.flush()
+            insert_generated_questions(db, interview.id, questions)
+            record_interview_created(current_user.id, db)
+
+            # Build the response before commit expires the instance
+            response = {
+                "id": interview.id,
+                "resume_id": interview.resume_id,
+                "job_description": interview.job_description,
+                "jd_analysis": interview.jd_analysis,
+                "questions": questions,
+                "status": interview.status,
+                "created_at": interview.created_at,
+                "message": "Interview created successfully!"
+            }
             db.commit()
+            invalidate_entitlement(current_user.id)
 
+        except HTTPException:
+            db.rollback()
+            raise
         except Exception as e:
             db.rollback()
             raise HTTPException(
@@ -115,17 +166,10 @@ async def create_interview(
                 detail=f"Failed to save questions: {str(e)}"
             )
 
-        return {
-            "id": interview.id,
-            "resume_id": interview.resume_id,
-            "job_description": interview.job_description,
-            "jd_analysis": interview.jd_analysis,
-            "questions": questions,
-            "status": interview.status,
-            "created_at": interview.created_at,
-            "message": "Interview created successfully!"
-        }
+        return response
 
+    except HTTPException:
+        raise
     except Exception as e:
         import traceback
         logger.error(f"Failed to create interview: {str(e)}")
@@ -138,31 +182,62 @@ async def create_interview(
 
 @router.get("/")
 async def list_interviews(
+    cursor: Optional[int] = Query(None, description="Return interviews older than this interview id"),
+    limit: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    """Get all interviews for the current user"""
-    interviews = db.query(Interview).filter(Interview.user_id == current_user.id).all()
+    """
+    Get interviews for the current user, newest first
+
+    Keyset-paginated on interview id. Only a compact summary is returned:
+    the JD analysis and resume are reduced to the fields the dashboard
+    renders, so the full JSON blobs are never loaded.
+    Pass the returned next_cursor back as cursor to fetch the next page.
+    """
+    query = db.query(
+        Interview.id,
+        Interview.resume_id,
+        Interview.interview_type,
+        func.substr(Interview.job_description, 1, JD_PREVIEW_LENGTH + 1).label("job_description"),
+        Interview.jd_analysis["job_title"].as_string().label("job_title"),
+        Interview.jd_analysis["company"].as_string().label("company"),
+        Interview.jd_analysis["required_skills"].label("required_skills"),
+        Interview.status,
+        Interview.overall_score,
+        Interview.created_at,
+        Interview.completed_at,
+        Resume.parsed_data["name"].as_string().label("resume_name"),
+    ).outerjoin(Resume, Resume.id == Interview.resume_id).filter(Interview.user_id == current_user.id)
+
+    if cursor is not None:
+        query = query.filter(Interview.id < cursor)
+
+    rows = query.order_by(Interview.id.desc()).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
 
     return {
-        "count": len(interviews),
+        "count": len(rows),
+        "next_cursor": rows[-1].id if has_more else None,
         "interviews": [
             {
                 "id": i.id,
                 "resume_id": i.resume_id,
                 "interview_type": i.interview_type,
-                "job_description": (i.job_description[:100] + "..." if len(i.job_description) > 100 else i.job_description) if i.job_description else None,
-                "jd_analysis": i.jd_analysis,
+                "job_description": (i.job_description[:JD_PREVIEW_LENGTH] + "..." if len(i.job_description) > JD_PREVIEW_LENGTH else i.job_description) if i.job_description else None,
+                "jd_analysis": {
+                    "job_title": i.job_title,
+                    "company": i.company,
+                    "required_skills": i.required_skills or [],
+                } if i.job_title or i.company or i.required_skills else None,
                 "status": i.status,
                 "overall_score": i.overall_score,
                 "created_at": i.created_at,
                 "completed_at": i.completed_at,
-                "resume": {
-                    "id": i.resume.id,
-                    "parsed_data": i.resume.parsed_data
-                } if i.resume else None
+                "resume": {"id": i.resume_id, "parsed_data": {"name": i.resume_name}},
             }
-            for i in interviews
+            for i in rows
         ]
     }
 
@@ -233,6 +308,7 @@ async def delete_interview(
         )
 
     db.delete(interview)
+    invalidate_user_analytics(current_user.id, db)
     db.commit()
 
     return {"message": "Interview deleted successfully"}
@@ -271,6 +347,12 @@ async def create_resume_grill(
                 detail="Resume not found"
             )
 
+        if resume.status != ResumeStatus.READY:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Resume is still processing" if resume.status == ResumeStatus.PROCESSING else "Resume processing failed"
+            )
+
         # Generate resume grill questions
         questions = await generate_resume_grill_questions(
             resume.parsed_data,
@@ -285,27 +367,28 @@ async def create_resume_grill(
             status=InterviewStatus.PENDING
         )
         db.add(interview)
-        db.commit()
-        db.refresh(interview)
 
-        # Save questions to database
+        # Save interview and questions in one transaction
         try:
-            for idx, question_data in enumerate(questions):
-                question_text = question_data.get("question_text") if isinstance(question_data, dict) else str(question_data)
-
-                if not question_text:
-                    raise ValueError(f"Question {idx} missing question_text: {question_data}")
-
-                question = Question(
-                    interview_id=interview.id,
-                    question_text=question_text,
-                    question_context=question_data if isinstance(question_data, dict) else {"question_text": question_text},
-                    order_number=idx
-                )
-                db.add(question)
-
+            db.flush()
+            insert_generated_questions(db, interview.id, questions)
+            record_interview_created(current_user.id, db)
+
+            # Build the response before commit expires the instance
+            response = {
+                "id": interview.id,
+                "interview_type": interview.interview_type,
+                "resume_id": interview.resume_id,
+                "status": interview.status,
+                "num_questions": len(questions),
+                "created_at": interview.created_at
+            }
             db.commit()
+            invalidate_entitlement(current_user.id)
 
+        except HTTPException:
+            db.rollback()
+            raise
         except Exception as e:
             db.rollback()
             raise HTTPException(
@@ -313,14 +396,7 @@ async def create_resume_grill(
                 detail=f"Failed to save questions: {str(e)}"
             )
 
-        return {
-            "id": interview.id,
-            "interview_type": interview.interview_type,
-            "resume_id": interview.resume_id,
-            "status": interview.status,
-            "num_questions": len(questions),
-            "created_at": interview.created_at
-        }
+        return response
 
     except HTTPException:
         raise
@@ -1,97 +1,161 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, status, Request
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, status, Request, Query, BackgroundTasks
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from io import BytesIO
+from typing import Optional
+import os
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
+from app.config import settings
 from app.database import get_db
 from app.dependencies import get_current_user
-from app.models.resume import Resume
-from app.services.pdf_parser import extract_text_from_pdf
-from app.services.gemini_service import parse_resume_text
+from app.upload_limits import save_upload_to_tempfile
+from app.models.resume import Resume, ResumeStatus
+from app.services.resume_processing import fail_stale_processing, process_resume
 from app.services.storage_service import StorageService
+from app.services.analytics_service import invalidate_user_analytics
 
 router = APIRouter(prefix="/resumes", tags=["Resumes"])
 limiter = Limiter(key_func=get_remote_address)
 
 
-@router.post("/upload", status_code=status.HTTP_201_CREATED)
+@router.post("/upload", status_code=status.HTTP_202_ACCEPTED)
 @limiter.limit("10/hour")
 async def upload_resume(
     request: Request,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
+    """
+    Accept a resume upload for processing
+
+    Returns right away with status=processing; parsing and storage happen
+    in a background job. Poll GET /resumes/{id}/status until the status is
+    ready or failed.
+    """
     if not file.filename.endswith('.pdf'):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Only PDF files are allowed"
         )
 
-    try:
-        content = await file.read()
-        max_size = 10 * 1024 * 1024
-        if len(content) > max_size:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="File size exceeds 10MB limit"
-            )
-
-        pdf_file = BytesIO(content)
-        resume_text = extract_text_from_pdf(pdf_file)
-
-        parsed_data = await parse_resume_text(resume_text)
-
-        file_url = await StorageService.upload_resume(
-            file=content,
-            filename=file.filename,
-            user_id=current_user.id,
-            user_token=current_user.token
-        )
+    file_path = await save_upload_to_tempfile(file, settings.MAX_UPLOAD_SIZE, suffix=".pdf")
 
+    try:
         resume = Resume(
             user_id=current_user.id,
-            file_url=file_url,
-            parsed_data=parsed_data
+            status=ResumeStatus.PROCESSING
         )
         db.add(resume)
-        db.commit()
-        db.refresh(resume)
-
-        return {
+        db.flush()
+        response = {
             "id": resume.id,
-            "file_url": resume.file_url,
-            "parsed_data": resume.parsed_data,
+            "status": resume.status,
             "created_at": resume.created_at,
-            "message": "Resume uploaded and parsed successfully!"
+            "message": "Resume uploaded, processing started"
         }
+        db.commit()
 
     except Exception as e:
+        db.rollback()
+        os.unlink(file_path)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to process resume: {str(e)}"
         )
 
+    background_tasks.add_task(
+        process_resume,
+        response["id"],
+        file_path,
+        file.filename,
+        current_user.id,
+        current_user.token
+    )
+
+    return response
+
+
+@router.get("/{resume_id}/status")
+async def get_resume_status(
+    resume_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """Get the processing status of an uploaded resume"""
+    query = db.query(Resume.id, Resume.status, Resume.processing_error).filter(
+        Resume.id == resume_id,
+        Resume.user_id == current_user.id
+    )
+    row = query.first()
+
+    if row and row.status == ResumeStatus.PROCESSING and fail_stale_processing(current_user.id, db, resume_id):
+        row = query.first()
+
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resume not found"
+        )
+
+    return {
+        "id": row.id,
+        "status": row.status,
+        "error": row.processing_error
+    }
+
 
 @router.get("/")
 async def list_resumes(
+    cursor: Optional[int] = Query(None, description="Return resumes older than this resume id"),
+    limit: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    """Get all resumes for the current user"""
-    resumes = db.query(Resume).filter(Resume.user_id == current_user.id).all()
+    """
+    Get resumes for the current user, newest first
+
+    Keyset-paginated on resume id. parsed_data is reduced to the summary
+    fields shown in resume pickers; use GET /resumes/{id} for the full parse.
+    """
+    query = db.query(
+        Resume.id,
+        Resume.file_url,
+        Resume.parsed_data["name"].as_string().label("name"),
+        Resume.parsed_data["email"].as_string().label("email"),
+        Resume.parsed_data["technical_skills"].label("technical_skills"),
+        Resume.status,
+        Resume.created_at,
+    ).filter(Resume.user_id == current_user.id)
+
+    if cursor is not None:
+        query = query.filter(Resume.id < cursor)
+
+    query = query.order_by(Resume.id.desc()).limit(limit + 1)
+    rows = query.all()
+    if any(r.status == ResumeStatus.PROCESSING for r in rows) and fail_stale_processing(current_user.id, db):
+        rows = query.all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
 
     return {
-        "count": len(resumes),
+        "count": len(rows),
+        "next_cursor": rows[-1].id if has_more else None,
         "resumes": [
             {
                 "id": r.id,
                 "file_url": r.file_url,
-                "parsed_data": r.parsed_data,
+                "parsed_data": {
+                    "name": r.name,
+                    "email": r.email,
+                    "technical_skills": r.technical_skills,
+                },
+                "status": r.status,
                 "created_at": r.created_at
             }
-            for r in resumes
+            for r in rows
         ]
     }
 
@@ -117,6 +181,8 @@ async def get_resume(
         "id": resume.id,
         "file_url": resume.file_url,
         "parsed_data": resume.parsed_data,
+        "status": resume.status,
+        "error": resume.processing_error,
         "created_at": resume.created_at
     }
 
@@ -124,12 +190,19 @@ async def get_resume(
 @router.delete("/{resume_id}")
 async def delete_resume(
     resume_id: int,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    """Delete a resume and all associated interviews"""
+    """
+    Delete a resume and all associated interviews
+
+    Dependent rows are removed with one subquery DELETE per table, so the
+    number of statements doesn't grow with the number of interviews or
+    questions. The stored file is removed after the response is sent.
+    """
     from app.models.interview import Interview
-    from app.models.question import Question
+    from app.models.question import Question, QuestionSkillTag
     from app.models.answer import Answer
 
     resume = db.query(Resume).filter(
@@ -143,32 +216,28 @@ async def delete_resume(
             detail="Resume not found"
         )
 
-    # Get all interviews associated with this resume
-    interviews = db.query(Interview).filter(Interview.resume_id == resume_id).all()
-
-    # Delete all associated data (cascade delete)
-    for interview in interviews:
-        # Get all questions for this interview
-        questions = db.query(Question).filter(Question.interview_id == interview.id).all()
+    file_url = resume.file_url
+    interview_ids = select(Interview.id).where(Interview.resume_id == resume_id)
+    question_ids = select(Question.id).where(Question.interview_id.in_(interview_ids))
 
-        # Delete all answers for each question
-        for question in questions:
-            db.query(Answer).filter(Answer.question_id == question.id).delete()
-
-        # Delete all questions
-        db.query(Question).filter(Question.interview_id == interview.id).delete()
-
-        # Delete the interview
-        db.delete(interview)
-
-    # Delete the resume file from storage
-    await StorageService.delete_resume(resume.file_url, current_user.token)
+    # Delete all associated data, children first
+    db.query(Answer).filter(Answer.question_id.in_(question_ids)).delete(synchronize_session=False)
+    db.query(QuestionSkillTag).filter(QuestionSkillTag.question_id.in_(question_ids)).delete(synchronize_session=False)
+    db.query(Question).filter(Question.interview_id.in_(interview_ids)).delete(synchronize_session=False)
+    deleted_interviews = db.query(Interview).filter(Interview.resume_id == resume_id).delete(synchronize_session=False)
 
     # Delete the resume
-    db.delete(resume)
+    db.query(Resume).filter(Resume.id == resume_id).delete(synchronize_session=False)
+    if deleted_interviews:
+        invalidate_user_analytics(current_user.id, db)
     db.commit()
 
+    # Delete the resume file from storage once the rows are gone; a resume
+    # still processing has no file yet and its job cleans up after itself
+    if file_url:
+        background_tasks.add_task(StorageService.delete_resume, file_url, current_user.token)
+
     return {
         "message": "Resume deleted successfully",
-        "deleted_interviews": len(interviews)
+        "deleted_interviews": deleted_interviews
     }
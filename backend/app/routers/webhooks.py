@@ -2,6 +2,8 @@ from fastapi import APIRouter, Request, HTTPException
 from sqlalchemy.orm import Session
 from app.database import SessionLocal
 from app.services.stripe_service import handle_webhook_event
+from app.services.user_cache import user_cache
+from app.services.subscription_service import invalidate_entitlement
 from app.logging_config import logger
 from app.config import settings
 
@@ -33,6 +35,8 @@ async def clerk_webhook(request: Request):
     Handles Clerk user lifecycle events.
     - user.created  → insert user row + create Stripe customer + free subscription
     - user.deleted  → clean up user row (cascades to all related data)
+
+    Every user event also drops the user from the auth and entitlement caches.
     """
     if not settings.CLERK_WEBHOOK_SECRET:
         raise HTTPException(status_code=500, detail="Clerk webhook secret not configured")
@@ -63,6 +67,10 @@ async def clerk_webhook(request: Request):
     finally:
         db.close()
 
+    if event_type and event_type.startswith("user.") and data.get("id"):
+        await user_cache.invalidate(data["id"])
+        invalidate_entitlement(data["id"])
+
     return {"status": "ok"}
 
 
@@ -0,0 +1,366 @@
+"""
+Shared concurrency and rate limits for external AI providers
+
+Gemini, Groq Whisper and OpenAI TTS are called from interview setup, live
+interview handlers and background evaluation. Without a shared limit a
+burst of interviews finishing at once overruns the provider's quota, and
+the resulting 429s are retried, adding more load. Every provider call goes
+through that provider's governor, which caps in-flight requests and
+spends from token buckets refilled at the provider's requests-per-minute
+and tokens-per-minute limits.
+
+Calls are scheduled in three priority classes:
+
+- INTERACTIVE: a user in a live interview is waiting (follow-up decisions,
+  interview setup, STT, TTS)
+- NEAR_REAL_TIME: a user will look at the result soon (follow-ups
+  precomputed during transcript review, resume parsing, ideal answers)
+- BATCH: bulk work nobody is watching (answer evaluation)
+
+Waiting callers are admitted highest class first. Each class and the
+classes below it may hold at most CLASS_SHARE of the provider's slots, so
+a spike of evaluation jobs can't take every slot from live interviews.
+Each class's queue is bounded by MAX_QUEUED; a call that would exceed it
+fails fast with ProviderBusyError and the caller falls back.
+
+Each governor also has a circuit breaker. After AI_BREAKER_FAILURE_THRESHOLD
+consecutive provider failures (timeouts, connection errors, 429s and 5xx
+responses; see is_provider_failure) the provider is treated as down: calls fail
+immediately with ProviderUnavailableError, so callers use their fallbacks
+(default evaluation, no follow-up, text-only questions) instead of waiting
+through retries. After AI_BREAKER_RECOVERY_SECONDS one probe call is let
+through; if it succeeds the breaker closes, otherwise it stays open.
+"""
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import httpx
+from google.api_core import exceptions as google_exceptions
+from groq import APIConnectionError as GroqConnectionError
+from openai import APIConnectionError as OpenAIConnectionError
+from app.config import settings
+from app.logging_config import logger
+
+INTERACTIVE = 0
+NEAR_REAL_TIME = 1
+BATCH = 2
+
+CLASS_NAMES = {INTERACTIVE: "interactive", NEAR_REAL_TIME: "near-real-time", BATCH: "batch"}
+
+GEMINI = "gemini"
+GROQ = "groq"
+OPENAI = "openai"
+
+# Fraction of a provider's concurrent slots a class and all classes below it may hold
+CLASS_SHARE = {INTERACTIVE: 1.0, NEAR_REAL_TIME: 0.75, BATCH: 0.5}
+
+# Most calls of each class that may wait for a slot
+MAX_QUEUED = {INTERACTIVE: 100, NEAR_REAL_TIME: 100, BATCH: 500}
+
+# Rough Gemini token accounting: ~4 characters per token, plus the response
+CHARS_PER_TOKEN = 4
+RESPONSE_TOKEN_ESTIMATE = 1000
+
+
+def estimate_tokens(prompt: str) -> int:
+    return len(prompt) // CHARS_PER_TOKEN + RESPONSE_TOKEN_ESTIMATE
+
+
+class ProviderBusyError(Exception):
+    """Raised when a provider's queue for a priority class is full"""
+
+
+class ProviderUnavailableError(Exception):
+    """Raised without calling a provider whose circuit breaker is open"""
+
+
+# Errors raised before a provider is called; retrying them immediately won't help
+FAST_FAIL_ERRORS = (ProviderBusyError, ProviderUnavailableError)
+
+# Errors meaning the provider couldn't be reached or didn't answer in time
+TRANSPORT_ERRORS = (
+    asyncio.TimeoutError,
+    TimeoutError,
+    ConnectionError,
+    httpx.TransportError,
+    GroqConnectionError,  # Includes APITimeoutError
+    OpenAIConnectionError,
+    google_exceptions.RetryError,
+)
+
+
+def is_provider_failure(exc: BaseException) -> bool:
+    """
+    Whether an error counts against the provider's circuit breaker
+
+    Only transport errors, timeouts, 429s and 5xx responses mean the
+    provider is struggling. Bad requests, auth errors and bugs in our own
+    handling of a response don't, and must not open the breaker.
+    """
+    if isinstance(exc, TRANSPORT_ERRORS):
+        return True
+    if isinstance(exc, google_exceptions.GoogleAPICallError):
+        status = exc.code
+    elif isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+    else:
+        # groq and openai APIStatusError
+        status = getattr(exc, "status_code", None)
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+
+class TokenBucket:
+    """Allows `per_minute` units per minute, with bursts up to one minute's worth"""
+
+    def __init__(self, per_minute: int):
+        self.rate = per_minute / 60.0
+        self.capacity = float(per_minute)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` units are available (0 if they are now)"""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def take(self, amount: float):
+        self.tokens -= min(amount, self.capacity)
+
+
+class CircuitBreaker:
+    """Stops calls to a provider after consecutive failures until a probe succeeds"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int, recovery_seconds: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+
+    def before_call(self):
+        """
+        Check whether a call may go ahead
+
+        Raises:
+            ProviderUnavailableError: While open, or while a half-open probe is running
+        """
+        if self.state == self.CLOSED:
+            return
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.recovery_seconds:
+                raise ProviderUnavailableError(f"{self.name} is temporarily unavailable")
+            self.state = self.HALF_OPEN
+            logger.info(f"{self.name} circuit half-open, probing")
+        if self.probing:
+            raise ProviderUnavailableError(f"{self.name} is temporarily unavailable")
+        self.probing = True
+
+    def record_success(self):
+        if self.state != self.CLOSED:
+            logger.info(f"{self.name} circuit closed")
+        self.state = self.CLOSED
+        self.failures = 0
+        self.probing = False
+
+    def record_failure(self):
+        self.probing = False
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(f"{self.name} circuit opened after {self.failures} consecutive failures")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def abandon(self):
+        """The call ended without an outcome (e.g. cancelled); free the probe"""
+        self.probing = False
+
+
+class ProviderGovernor:
+    """Admits calls to one provider within its concurrency and rate limits"""
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrent: int,
+        requests_per_minute: int,
+        tokens_per_minute: Optional[int] = None
+    ):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.class_limits = {
+            priority: max(1, int(max_concurrent * share)) for priority, share in CLASS_SHARE.items()
+        }
+        self.requests = TokenBucket(requests_per_minute)
+        self.token_budget = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.breaker = CircuitBreaker(
+            name,
+            settings.AI_BREAKER_FAILURE_THRESHOLD,
+            settings.AI_BREAKER_RECOVERY_SECONDS
+        )
+
+        self.active = 0
+        self.active_by_class = {priority: 0 for priority in CLASS_NAMES}
+        self.queued = {priority: 0 for priority in CLASS_NAMES}
+        self._waiters: List[Tuple[int, int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+
+    def _can_run(self, priority: int) -> bool:
+        if self.active >= self.max_concurrent:
+            return False
+        # This class and everything below it share the class's limit
+        at_or_below = sum(n for p, n in self.active_by_class.items() if p >= priority)
+        return at_or_below < self.class_limits[priority]
+
+    def _admit(self):
+        """Start as many waiters as the limits allow, highest priority first"""
+        self._wakeup = None
+        while self._waiters:
+            priority, _, tokens, future = self._waiters[0]
+            if future.done():
+                # Cancelled while waiting
+                heapq.heappop(self._waiters)
+                continue
+            if not self._can_run(priority):
+                return
+
+            wait = self.requests.wait_time(1)
+            if self.token_budget:
+                wait = max(wait, self.token_budget.wait_time(tokens))
+            if wait > 0:
+                self._wakeup = asyncio.get_running_loop().call_later(wait, self._admit)
+                return
+
+            heapq.heappop(self._waiters)
+            self.requests.take(1)
+            if self.token_budget:
+                self.token_budget.take(tokens)
+            self.active += 1
+            self.active_by_class[priority] += 1
+            future.set_result(None)
+
+    def _release(self, priority: int):
+        self.active -= 1
+        self.active_by_class[priority] -= 1
+        if self._wakeup is None:
+            self._admit()
+
+    async def acquire(self, priority: int = INTERACTIVE, tokens: int = 0):
+        """
+        Wait for a slot in the given priority class
+
+        Raises:
+            ProviderBusyError: If the class's queue is full
+        """
+        if self.queued[priority] >= MAX_QUEUED[priority]:
+            raise ProviderBusyError(f"{self.name} {CLASS_NAMES[priority]} queue is full")
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), tokens, future))
+        self.queued[priority] += 1
+        if self._wakeup is None:
+            self._admit()
+
+        if not future.done():
+            logger.debug(
+                f"{self.name} {CLASS_NAMES[priority]} call queued "
+                f"({len(self._waiters)} waiting, {self.active} active)"
+            )
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Admitted just as the caller was cancelled; give the slot back
+            if future.done() and not future.cancelled():
+                self._release(priority)
+            raise
+        finally:
+            self.queued[priority] -= 1
+
+    @asynccontextmanager
+    async def slot(self, priority: int = INTERACTIVE, tokens: int = 0):
+        """
+        Hold one of the provider's slots for the duration of a call
+
+        A provider failure raised inside the block (see is_provider_failure)
+        counts as a failed call for the circuit breaker; other exceptions
+        propagate without affecting it.
+
+        Raises:
+            ProviderUnavailableError: If the circuit breaker is open
+            ProviderBusyError: If the class's queue is full
+        """
+        self.breaker.before_call()
+        try:
+            await self.acquire(priority, tokens)
+        except BaseException:
+            self.breaker.abandon()
+            raise
+
+        try:
+            yield
+        except BaseException as e:
+            if isinstance(e, Exception) and is_provider_failure(e):
+                self.breaker.record_failure()
+            else:
+                self.breaker.abandon()
+            raise
+        else:
+            self.breaker.record_success()
+        finally:
+            self._release(priority)
+
+    async def call(self, fn: Callable, *args, priority: int = INTERACTIVE, tokens: int = 0, **kwargs) -> Any:
+        """Run a blocking provider SDK call in a worker thread once admitted"""
+        async with self.slot(priority, tokens):
+            return await asyncio.to_thread(fn, *args, **kwargs)
+
+
+_governors: Dict[str, ProviderGovernor] = {}
+
+
+def get_governor(provider: str) -> ProviderGovernor:
+    governor = _governors.get(provider)
+    if governor is None:
+        if provider == GEMINI:
+            governor = ProviderGovernor(
+                GEMINI,
+                settings.GEMINI_MAX_CONCURRENT,
+                settings.GEMINI_REQUESTS_PER_MINUTE,
+                settings.GEMINI_TOKENS_PER_MINUTE
+            )
+        elif provider == GROQ:
+            governor = ProviderGovernor(GROQ, settings.GROQ_MAX_CONCURRENT, settings.GROQ_REQUESTS_PER_MINUTE)
+        elif provider == OPENAI:
+            governor = ProviderGovernor(OPENAI, settings.OPENAI_MAX_CONCURRENT, settings.OPENAI_REQUESTS_PER_MINUTE)
+        else:
+            raise ValueError(f"Unknown AI provider: {provider}")
+        _governors[provider] = governor
+    return governor
+
+
+async def generate_content(model, prompt: str, priority: int = INTERACTIVE):
+    """Call a Gemini model through the Gemini governor"""
+    return await get_governor(GEMINI).call(
+        model.generate_content,
+        prompt,
+        priority=priority,
+        tokens=estimate_tokens(prompt)
+    )
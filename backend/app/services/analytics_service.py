@@ -0,0 +1,211 @@
+"""
+Per-user analytics rollups
+
+The rollup rows are updated incrementally in the same transaction that
+marks an interview completed or commits its evaluation, so the analytics
+endpoints read a single row (plus one row per question category) instead
+of scanning history.
+"""
+from typing import List, Optional, Tuple
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.analytics import UserAnalytics, UserCategoryStats
+from app.models.interview import Interview, InterviewStatus
+from app.models.question import Question
+from app.models.answer import Answer
+from app.logging_config import logger
+
+FIRST_SCORES_KEPT = 3
+RECENT_SCORES_KEPT = 10
+
+
+def _score_entry(interview_id: int, score: float, completed_at, created_at) -> dict:
+    date = completed_at or created_at
+    return {
+        "interview_id": interview_id,
+        "score": score,
+        "date": date.isoformat() if date else None,
+    }
+
+
+def question_category(question: Question) -> str:
+    """Category used to group answer scores in progress analytics"""
+    return question.question_type or "general"
+
+
+def rebuild_user_analytics(user_id: str, db: Session) -> UserAnalytics:
+    """
+    Recompute a user's rollup rows from their full history
+
+    Used to seed the rollup the first time a user is seen and after
+    deletions; everything else goes through record_interview_completed and
+    record_interview_evaluation. Caller commits.
+    """
+    db.query(UserCategoryStats).filter(UserCategoryStats.user_id == user_id).delete(synchronize_session=False)
+    db.query(UserAnalytics).filter(UserAnalytics.user_id == user_id).delete(synchronize_session=False)
+
+    interviews = db.query(
+        Interview.id, Interview.overall_score, Interview.created_at, Interview.completed_at
+    ).filter(
+        Interview.user_id == user_id,
+        Interview.status == InterviewStatus.COMPLETED
+    ).order_by(Interview.created_at).all()
+
+    questions_practiced = db.query(Question.id).join(
+        Interview, Interview.id == Question.interview_id
+    ).filter(
+        Interview.user_id == user_id,
+        Interview.status == InterviewStatus.COMPLETED
+    ).count()
+
+    scored = [i for i in interviews if i.overall_score is not None]
+    history = [_score_entry(i.id, i.overall_score, i.completed_at, i.created_at) for i in scored]
+
+    rollup = UserAnalytics(
+        user_id=user_id,
+        interviews_completed=len(interviews),
+        questions_practiced=questions_practiced,
+        scored_interviews=len(scored),
+        score_sum=sum(i.overall_score for i in scored),
+        first_scores=history[:FIRST_SCORES_KEPT],
+        recent_scores=history[-RECENT_SCORES_KEPT:],
+    )
+    db.add(rollup)
+
+    if scored:
+        category = func.coalesce(Question.question_type, "general")
+        rows = (
+            db.query(category, func.sum(Answer.score), func.count(Answer.score))
+            .join(Answer, Answer.question_id == Question.id)
+            .join(Interview, Interview.id == Question.interview_id)
+            .filter(
+                Interview.user_id == user_id,
+                Interview.status == InterviewStatus.COMPLETED,
+                Interview.overall_score.isnot(None),
+                Answer.score.isnot(None)
+            )
+            .group_by(category)
+            .all()
+        )
+        db.add_all(
+            UserCategoryStats(user_id=user_id, category=name, score_sum=score_sum, answer_count=answer_count)
+            for name, score_sum, answer_count in rows
+        )
+    db.flush()
+
+    logger.info(f"Rebuilt analytics rollup for user {user_id} ({len(interviews)} completed interviews)")
+    return rollup
+
+
+def get_user_analytics(user_id: str, db: Session) -> UserAnalytics:
+    """Get a user's rollup row, seeding it from history if it does not exist yet"""
+    rollup = db.query(UserAnalytics).filter(UserAnalytics.user_id == user_id).first()
+    if rollup is not None:
+        return rollup
+
+    try:
+        rollup = rebuild_user_analytics(user_id, db)
+        db.commit()
+    except IntegrityError:
+        # A concurrent first read seeded the rollup first; use theirs
+        db.rollback()
+        rollup = db.query(UserAnalytics).filter(UserAnalytics.user_id == user_id).one()
+    return rollup
+
+
+def invalidate_user_analytics(user_id: str, db: Session):
+    """
+    Drop a user's rollup so the next read rebuilds it
+
+    Call when interviews are deleted or reassigned. Caller commits.
+    """
+    db.query(UserCategoryStats).filter(UserCategoryStats.user_id == user_id).delete(synchronize_session=False)
+    db.query(UserAnalytics).filter(UserAnalytics.user_id == user_id).delete(synchronize_session=False)
+
+
+def _locked_rollup(user_id: str, db: Session) -> Optional[UserAnalytics]:
+    """
+    Lock a user's rollup row for an incremental update
+
+    Returns None if the user has no rollup yet. The change is then left
+    out on purpose: the first read seeds the rollup from history, which
+    includes it once committed.
+    """
+    return db.query(UserAnalytics).filter(
+        UserAnalytics.user_id == user_id
+    ).with_for_update().first()
+
+
+def record_interview_completed(db: Session, interview: Interview, question_count: int):
+    """
+    Count a newly completed interview in the owner's rollup
+
+    Call in the transaction that sets the interview's status to completed,
+    so the interview is counted whether or not its evaluation succeeds.
+    """
+    rollup = _locked_rollup(interview.user_id, db)
+    if rollup is None:
+        return
+    rollup.interviews_completed += 1
+    rollup.questions_practiced += question_count
+
+
+def record_interview_evaluation(
+    db: Session,
+    interview: Interview,
+    previous_overall_score: Optional[float],
+    score_changes: List[Tuple[str, Optional[float], Optional[float]]]
+):
+    """
+    Apply one interview evaluation to the owner's rollup
+
+    Call after the evaluation has been written to the interview and its
+    answers but before committing, so the rollup update is atomic with it.
+    A previous overall score means the interview is being re-evaluated, in
+    which case only the score deltas are applied.
+
+    Args:
+        db: Session holding the evaluation changes
+        interview: Interview whose overall_score was just set
+        previous_overall_score: overall_score before this evaluation
+        score_changes: (category, previous_score, new_score) per evaluated answer
+    """
+    rollup = _locked_rollup(interview.user_id, db)
+    if rollup is None:
+        return
+
+    first_evaluation = previous_overall_score is None
+    new_score = interview.overall_score
+
+    if new_score is not None:
+        entry = _score_entry(interview.id, new_score, interview.completed_at, interview.created_at)
+        if first_evaluation:
+            rollup.scored_interviews += 1
+            rollup.score_sum += new_score
+            if len(rollup.first_scores) < FIRST_SCORES_KEPT:
+                rollup.first_scores = rollup.first_scores + [entry]
+            rollup.recent_scores = (rollup.recent_scores + [entry])[-RECENT_SCORES_KEPT:]
+        else:
+            rollup.score_sum += new_score - previous_overall_score
+            rollup.first_scores = [entry if e["interview_id"] == interview.id else e for e in rollup.first_scores]
+            rollup.recent_scores = [entry if e["interview_id"] == interview.id else e for e in rollup.recent_scores]
+
+    category_rows = {
+        row.category: row
+        for row in db.query(UserCategoryStats).filter(UserCategoryStats.user_id == interview.user_id).all()
+    }
+    for category, previous_score, score in score_changes:
+        if score is None:
+            continue
+        row = category_rows.get(category)
+        if row is None:
+            row = UserCategoryStats(user_id=interview.user_id, category=category, score_sum=0.0, answer_count=0)
+            db.add(row)
+            category_rows[category] = row
+        if previous_score is None:
+            row.answer_count += 1
+            row.score_sum += score
+        else:
+            row.score_sum += score - previous_score
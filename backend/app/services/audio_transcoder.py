@@ -0,0 +1,303 @@
+"""
+Answer audio normalization
+
+Browsers record answers as webm/wav/m4a at whatever rate and channel count
+the device uses, with silence before and after the answer and long pauses
+inside it. Before an answer is archived and transcribed it is run through
+one ffmpeg pass that transcodes to mono Ogg Opus at a speech bitrate and
+measures pauses. The archived copy keeps the whole recording; the copy
+sent for transcription has leading/trailing silence trimmed and long
+pauses shortened.
+detect_silences and split_audio let long answers be cut at pauses for
+chunked transcription. ffmpeg does the work in its own process; a
+semaphore bounds how many run at once.
+"""
+import asyncio
+import os
+import re
+import shutil
+import tempfile
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from app.config import settings
+from app.logging_config import logger
+
+OPUS_FORMAT = "ogg"
+OPUS_SAMPLE_RATE = 16000
+TRANSCODE_TIMEOUT_SECONDS = 30
+
+# Voice activity thresholds: quieter than SILENCE_THRESHOLD for at least
+# MIN_PAUSE_SECONDS counts as a pause; pauses longer than MAX_PAUSE_SECONDS
+# are shortened to that length in the trimmed audio
+SILENCE_THRESHOLD = "-35dB"
+MIN_PAUSE_SECONDS = 0.5
+MAX_PAUSE_SECONDS = 1.0
+# Shortest pause long audio may be split at
+SPLIT_PAUSE_SECONDS = 0.3
+
+_SILENCE_START = re.compile(r"silence_start: (-?[\d.]+)")
+_SILENCE_END = re.compile(r"silence_end: (-?[\d.]+)")
+_DURATION = re.compile(r"Duration: (\d+):(\d+):([\d.]+)")
+# Progress lines; the last one gives the decoded length when the container
+# doesn't record a duration (MediaRecorder WebM reports "Duration: N/A")
+_PROGRESS_TIME = re.compile(r"time=(\d+):(\d+):([\d.]+)")
+
+_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(settings.AUDIO_TRANSCODE_WORKERS)
+    return _semaphore
+
+
+def _opus_output(target: str) -> list:
+    return [
+        "-ac", "1", "-ar", str(OPUS_SAMPLE_RATE),
+        "-c:a", "libopus", "-b:a", settings.AUDIO_OPUS_BITRATE, "-application", "voip",
+        "-f", "ogg", target,
+    ]
+
+
+def _ffmpeg_command(input_path: str, archive_path: str) -> list:
+    """
+    Transcode to Opus; with silence trimming on, also write a trimmed copy
+
+    The untrimmed audio goes to archive_path. The trimmed copy, when there
+    is one, goes to stdout.
+    """
+    command = ["ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "info", "-stats", "-y", "-i", input_path, "-vn"]
+    if not settings.AUDIO_TRIM_SILENCE:
+        return command + _opus_output(archive_path)
+
+    # silencedetect sees the untrimmed signal, so pause stats describe the recording
+    trim = (
+        f"silencedetect=noise={SILENCE_THRESHOLD}:d={MIN_PAUSE_SECONDS},"
+        f"silenceremove=start_periods=1:start_threshold={SILENCE_THRESHOLD}"
+        f":stop_periods=-1:stop_duration={MAX_PAUSE_SECONDS}:stop_threshold={SILENCE_THRESHOLD}"
+        f":stop_silence={MAX_PAUSE_SECONDS}"
+    )
+    return command + [
+        "-filter_complex", f"[0:a]asplit=2[full][speech];[speech]{trim}[trimmed]",
+        "-map", "[full]", *_opus_output(archive_path),
+        "-map", "[trimmed]", *_opus_output("pipe:1"),
+    ]
+
+
+def _parse_duration(ffmpeg_log: str) -> Optional[float]:
+    """Input duration from the container header, else from the last progress line"""
+    match = _DURATION.search(ffmpeg_log)
+    if match is None:
+        match = next(reversed(list(_PROGRESS_TIME.finditer(ffmpeg_log))), None)
+    if match is None:
+        return None
+    hours, minutes, seconds = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def _parse_silences(ffmpeg_log: str) -> Tuple[Optional[float], List[Tuple[float, float]]]:
+    """Read the input duration and silencedetect (start, end) spans from an ffmpeg log"""
+    total = _parse_duration(ffmpeg_log)
+    if total is None:
+        return None, []
+
+    silences: List[Tuple[float, float]] = []
+    start = None
+    for line in ffmpeg_log.splitlines():
+        if (m := _SILENCE_START.search(line)):
+            start = max(float(m.group(1)), 0.0)
+        elif (m := _SILENCE_END.search(line)) and start is not None:
+            silences.append((start, min(float(m.group(1)), total)))
+            start = None
+    if start is not None:
+        # Silence ran to the end of the recording
+        silences.append((start, total))
+    return total, silences
+
+
+def _parse_pause_stats(ffmpeg_log: str) -> Optional[Dict[str, Any]]:
+    """
+    Summarize silencedetect output
+
+    Silence touching the start or end of the recording is reported as
+    leading/trailing silence; everything in between counts as a pause.
+    Returns None if the recording's duration isn't known.
+    """
+    total, silences = _parse_silences(ffmpeg_log)
+    if total is None:
+        return None
+
+    leading = trailing = 0.0
+    pauses = []
+    for begin, end in silences:
+        if begin <= 0.05:
+            leading = end - begin
+        elif end >= total - 0.05:
+            trailing = end - begin
+        else:
+            pauses.append(end - begin)
+
+    return {
+        "recording_seconds": round(total, 2),
+        "speaking_seconds": round(max(total - leading - trailing - sum(pauses), 0.0), 2),
+        "leading_silence_seconds": round(leading, 2),
+        "trailing_silence_seconds": round(trailing, 2),
+        "pause_count": len(pauses),
+        "total_pause_seconds": round(sum(pauses), 2),
+        "longest_pause_seconds": round(max(pauses, default=0.0), 2),
+    }
+
+
+async def _run(command: list) -> Tuple[bytes, str]:
+    """Run an ffmpeg command in the bounded pool, returning its stdout and log"""
+    async with _get_semaphore():
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=TRANSCODE_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise Exception(f"ffmpeg timed out after {TRANSCODE_TIMEOUT_SECONDS}s")
+
+    log = stderr.decode(errors="replace")
+    if process.returncode != 0:
+        raise Exception(f"ffmpeg exited with {process.returncode}: {log.strip()[-500:]}")
+    return stdout, log
+
+
+async def _run_ffmpeg(input_path: str) -> Tuple[bytes, Optional[bytes], str]:
+    """Returns the untrimmed Opus audio, the trimmed copy (None if not trimming) and the log"""
+    archive_path = f"{input_path}.{OPUS_FORMAT}"
+    try:
+        trimmed, log = await _run(_ffmpeg_command(input_path, archive_path))
+        with open(archive_path, "rb") as archive_file:
+            archived = archive_file.read()
+    finally:
+        if os.path.exists(archive_path):
+            os.unlink(archive_path)
+    return archived, (trimmed if settings.AUDIO_TRIM_SILENCE else None), log
+
+
+async def detect_silences(audio_path: str) -> Tuple[Optional[float], List[Tuple[float, float]]]:
+    """
+    Find an audio file's duration and its silent spans
+
+    Returns:
+        (duration in seconds or None if unknown, [(start, end), ...])
+    """
+    _, log = await _run([
+        "ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "info", "-stats",
+        "-i", audio_path,
+        "-vn", "-af", f"silencedetect=noise={SILENCE_THRESHOLD}:d={SPLIT_PAUSE_SECONDS}",
+        "-f", "null", "-",
+    ])
+    return _parse_silences(log)
+
+
+async def measure_duration(audio_bytes: bytes, source_format: str) -> Optional[float]:
+    """
+    Decode recorded audio to find its length
+
+    Used when transcoding didn't measure the recording. Returns None if
+    ffmpeg isn't installed or can't decode the audio.
+    """
+    if shutil.which("ffmpeg") is None:
+        return None
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{source_format}") as temp_file:
+        temp_file.write(audio_bytes)
+        input_path = temp_file.name
+
+    try:
+        _, log = await _run([
+            "ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "info", "-stats",
+            "-i", input_path, "-vn", "-f", "null", "-",
+        ])
+    except Exception as e:
+        logger.warning(f"Could not measure answer audio: {e}")
+        return None
+    finally:
+        os.unlink(input_path)
+    return _parse_duration(log)
+
+
+async def split_audio(audio_path: str, cut_points: List[float], output_dir: str) -> List[str]:
+    """
+    Split an audio file at cut_points (seconds) into mono Opus chunks
+
+    Returns:
+        Chunk paths in playback order
+    """
+    await _run([
+        "ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error",
+        "-i", audio_path,
+        "-vn", "-ac", "1", "-ar", str(OPUS_SAMPLE_RATE),
+        "-c:a", "libopus", "-b:a", settings.AUDIO_OPUS_BITRATE, "-application", "voip",
+        "-f", "segment", "-segment_times", ",".join(f"{t:.3f}" for t in cut_points),
+        "-reset_timestamps", "1",
+        os.path.join(output_dir, "chunk_%03d.ogg"),
+    ])
+    return sorted(
+        os.path.join(output_dir, name) for name in os.listdir(output_dir) if name.startswith("chunk_")
+    )
+
+
+class TranscodedAnswer(NamedTuple):
+    audio: bytes  # Whole recording, to archive
+    format: str
+    transcription_audio: bytes  # Silence-trimmed when trimming is on, to send for STT
+    duration: Optional[float]  # Length of the recording in seconds, None if not measured
+    pause_stats: Optional[Dict[str, Any]]  # None when silence wasn't analyzed
+
+
+async def transcode_to_opus(audio_bytes: bytes, source_format: str) -> TranscodedAnswer:
+    """
+    Transcode recorded audio to mono Opus, with a silence-trimmed copy for STT
+
+    Falls back to the original audio when transcoding is disabled or ffmpeg
+    isn't installed or fails, so an answer is never lost to a transcoding
+    problem. Without trimming the original is also kept when the Opus file
+    isn't smaller. With trimming the Opus archive is always used, since the
+    trimmed copy sent for transcription shares its format.
+
+    Args:
+        audio_bytes: Audio as recorded
+        source_format: Extension of the recorded audio, e.g. "webm"
+    """
+    original = TranscodedAnswer(audio_bytes, source_format, audio_bytes, None, None)
+    if not settings.AUDIO_TRANSCODE_ENABLED:
+        return original
+    if shutil.which("ffmpeg") is None:
+        logger.warning("ffmpeg not found, storing answer audio as recorded")
+        return original
+
+    # Inputs go through a file since some containers (mp4/m4a) can't be read from a pipe
+    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{source_format}") as temp_file:
+        temp_file.write(audio_bytes)
+        input_path = temp_file.name
+
+    try:
+        opus_bytes, trimmed_bytes, log = await _run_ffmpeg(input_path)
+    except Exception as e:
+        logger.warning(f"Audio transcoding failed, storing answer audio as recorded: {e}")
+        return original
+    finally:
+        os.unlink(input_path)
+
+    duration, _ = _parse_silences(log)
+    if not opus_bytes:
+        return original._replace(duration=duration)
+    if trimmed_bytes is None:
+        if len(opus_bytes) >= len(audio_bytes):
+            return original._replace(duration=duration)
+        return TranscodedAnswer(opus_bytes, OPUS_FORMAT, opus_bytes, duration, None)
+
+    logger.info(
+        f"Transcoded answer audio {len(audio_bytes)} -> {len(opus_bytes)} bytes "
+        f"({len(trimmed_bytes)} bytes trimmed for transcription)"
+    )
+    return TranscodedAnswer(opus_bytes, OPUS_FORMAT, trimmed_bytes or opus_bytes, duration, _parse_pause_stats(log))
@@ -7,6 +7,7 @@ from app.config import settings
 from app.services.web_scraper import scrape_interview_questions
 import json
 from app.logging_config import logger
+from app.services.ai_governor import generate_content
 
 genai.configure(api_key=settings.GEMINI_API_KEY)
 
@@ -70,7 +71,7 @@ Return ONLY a JSON array of questions:
 
 Return ONLY the JSON array, no markdown."""
 
-        response = model.generate_content(search_prompt)
+        response = await generate_content(model, search_prompt)
 
         result_text = response.text.strip()
         if result_text.startswith('```json'):
@@ -104,7 +105,7 @@ Based on these actual questions, extract insights in JSON format:
 
 Return ONLY the JSON, no markdown."""
 
-            response = model.generate_content(analysis_prompt)
+            response = await generate_content(model, analysis_prompt)
             result_text = response.text.strip()
 
             # Remove markdown if present
@@ -2,11 +2,12 @@
 Answer evaluation service using Gemini AI
 """
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import google.generativeai as genai
 from app.config import settings
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_not_exception_type
 from app.logging_config import logger
+from app.services.ai_governor import generate_content, BATCH, FAST_FAIL_ERRORS
 
 # Configure Gemini
 genai.configure(api_key=settings.GEMINI_API_KEY)
@@ -20,7 +21,7 @@ generation_config = {
 ai_retry = retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=1, max=10),
-    retry=retry_if_exception_type((Exception,)),
+    retry=retry_if_not_exception_type(FAST_FAIL_ERRORS),
     before_sleep=lambda retry_state: logger.warning(
         f"Evaluation service retry attempt {retry_state.attempt_number}/3"
     )
@@ -128,7 +129,7 @@ Be constructive and specific. Provide actionable feedback that helps the candida
     try:
         logger.info(f"Evaluating answer for question: {question_text[:50]}...")
         model = genai.GenerativeModel('gemini-2.5-flash', generation_config=generation_config)
-        response = model.generate_content(prompt)
+        response = await generate_content(model, prompt, priority=BATCH)
 
         # Extract JSON from response
         response_text = response.text.strip()
@@ -185,13 +186,18 @@ async def calculate_overall_score(evaluations: list) -> float:
     return round(total / len(evaluations), 2)
 
 
-def analyze_speaking_patterns(transcript: str, audio_duration_seconds: float = None) -> Dict[str, Any]:
+def analyze_speaking_patterns(
+    transcript: str,
+    audio_duration_seconds: float = None,
+    pause_stats: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
     """
     Analyze speaking patterns from transcript
 
     Args:
         transcript: The answer transcript
         audio_duration_seconds: Duration of audio (if available)
+        pause_stats: Pause statistics measured before transcription (if available)
 
     Returns:
         Dict containing:
@@ -200,6 +206,8 @@ def analyze_speaking_patterns(transcript: str, audio_duration_seconds: float = N
         - total_filler_count: Total number of filler words
         - filler_percentage: Percentage of words that are fillers
         - speaking_pace_feedback: Assessment of speaking pace
+        - pause_count, total_pause_seconds, longest_pause_seconds: When
+          pause_stats are provided
     """
 
     # Common filler words and phrases
@@ -267,7 +275,7 @@ def analyze_speaking_patterns(transcript: str, audio_duration_seconds: float = N
     else:
         filler_feedback = "High filler word usage - practice pausing instead"
 
-    return {
+    analysis = {
         "words_per_minute": wpm,
         "total_words": total_words,
         "filler_words": dict(sorted(filler_counts.items(), key=lambda x: x[1], reverse=True)),
@@ -277,6 +285,13 @@ def analyze_speaking_patterns(transcript: str, audio_duration_seconds: float = N
         "filler_word_feedback": filler_feedback
     }
 
+    if pause_stats:
+        analysis["pause_count"] = pause_stats.get("pause_count", 0)
+        analysis["total_pause_seconds"] = pause_stats.get("total_pause_seconds", 0)
+        analysis["longest_pause_seconds"] = pause_stats.get("longest_pause_seconds", 0)
+
+    return analysis
+
 
 async def generate_interview_insights(
     evaluations: list,
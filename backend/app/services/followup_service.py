@@ -6,6 +6,7 @@ import google.generativeai as genai
 from app.config import settings
 import json
 from app.logging_config import logger
+from app.services.ai_governor import generate_content, INTERACTIVE
 
 genai.configure(api_key=settings.GEMINI_API_KEY)
 
@@ -21,7 +22,8 @@ model = genai.GenerativeModel('gemini-2.5-flash', generation_config=generation_c
 async def analyze_answer_quality(
     question_text: str,
     answer_transcript: str,
-    question_context: dict
+    question_context: dict,
+    priority: int = INTERACTIVE
 ) -> dict:
     """
     Quick analysis to determine if a follow-up question is needed
@@ -85,7 +87,7 @@ Return JSON:
 Return ONLY JSON."""
 
     try:
-        response = model.generate_content(prompt)
+        response = await generate_content(model, prompt, priority=priority)
         result_text = response.text.strip()
 
         # Clean markdown
@@ -114,7 +116,8 @@ async def generate_followup_question(
     original_question: str,
     answer_transcript: str,
     question_context: dict,
-    missing_elements: list = None
+    missing_elements: list = None,
+    priority: int = INTERACTIVE
 ) -> dict:
     """
     Generate a natural follow-up question to dig deeper
@@ -146,7 +149,7 @@ Return JSON:
 Return ONLY JSON."""
 
     try:
-        response = model.generate_content(prompt)
+        response = await generate_content(model, prompt, priority=priority)
         result_text = response.text.strip()
 
         # Clean markdown
@@ -172,11 +175,15 @@ Return ONLY JSON."""
 async def should_ask_followup(
     question_text: str,
     answer_transcript: str,
-    question_context: dict
+    question_context: dict,
+    priority: int = INTERACTIVE
 ) -> tuple[bool, dict]:
     """
     Determine if we should ask a follow-up and generate it if needed
 
+    Args:
+        priority: Scheduling class for the LLM calls (see ai_governor)
+
     Returns:
         Tuple of (should_ask: bool, followup_data: dict)
     """
@@ -185,7 +192,8 @@ async def should_ask_followup(
     analysis = await analyze_answer_quality(
         question_text,
         answer_transcript,
-        question_context
+        question_context,
+        priority=priority
     )
 
     if not analysis.get('needs_followup', False):
@@ -196,7 +204,8 @@ async def should_ask_followup(
         question_text,
         answer_transcript,
         question_context,
-        analysis.get('missing_elements', [])
+        analysis.get('missing_elements', []),
+        priority=priority
     )
 
     return True, {
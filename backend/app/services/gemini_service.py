@@ -1,7 +1,8 @@
 import google.generativeai as genai
 from app.config import settings
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_not_exception_type
 from app.logging_config import logger
+from app.services.ai_governor import generate_content, NEAR_REAL_TIME, FAST_FAIL_ERRORS
 
 
 genai.configure(api_key=settings.GEMINI_API_KEY)
@@ -19,11 +20,12 @@ model = genai.GenerativeModel(
 
 
 # Retry decorator for AI service calls
-# Retries up to 3 times with exponential backoff: 1s, 2s, 4s
+# Retries up to 3 times with exponential backoff: 1s, 2s, 4s. Calls rejected
+# by the governor (provider down or overloaded) fail straight through.
 ai_retry = retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=1, max=10),
-    retry=retry_if_exception_type((Exception,)),
+    retry=retry_if_not_exception_type(FAST_FAIL_ERRORS),
     before_sleep=lambda retry_state: logger.warning(
         f"AI service retry attempt {retry_state.attempt_number}/3"
     )
@@ -34,9 +36,11 @@ ai_retry = retry(
 async def test_gemini_connection() -> str:
     try:
         logger.info("Testing Gemini connection")
-        response = model.generate_content("Say hello!")
+        response = await generate_content(model, "Say hello!")
         logger.info("Gemini connection test successful")
         return response.text
+    except FAST_FAIL_ERRORS:
+        raise
     except Exception as e:
         logger.error(f"Gemini API error: {str(e)}")
         raise Exception(f"Gemini API error: {str(e)}")
@@ -123,13 +127,10 @@ IMPORTANT:
 - Keep bullet points as separate array items
 - Preserve technical terms exactly as written
 - Extract ALL URLs (LinkedIn, GitHub, portfolio)
-
-Resume:
-{resume_text}
 """
 
     try:
-        response = model.generate_content(prompt)
+        response = await generate_content(model, prompt, priority=NEAR_REAL_TIME)
         json_text = response.text.strip()
 
         if json_text.startswith('```json'):
@@ -147,6 +148,8 @@ Resume:
         logger.info("Resume parsed successfully")
         return parsed_data
 
+    except FAST_FAIL_ERRORS:
+        raise
     except json.JSONDecodeError as e:
         logger.error(f"Failed to parse Gemini response as JSON: {str(e)}")
         raise Exception(f"Failed to parse Gemini response as JSON: {str(e)}")
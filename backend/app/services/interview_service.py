@@ -3,6 +3,7 @@ Interview generation service using Gemini AI
 """
 import google.generativeai as genai
 from app.config import settings
+from app.services.ai_governor import generate_content, NEAR_REAL_TIME
 import json
 
 genai.configure(api_key=settings.GEMINI_API_KEY)
@@ -51,7 +52,7 @@ async def analyze_job_description(jd_text: str) -> dict:
     Return ONLY the JSON object, no additional text.
     """
 
-    response = model.generate_content(prompt)
+    response = await generate_content(model, prompt)
 
     # Parse JSON from response
     import json
@@ -225,7 +226,7 @@ Return JSON array with {num_questions} questions:
 
 Return ONLY valid JSON, no markdown."""
 
-    response = model.generate_content(prompt)
+    response = await generate_content(model, prompt)
 
     # Parse JSON from response
     import json
@@ -314,7 +315,7 @@ Return JSON:
 
 Return ONLY JSON, no markdown."""
 
-    response = model.generate_content(prompt)
+    response = await generate_content(model, prompt, priority=NEAR_REAL_TIME)
     import json, re
     result_text = response.text.strip()
 
@@ -431,7 +432,7 @@ Return JSON array with {num_questions} questions:
 
 Return ONLY valid JSON, no markdown."""
 
-    response = model.generate_content(prompt)
+    response = await generate_content(model, prompt)
 
     # Parse JSON from response
     result_text = response.text.strip()
@@ -1,20 +1,35 @@
+import asyncio
+import multiprocessing
 import PyPDF2
-from typing import BinaryIO
+from io import BytesIO
+from multiprocessing.connection import Connection
+from typing import BinaryIO, Optional, Union
+from app.logging_config import logger
 
+# Resumes are a few pages; anything past this is ignored rather than parsed
+MAX_PDF_PAGES = 20
+PDF_EXTRACTION_TIMEOUT_SECONDS = 20
+PDF_WORKERS = 2
 
-def extract_text_from_pdf(pdf_file: BinaryIO) -> str:
+_semaphore: Optional[asyncio.Semaphore] = None
+# Workers are started from threads of a multithreaded server, where forking
+# can copy a lock some other thread holds; a spawned process starts clean
+_mp_context = multiprocessing.get_context("spawn")
+
+
+def extract_text_from_pdf(pdf_file: Union[BinaryIO, str]) -> str:
     try:
         pdf_reader = PyPDF2.PdfReader(pdf_file)
 
         if len(pdf_reader.pages) == 0:
             raise Exception("PDF file is empty (no pages)")
 
-        # Extract text from all pages
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
+        # Extract text from the leading pages
+        parts = []
+        for page in pdf_reader.pages[:MAX_PDF_PAGES]:
+            parts.append(page.extract_text() or "")
 
-        text = text.strip()
+        text = "\n".join(parts).strip()
 
         if not text:
             raise Exception("No text could be extracted from PDF. It might be a scanned image.")
@@ -25,3 +40,70 @@ def extract_text_from_pdf(pdf_file: BinaryIO) -> str:
         raise Exception(f"Failed to read PDF: {str(e)}")
     except Exception as e:
         raise Exception(f"PDF extraction error: {str(e)}")
+
+
+def _extract_text(source: Union[bytes, str]) -> str:
+    """Takes bytes or a path since file objects can't be sent to a worker process"""
+    return extract_text_from_pdf(BytesIO(source) if isinstance(source, bytes) else source)
+
+
+def _extraction_worker(source: Union[bytes, str], conn: Connection):
+    """Worker process entry point; sends ("ok", text) or ("error", message)"""
+    try:
+        conn.send(("ok", _extract_text(source)))
+    except Exception as e:
+        conn.send(("error", str(e)))
+    finally:
+        conn.close()
+
+
+def _run_extraction(source: Union[bytes, str]) -> str:
+    """Extract text in a dedicated process, killing it if it overruns"""
+    receiver, sender = _mp_context.Pipe(duplex=False)
+    process = _mp_context.Process(target=_extraction_worker, args=(source, sender), daemon=True)
+    process.start()
+    sender.close()
+    try:
+        if not receiver.poll(PDF_EXTRACTION_TIMEOUT_SECONDS):
+            logger.warning(f"PDF extraction timed out after {PDF_EXTRACTION_TIMEOUT_SECONDS}s")
+            raise Exception("PDF extraction error: timed out while reading the PDF")
+        try:
+            outcome, value = receiver.recv()
+        except EOFError:
+            logger.warning(f"PDF extraction worker exited with {process.exitcode}")
+            raise Exception("PDF extraction error: failed to read the PDF")
+        process.join(timeout=1)
+    finally:
+        receiver.close()
+        if process.is_alive():
+            process.kill()
+            process.join()
+
+    if outcome == "error":
+        raise Exception(value)
+    return value
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(PDF_WORKERS)
+    return _semaphore
+
+
+async def extract_text_from_pdf_async(source: Union[bytes, str]) -> str:
+    """
+    Extract PDF text in a worker process
+
+    Parsing is CPU-bound and malformed files can take seconds, so each
+    extraction runs in its own process, at most PDF_WORKERS at a time. A
+    parse that overruns the timeout is killed without affecting the others.
+
+    Args:
+        source: PDF content, or the path of a PDF file
+
+    Raises:
+        Exception: If the PDF can't be parsed or parsing times out
+    """
+    async with _get_semaphore():
+        return await asyncio.to_thread(_run_extraction, source)
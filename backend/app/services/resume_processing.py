@@ -0,0 +1,141 @@
+"""
+Background resume processing
+
+upload_resume only validates the file and creates the resume row with
+status=processing; this job extracts and parses the text while the file
+is uploaded to storage, then marks the row ready or failed. Clients poll
+GET /resumes/{id}/status for the outcome.
+"""
+import asyncio
+import hashlib
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.resume import Resume, ResumeStatus
+from app.services.pdf_parser import extract_text_from_pdf_async
+from app.services.gemini_service import parse_resume_text
+from app.services.storage_service import StorageService
+from app.logging_config import logger
+
+# A resume still processing after this long lost its job, e.g. to a worker
+# restart, and will never finish
+STALE_PROCESSING_MINUTES = 10
+
+
+async def _extract_and_parse(file_path: str, user_id: str, db: Session) -> tuple:
+    """Extract the PDF text and parse it, reusing the user's earlier parse of identical text"""
+    resume_text = await extract_text_from_pdf_async(file_path)
+
+    # Identical text parses identically, so reuse an earlier parse. Only the
+    # user's own resumes are searched, so the hash can't reveal whether
+    # anyone else uploaded the same resume.
+    content_hash = hashlib.sha256(resume_text.encode("utf-8")).hexdigest()
+    cached = db.query(Resume.parsed_data).filter(
+        Resume.user_id == user_id,
+        Resume.content_hash == content_hash
+    ).order_by(Resume.id.desc()).first()
+
+    if cached and cached.parsed_data:
+        logger.info(f"Reusing cached resume parse {content_hash[:12]}")
+        return cached.parsed_data, content_hash
+
+    return await parse_resume_text(resume_text), content_hash
+
+
+async def _upload(file_path: str, filename: str, user_id: str, user_token: str) -> str:
+    with open(file_path, "rb") as f:
+        return await StorageService.upload_resume(
+            file=f,
+            filename=filename,
+            user_id=user_id,
+            user_token=user_token
+        )
+
+
+async def process_resume(resume_id: int, file_path: str, filename: str, user_id: str, user_token: str):
+    """
+    Parse and store an uploaded resume, then record the outcome on its row
+
+    Runs after the upload response is sent, in its own database session.
+    Parsing and the storage upload run concurrently; if either fails the
+    resume is marked failed and any stored file is removed. Takes ownership
+    of the temp file at file_path and removes it when done.
+    """
+    db: Session = SessionLocal()
+    file_url: Optional[str] = None
+    try:
+        parse_result, upload_result = await asyncio.gather(
+            _extract_and_parse(file_path, user_id, db),
+            _upload(file_path, filename, user_id, user_token),
+            return_exceptions=True
+        )
+        if not isinstance(upload_result, BaseException):
+            file_url = upload_result
+
+        resume = db.query(Resume).filter(Resume.id == resume_id).first()
+        if not resume:
+            # Deleted while processing
+            if file_url:
+                await StorageService.delete_resume(file_url, user_token)
+            return
+
+        error = next((r for r in (parse_result, upload_result) if isinstance(r, BaseException)), None)
+        if error is not None:
+            logger.error(f"Failed to process resume {resume_id}: {error}")
+            if file_url:
+                await StorageService.delete_resume(file_url, user_token)
+            resume.status = ResumeStatus.FAILED
+            resume.processing_error = f"Failed to process resume: {str(error)}"
+            db.commit()
+            return
+
+        resume.parsed_data, resume.content_hash = parse_result
+        resume.file_url = file_url
+        resume.status = ResumeStatus.READY
+        db.commit()
+        logger.info(f"Resume {resume_id} processed")
+
+    except Exception as e:
+        logger.error(f"Resume processing job failed for {resume_id}: {e}")
+        db.rollback()
+        db.query(Resume).filter(Resume.id == resume_id).update({
+            Resume.status: ResumeStatus.FAILED,
+            Resume.processing_error: f"Failed to process resume: {str(e)}"
+        })
+        db.commit()
+    finally:
+        db.close()
+        os.unlink(file_path)
+
+
+def fail_stale_processing(user_id: str, db: Session, resume_id: Optional[int] = None) -> int:
+    """
+    Mark a user's resumes stuck in processing as failed
+
+    Called when clients read resume status, so a job lost to a restart
+    surfaces as a failure instead of polling forever. Limit to one resume
+    with resume_id. Commits if anything changed.
+
+    Returns:
+        Number of resumes marked failed
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(minutes=STALE_PROCESSING_MINUTES)
+    query = db.query(Resume).filter(
+        Resume.user_id == user_id,
+        Resume.status == ResumeStatus.PROCESSING,
+        Resume.created_at < cutoff
+    )
+    if resume_id is not None:
+        query = query.filter(Resume.id == resume_id)
+
+    failed = query.update({
+        Resume.status: ResumeStatus.FAILED,
+        Resume.processing_error: "Resume processing was interrupted. Please upload it again."
+    }, synchronize_session=False)
+    if failed:
+        db.commit()
+        logger.warning(f"Marked {failed} stale processing resume(s) failed for user {user_id}")
+    return failed
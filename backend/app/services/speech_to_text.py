@@ -1,8 +1,63 @@
 
+import asyncio
 import os
-from typing import Dict, Optional
+import shutil
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
 from groq import Groq
 from app.config import settings
+from app.services.audio_transcoder import detect_silences, split_audio
+from app.services.ai_governor import get_governor, GROQ, FAST_FAIL_ERRORS
+from app.logging_config import logger
+
+# Audio longer than this is split at pauses and transcribed in parallel
+LONG_AUDIO_SECONDS = 90
+CHUNK_SECONDS = 60
+# How far from a chunk boundary to look for a pause to cut at
+CUT_SEARCH_SECONDS = 15
+
+# Timeout grows with audio length: base plus a per-second allowance
+BASE_TIMEOUT_SECONDS = 15
+TIMEOUT_PER_AUDIO_SECOND = 0.5
+MAX_TIMEOUT_SECONDS = 90
+
+
+class AudioTooLongError(Exception):
+    """Raised when audio exceeds MAX_AUDIO_DURATION"""
+
+
+def adaptive_timeout(duration: Optional[float]) -> int:
+    """Transcription timeout for audio of the given length"""
+    if not duration:
+        return 60
+    return int(min(BASE_TIMEOUT_SECONDS + duration * TIMEOUT_PER_AUDIO_SECOND, MAX_TIMEOUT_SECONDS))
+
+
+def choose_cut_points(duration: float, silences: List[Tuple[float, float]]) -> List[float]:
+    """
+    Pick split points about CHUNK_SECONDS apart, preferring the middle of a pause
+
+    Each boundary moves to the nearest pause within CUT_SEARCH_SECONDS so
+    words aren't cut in half; without one it stays on the boundary.
+    """
+    cuts: List[float] = []
+    target = CHUNK_SECONDS
+    while target < duration - CUT_SEARCH_SECONDS:
+        previous = cuts[-1] if cuts else 0.0
+        midpoints = [
+            (start + end) / 2 for start, end in silences
+            if abs((start + end) / 2 - target) <= CUT_SEARCH_SECONDS and (start + end) / 2 > previous
+        ]
+        cut = min(midpoints, key=lambda m: abs(m - target)) if midpoints else target
+        cuts.append(cut)
+        target = cut + CHUNK_SECONDS
+    return cuts
+
+
+def _segment_dict(segment: Any) -> Dict[str, Any]:
+    if isinstance(segment, dict):
+        return dict(segment)
+    return {"start": segment.start, "end": segment.end, "text": segment.text}
 
 
 class SpeechToTextService:
@@ -18,7 +73,7 @@ class SpeechToTextService:
         language: str = "en",
         prompt: Optional[str] = None,
         timeout: int = 30
-    ) -> Dict[str, any]:
+    ) -> Dict[str, Any]:
         """
         Transcribe audio file to text using Groq Whisper
 
@@ -37,28 +92,24 @@ class SpeechToTextService:
                 "segments": list (optional)
             }
         """
-        import asyncio
-
         try:
             # Run transcription with timeout
             async def _transcribe():
                 with open(audio_file_path, "rb") as audio_file:
-                    # Groq client is synchronous, run in executor
-                    loop = asyncio.get_event_loop()
-                    transcription = await loop.run_in_executor(
-                        None,
-                        lambda: self.client.audio.transcriptions.create(
-                            file=audio_file,
-                            model=self.model,
-                            language=language,
-                            prompt=prompt,
-                            response_format="verbose_json",
-                            temperature=0.0
-                        )
+                    # Groq client is synchronous, run in a thread
+                    return await asyncio.to_thread(
+                        self.client.audio.transcriptions.create,
+                        file=audio_file,
+                        model=self.model,
+                        language=language,
+                        prompt=prompt,
+                        response_format="verbose_json",
+                        temperature=0.0
                     )
-                    return transcription
 
-            transcription = await asyncio.wait_for(_transcribe(), timeout=timeout)
+            # The timeout covers the provider call, not time queued for a slot
+            async with get_governor(GROQ).slot():
+                transcription = await asyncio.wait_for(_transcribe(), timeout=timeout)
 
             result = {
                 "text": transcription.text.strip(),
@@ -73,15 +124,84 @@ class SpeechToTextService:
 
         except asyncio.TimeoutError:
             raise Exception(f"Transcription timeout after {timeout} seconds. Audio may be too long or corrupted.")
+        except FAST_FAIL_ERRORS:
+            raise
         except Exception as e:
             raise Exception(f"Error transcribing audio: {str(e)}")
 
+    async def transcribe_long_audio(
+        self,
+        audio_file_path: str,
+        language: str = "en"
+    ) -> Dict[str, Any]:
+        """
+        Transcribe audio of any length within MAX_AUDIO_DURATION
+
+        Short audio is sent as one request with a timeout sized to its
+        length. Audio longer than LONG_AUDIO_SECONDS is split at pauses into
+        ~CHUNK_SECONDS pieces that are transcribed concurrently, so latency
+        stays roughly flat as answers get longer. Falls back to a single
+        request if ffmpeg isn't available.
+
+        Args:
+            audio_file_path: Path to audio file
+            language: Language code (default: "en")
+
+        Returns:
+            Same shape as transcribe_audio; segment timestamps are relative
+            to the whole recording
+
+        Raises:
+            AudioTooLongError: If the audio exceeds MAX_AUDIO_DURATION
+        """
+        duration, silences = None, []
+        if shutil.which("ffmpeg") is not None:
+            try:
+                duration, silences = await detect_silences(audio_file_path)
+            except Exception as e:
+                logger.warning(f"Could not measure audio before transcription: {e}")
+
+        if duration and duration > settings.MAX_AUDIO_DURATION:
+            raise AudioTooLongError(
+                f"Audio is {duration:.0f}s long; the limit is {settings.MAX_AUDIO_DURATION}s"
+            )
+
+        if not duration or duration <= LONG_AUDIO_SECONDS:
+            return await self.transcribe_audio(audio_file_path, language, timeout=adaptive_timeout(duration))
+
+        cut_points = choose_cut_points(duration, silences)
+        with tempfile.TemporaryDirectory() as chunk_dir:
+            chunk_paths = await split_audio(audio_file_path, cut_points, chunk_dir)
+            offsets = [0.0] + cut_points
+            ends = cut_points + [duration]
+            logger.info(f"Transcribing {duration:.0f}s of audio in {len(chunk_paths)} chunks")
+
+            results = await asyncio.gather(*(
+                self.transcribe_audio(path, language, timeout=adaptive_timeout(end - offset))
+                for path, offset, end in zip(chunk_paths, offsets, ends)
+            ))
+
+        segments = []
+        for result, offset in zip(results, offsets):
+            for segment in result.get("segments") or []:
+                segment = _segment_dict(segment)
+                segment["start"] += offset
+                segment["end"] += offset
+                segments.append(segment)
+
+        return {
+            "text": " ".join(r["text"] for r in results if r["text"]),
+            "duration": duration,
+            "language": results[0].get("language", language),
+            "segments": segments,
+        }
+
     async def transcribe_audio_bytes(
         self,
         audio_bytes: bytes,
         filename: str = "audio.wav",
         language: str = "en"
-    ) -> Dict[str, any]:
+    ) -> Dict[str, Any]:
         """
         Transcribe audio from bytes
 
@@ -93,8 +213,6 @@ class SpeechToTextService:
         Returns:
             Dict with transcript and metadata
         """
-        import tempfile
-
         try:
             with tempfile.NamedTemporaryFile(
                 delete=False,
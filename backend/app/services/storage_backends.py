@@ -0,0 +1,186 @@
+"""
+File storage backends
+
+StorageService stores files through whichever backend Settings selects:
+Supabase Storage in deployments, a local directory for offline
+development and load tests, or process memory for unit tests. Every
+backend addresses files by bucket and path and hands out URLs that it can
+map back to a path for deletion.
+"""
+import asyncio
+import os
+import shutil
+import time
+from abc import ABC, abstractmethod
+from io import BufferedReader, BytesIO, FileIO
+from typing import BinaryIO, Dict, Optional, Tuple
+from supabase import create_client, Client
+from app.config import settings
+from app.logging_config import logger
+
+
+class StorageBackend(ABC):
+    """Interface implemented by every storage backend"""
+
+    @abstractmethod
+    async def upload(self, bucket: str, path: str, data: bytes, content_type: str) -> str:
+        """Store data at bucket/path and return its public URL"""
+
+    async def upload_file(self, bucket: str, path: str, file: BinaryIO, content_type: str) -> str:
+        """Store the contents of a file object; backends that can stream override this"""
+        return await self.upload(bucket, path, await asyncio.to_thread(file.read), content_type)
+
+    @abstractmethod
+    async def download(self, bucket: str, path: str) -> bytes:
+        """Read the file at bucket/path"""
+
+    @abstractmethod
+    async def delete(self, bucket: str, path: str):
+        """Remove the file at bucket/path"""
+
+    @abstractmethod
+    async def signed_url(self, bucket: str, path: str, expires_in: int = 3600) -> str:
+        """URL granting temporary read access to a private file"""
+
+    @abstractmethod
+    def path_from_url(self, bucket: str, url: str) -> str:
+        """Inverse of the URL returned by upload"""
+
+
+# Service-key client shared by all storage calls, so uploads reuse its
+# HTTP connection pool instead of building a client per call.
+# The service key lets storage work with both Clerk and Supabase authenticated users.
+_storage_client: Optional[Client] = None
+
+
+def get_storage_client() -> Client:
+    """Get the shared service-key Supabase client"""
+    global _storage_client
+    if _storage_client is None:
+        _storage_client = create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_KEY)
+    return _storage_client
+
+
+class SupabaseStorageBackend(StorageBackend):
+    """Supabase Storage; the sync client runs in a thread to keep it off the event loop"""
+
+    def _bucket(self, bucket: str):
+        return get_storage_client().storage.from_(bucket)
+
+    async def upload(self, bucket: str, path: str, data: bytes, content_type: str) -> str:
+        proxy = self._bucket(bucket)
+        await asyncio.to_thread(proxy.upload, path=path, file=data, file_options={"content-type": content_type})
+        return proxy.get_public_url(path)
+
+    async def upload_file(self, bucket: str, path: str, file: BinaryIO, content_type: str) -> str:
+        if not isinstance(file, (BufferedReader, FileIO)):
+            # storage3 only streams real file objects
+            return await super().upload_file(bucket, path, file, content_type)
+        proxy = self._bucket(bucket)
+        await asyncio.to_thread(proxy.upload, path=path, file=file, file_options={"content-type": content_type})
+        return proxy.get_public_url(path)
+
+    async def download(self, bucket: str, path: str) -> bytes:
+        return await asyncio.to_thread(self._bucket(bucket).download, path)
+
+    async def delete(self, bucket: str, path: str):
+        await asyncio.to_thread(self._bucket(bucket).remove, [path])
+
+    async def signed_url(self, bucket: str, path: str, expires_in: int = 3600) -> str:
+        result = await asyncio.to_thread(self._bucket(bucket).create_signed_url, path, expires_in)
+        return result["signedURL"]
+
+    def path_from_url(self, bucket: str, url: str) -> str:
+        return url.split(f"/object/public/{bucket}/")[1]
+
+
+class LocalStorageBackend(StorageBackend):
+    """Files under a local directory, served by the app at STORAGE_LOCAL_BASE_URL"""
+
+    def __init__(self, root: str, base_url: str):
+        self.root = os.path.abspath(root)
+        self.base_url = base_url.rstrip("/")
+
+    def _full_path(self, bucket: str, path: str) -> str:
+        full_path = os.path.abspath(os.path.join(self.root, bucket, path))
+        if not full_path.startswith(self.root + os.sep):
+            raise ValueError(f"Invalid storage path: {path}")
+        return full_path
+
+    def _write(self, full_path: str, file: BinaryIO):
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "wb") as out:
+            shutil.copyfileobj(file, out)
+
+    async def upload(self, bucket: str, path: str, data: bytes, content_type: str) -> str:
+        return await self.upload_file(bucket, path, BytesIO(data), content_type)
+
+    async def upload_file(self, bucket: str, path: str, file: BinaryIO, content_type: str) -> str:
+        await asyncio.to_thread(self._write, self._full_path(bucket, path), file)
+        return f"{self.base_url}/{bucket}/{path}"
+
+    async def download(self, bucket: str, path: str) -> bytes:
+        def read():
+            with open(self._full_path(bucket, path), "rb") as f:
+                return f.read()
+
+        return await asyncio.to_thread(read)
+
+    async def delete(self, bucket: str, path: str):
+        try:
+            await asyncio.to_thread(os.remove, self._full_path(bucket, path))
+        except FileNotFoundError:
+            pass
+
+    async def signed_url(self, bucket: str, path: str, expires_in: int = 3600) -> str:
+        # Local files are served publicly; there is nothing to sign
+        return f"{self.base_url}/{bucket}/{path}"
+
+    def path_from_url(self, bucket: str, url: str) -> str:
+        return url.split(f"{self.base_url}/{bucket}/", 1)[1]
+
+
+class MemoryStorageBackend(StorageBackend):
+    """Keeps files in a dict; for tests and offline load runs"""
+
+    def __init__(self):
+        self.files: Dict[Tuple[str, str], Tuple[bytes, str]] = {}
+
+    async def upload(self, bucket: str, path: str, data: bytes, content_type: str) -> str:
+        self.files[(bucket, path)] = (data, content_type)
+        return f"memory://{bucket}/{path}"
+
+    async def download(self, bucket: str, path: str) -> bytes:
+        try:
+            return self.files[(bucket, path)][0]
+        except KeyError:
+            raise FileNotFoundError(f"{bucket}/{path}")
+
+    async def delete(self, bucket: str, path: str):
+        self.files.pop((bucket, path), None)
+
+    async def signed_url(self, bucket: str, path: str, expires_in: int = 3600) -> str:
+        return f"memory://{bucket}/{path}?expires={int(time.time()) + expires_in}"
+
+    def path_from_url(self, bucket: str, url: str) -> str:
+        return url.split(f"memory://{bucket}/", 1)[1]
+
+
+_backend: Optional[StorageBackend] = None
+
+
+def get_storage_backend() -> StorageBackend:
+    """Get the backend selected by settings.STORAGE_BACKEND"""
+    global _backend
+    if _backend is None:
+        name = settings.STORAGE_BACKEND
+        if name == "supabase":
+            _backend = SupabaseStorageBackend()
+        elif name == "local":
+            _backend = LocalStorageBackend(settings.STORAGE_LOCAL_PATH, settings.STORAGE_LOCAL_BASE_URL)
+        elif name == "memory":
+            _backend = MemoryStorageBackend()
+        else:
+            raise ValueError(f"Unknown STORAGE_BACKEND: {name}")
+        logger.info(f"Using {name} storage backend")
+    return _backend
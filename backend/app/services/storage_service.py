@@ -1,20 +1,31 @@
-from supabase import create_client
-from app.config import settings
 import uuid
+from typing import BinaryIO, Optional, Union
+from app.services.storage_backends import get_storage_backend
 from app.logging_config import logger
 
 
 class StorageService:
 
     BUCKET_NAME = "resumes"
+    # Private bucket: recordings are only reachable through signed URLs
+    AUDIO_BUCKET_NAME = "answer-audio"
+    AUDIO_URL_EXPIRES_SECONDS = 3600
+    AUDIO_CONTENT_TYPES = {
+        "webm": "audio/webm",
+        "wav": "audio/wav",
+        "mp3": "audio/mpeg",
+        "ogg": "audio/ogg",
+        "opus": "audio/ogg",
+        "m4a": "audio/mp4",
+    }
 
     @staticmethod
-    async def upload_resume(file: bytes, filename: str, user_id: str, user_token: str) -> str:
+    async def upload_resume(file: Union[bytes, BinaryIO], filename: str, user_id: str, user_token: str) -> str:
         """
-        Upload resume PDF to Supabase Storage
+        Upload resume PDF to the configured storage backend
 
         Args:
-            file: Binary file content (bytes)
+            file: Binary file content (bytes) or a file object to stream from
             filename: Original filename
             user_id: User ID for organizing files
             user_token: JWT token for authenticated user (not used for storage - kept for backward compatibility)
@@ -22,27 +33,18 @@ class StorageService:
         Returns:
             Public URL of uploaded file
         """
-        # Create Supabase client with service key for storage operations
-        # This allows storage to work with both Clerk and Supabase authenticated users
-        supabase = create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_KEY)
-
         file_ext = filename.split('.')[-1]
         unique_filename = f"{user_id}/{uuid.uuid4()}.{file_ext}"
 
-        supabase.storage.from_(StorageService.BUCKET_NAME).upload(
-            path=unique_filename,
-            file=file,
-            file_options={"content-type": "application/pdf"}
-        )
-
-        public_url = supabase.storage.from_(StorageService.BUCKET_NAME).get_public_url(unique_filename)
-
-        return public_url
+        backend = get_storage_backend()
+        if isinstance(file, bytes):
+            return await backend.upload(StorageService.BUCKET_NAME, unique_filename, file, "application/pdf")
+        return await backend.upload_file(StorageService.BUCKET_NAME, unique_filename, file, "application/pdf")
 
     @staticmethod
     async def delete_resume(file_url: str, user_token: str) -> bool:
         """
-        Delete resume from Supabase Storage
+        Delete resume from the configured storage backend
 
         Args:
             file_url: Public URL of the file
@@ -51,14 +53,47 @@ class StorageService:
         Returns:
             True if deleted successfully
         """
-        # Create Supabase client with service key for storage operations
-        # This allows storage to work with both Clerk and Supabase authenticated users
-        supabase = create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_KEY)
-
+        backend = get_storage_backend()
         try:
-            path = file_url.split(f"/object/public/{StorageService.BUCKET_NAME}/")[1]
-            supabase.storage.from_(StorageService.BUCKET_NAME).remove([path])
+            path = backend.path_from_url(StorageService.BUCKET_NAME, file_url)
+            await backend.delete(StorageService.BUCKET_NAME, path)
             return True
         except Exception as e:
             logger.error(f"Error deleting file: {e}")
             return False
+
+    @staticmethod
+    async def upload_audio(audio_bytes: bytes, file_name: str) -> str:
+        """
+        Archive a recorded answer
+
+        Args:
+            audio_bytes: Encoded audio
+            file_name: Path within the audio bucket, e.g. answers/12/q3_sid.webm
+
+        Returns:
+            Path of the stored file, for get_audio_url
+        """
+        file_ext = file_name.rsplit('.', 1)[-1].lower()
+        content_type = StorageService.AUDIO_CONTENT_TYPES.get(file_ext, "application/octet-stream")
+        await get_storage_backend().upload(StorageService.AUDIO_BUCKET_NAME, file_name, audio_bytes, content_type)
+        return file_name
+
+    @staticmethod
+    async def get_audio_url(audio_path: str) -> Optional[str]:
+        """
+        Signed, expiring URL for an archived answer
+
+        Args:
+            audio_path: Path returned by upload_audio
+
+        Returns:
+            Signed URL, or None if one couldn't be created
+        """
+        try:
+            return await get_storage_backend().signed_url(
+                StorageService.AUDIO_BUCKET_NAME, audio_path, StorageService.AUDIO_URL_EXPIRES_SECONDS
+            )
+        except Exception as e:
+            logger.error(f"Error signing answer audio URL: {e}")
+            return None
@@ -2,6 +2,7 @@ import stripe
 from sqlalchemy.orm import Session
 from app.config import settings
 from app.models.subscription import Subscription
+from app.services.subscription_service import invalidate_entitlement
 from app.logging_config import logger
 
 stripe.api_key = settings.STRIPE_SECRET_KEY
@@ -84,6 +85,7 @@ def handle_webhook_event(payload: bytes, sig_header: str, db: Session):
             sub.stripe_customer_id = stripe_customer_id
             sub.stripe_subscription_id = stripe_subscription_id
             db.commit()
+            invalidate_entitlement(user_id)
             logger.info(f"User {user_id} upgraded to premium")
 
     elif event_type == "customer.subscription.updated":
@@ -102,6 +104,7 @@ def handle_webhook_event(payload: bytes, sig_header: str, db: Session):
                     stripe_sub["current_period_end"], tz=timezone.utc
                 )
             db.commit()
+            invalidate_entitlement(sub.user_id)
             logger.info(f"Subscription {stripe_subscription_id} updated: {new_status}")
 
     elif event_type == "customer.subscription.deleted":
@@ -117,4 +120,5 @@ def handle_webhook_event(payload: bytes, sig_header: str, db: Session):
             sub.stripe_subscription_id = None
             sub.current_period_end = None
             db.commit()
+            invalidate_entitlement(sub.user_id)
             logger.info(f"Subscription {stripe_subscription_id} canceled — downgraded to free")
@@ -1,9 +1,105 @@
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from cachetools import TTLCache
 from app.models.subscription import Subscription
-from app.models.interview import Interview
 from app.logging_config import logger
 
+# Entitlements are cached briefly per worker; plan changes and interview
+# creation invalidate them explicitly, the TTL covers other workers. The
+# interview limit is enforced by record_interview_created, not the cache.
+ENTITLEMENT_CACHE_TTL_SECONDS = 30
+_entitlements = TTLCache(maxsize=10000, ttl=ENTITLEMENT_CACHE_TTL_SECONDS)
+
+FREE_INTERVIEW_LIMIT = 2
+
+
+class Entitlement:
+    """What a user's plan allows, resolved in a single query"""
+
+    def __init__(self, user_id: str, plan: str, status: str, interviews_used: int):
+        self.user_id = user_id
+        self.plan = plan
+        self.status = status
+        self.interviews_used = interviews_used
+
+    @property
+    def is_premium(self) -> bool:
+        return self.plan == "premium" and self.status == "active"
+
+
+def get_entitlement(user_id: str, db: Session, use_cache: bool = True) -> Entitlement:
+    """Get a user's plan, status and interview count, cached per user"""
+    entitlement = _entitlements.get(user_id) if use_cache else None
+    if entitlement is not None:
+        return entitlement
+
+    row = db.query(
+        Subscription.plan, Subscription.status, Subscription.interviews_created
+    ).filter(Subscription.user_id == user_id).first()
+
+    if row is None:
+        entitlement = Entitlement(user_id=user_id, plan="free", status="active", interviews_used=0)
+    else:
+        entitlement = Entitlement(
+            user_id=user_id,
+            plan=row.plan or "free",
+            status=row.status or "active",
+            interviews_used=row.interviews_created,
+        )
+    _entitlements[user_id] = entitlement
+    return entitlement
+
+
+def _interview_limit_error(interviews_used: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail={
+            "code": "interview_limit_reached",
+            "message": f"You've used all {FREE_INTERVIEW_LIMIT} free interviews. Upgrade to Pro for unlimited interviews.",
+            "upgrade_required": True,
+            "interviews_used": interviews_used,
+            "interviews_limit": FREE_INTERVIEW_LIMIT,
+        }
+    )
+
+
+def record_interview_created(user_id: str, db: Session):
+    """
+    Count a new interview against the user's lifetime usage
+
+    Call in the transaction that inserts the interview so the counter can't
+    drift from it. The UPDATE only matches while the user is premium or
+    under the free limit, so the limit holds across workers: concurrent
+    creations serialize on the subscription row and the one that would
+    exceed it updates nothing. Caller commits.
+
+    Raises:
+        HTTPException: 403 if the user has reached the free interview limit
+    """
+    updated = db.query(Subscription).filter(
+        Subscription.user_id == user_id,
+        or_(
+            and_(Subscription.plan == "premium", Subscription.status == "active"),
+            Subscription.interviews_created < FREE_INTERVIEW_LIMIT
+        )
+    ).update(
+        {Subscription.interviews_created: Subscription.interviews_created + 1},
+        synchronize_session=False
+    )
+    if updated:
+        return
+
+    used = db.query(Subscription.interviews_created).filter(Subscription.user_id == user_id).scalar()
+    if used is not None:
+        raise _interview_limit_error(used)
+    db.add(Subscription(user_id=user_id, plan="free", status="active", interviews_created=1))
+
+
+def invalidate_entitlement(user_id: str):
+    """Drop a cached entitlement after the plan or interview count changes"""
+    _entitlements.pop(user_id, None)
+
 
 def get_or_create_subscription(user_id: str, db: Session) -> Subscription:
     sub = db.query(Subscription).filter(Subscription.user_id == user_id).first()
@@ -25,29 +121,26 @@ def get_or_create_subscription(user_id: str, db: Session) -> Subscription:
 
 
 def is_premium(user_id: str, db: Session) -> bool:
-    sub = db.query(Subscription).filter(Subscription.user_id == user_id).first()
-    return sub is not None and sub.plan == "premium" and sub.status == "active"
+    return get_entitlement(user_id, db).is_premium
 
 
 def get_lifetime_interview_count(user_id: str, db: Session) -> int:
-    return db.query(Interview).filter(Interview.user_id == user_id).count()
+    return get_entitlement(user_id, db).interviews_used
 
 
 def check_interview_limit(user_id: str, db: Session):
-    if is_premium(user_id, db):
+    """
+    Reject a user who is already at the free interview limit
+
+    Reads the current count rather than the cached entitlement so requests
+    fail before any questions are generated; record_interview_created
+    enforces the limit atomically when the interview is saved.
+    """
+    entitlement = get_entitlement(user_id, db, use_cache=False)
+    if entitlement.is_premium:
         return
-    count = get_lifetime_interview_count(user_id, db)
-    if count >= 2:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail={
-                "code": "interview_limit_reached",
-                "message": "You've used all 2 free interviews. Upgrade to Pro for unlimited interviews.",
-                "upgrade_required": True,
-                "interviews_used": count,
-                "interviews_limit": 2,
-            }
-        )
+    if entitlement.interviews_used >= FREE_INTERVIEW_LIMIT:
+        raise _interview_limit_error(entitlement.interviews_used)
 
 
 def check_question_limit(num_questions: int, user_id: str, db: Session):
@@ -1,8 +1,10 @@
 """
 Text-to-Speech service using OpenAI API
 """
+import asyncio
 from openai import OpenAI
 from app.config import settings
+from app.services.ai_governor import get_governor, OPENAI
 
 
 class TextToSpeechService:
@@ -38,25 +40,22 @@ class TextToSpeechService:
         Returns:
             Audio data as bytes (MP3 format)
         """
-        import asyncio
-
         try:
             voice_name = self.VOICES.get(voice, voice)
 
             async def _generate():
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
-                    lambda: self.client.audio.speech.create(
-                        model=model,
-                        voice=voice_name,
-                        input=text,
-                        response_format="mp3"
-                    )
+                response = await asyncio.to_thread(
+                    self.client.audio.speech.create,
+                    model=model,
+                    voice=voice_name,
+                    input=text,
+                    response_format="mp3"
                 )
                 return response.content
 
-            audio_bytes = await asyncio.wait_for(_generate(), timeout=timeout)
+            # The timeout covers the provider call, not time queued for a slot
+            async with get_governor(OPENAI).slot():
+                audio_bytes = await asyncio.wait_for(_generate(), timeout=timeout)
             return audio_bytes
 
         except asyncio.TimeoutError:
@@ -84,14 +83,15 @@ class TextToSpeechService:
         try:
             voice_name = self.VOICES.get(voice, voice)
 
-            with self.client.audio.speech.with_streaming_response.create(
-                model=model,
-                voice=voice_name,
-                input=text,
-                response_format="mp3"
-            ) as response:
-                for chunk in response.iter_bytes(chunk_size=4096):
-                    yield chunk
+            async with get_governor(OPENAI).slot():
+                with self.client.audio.speech.with_streaming_response.create(
+                    model=model,
+                    voice=voice_name,
+                    input=text,
+                    response_format="mp3"
+                ) as response:
+                    for chunk in response.iter_bytes(chunk_size=4096):
+                        yield chunk
 
         except Exception as e:
             raise Exception(f"Error generating speech stream: {str(e)}")
@@ -0,0 +1,104 @@
+"""
+Cache of transcribed answers keyed by the recording's hash
+
+When transcription times out the UI asks the user to try again, and the
+retry resends the same recording. Caching the processed answer (transcript,
+archived audio path, duration, pause stats) by the SHA-256 of the recorded
+bytes lets a resubmission skip transcoding, upload and the Groq call.
+Entries are scoped to the interview so a cached audio path never crosses
+users, and live in Redis with an in-process fallback. Redis is connected
+on first use and every call runs in a worker thread, so neither importing
+the module nor a slow Redis blocks the event loop.
+"""
+import asyncio
+import hashlib
+import json
+import redis
+from typing import Optional, Dict, Any
+from cachetools import TTLCache
+from app.config import settings
+from app.logging_config import logger
+
+
+def audio_hash(audio_bytes: bytes) -> str:
+    return hashlib.sha256(audio_bytes).hexdigest()
+
+
+class TranscriptCache:
+    """Maps (interview, recording hash) to the processed answer"""
+
+    def __init__(self):
+        self.ttl = settings.TRANSCRIPT_CACHE_TTL_SECONDS
+        self.memory_store = TTLCache(maxsize=settings.TRANSCRIPT_CACHE_MAX_SIZE, ttl=self.ttl)
+        self.redis_client = None
+        self._redis_pending = settings.TRANSCRIPT_CACHE_USE_REDIS
+        self._redis_lock = asyncio.Lock()
+
+    @staticmethod
+    def _connect() -> redis.Redis:
+        client = redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+        )
+        client.ping()
+        return client
+
+    async def _get_redis(self) -> Optional[redis.Redis]:
+        """Connect on first use; after a failed connect the in-process cache is used alone"""
+        if self._redis_pending:
+            async with self._redis_lock:
+                if self._redis_pending:
+                    try:
+                        self.redis_client = await asyncio.to_thread(self._connect)
+                    except Exception as e:
+                        logger.warning(f"Transcript cache Redis unavailable, using in-process cache only: {e}")
+                    self._redis_pending = False
+        return self.redis_client
+
+    def _get_key(self, interview_id: int, digest: str) -> str:
+        return f"transcript:{interview_id}:{digest}"
+
+    async def get(self, interview_id: int, digest: str) -> Optional[Dict[str, Any]]:
+        """Get a cached answer, or None on a miss"""
+        key = self._get_key(interview_id, digest)
+        cached = self.memory_store.get(key)
+        if cached is not None:
+            return cached
+        redis_client = await self._get_redis()
+        if not redis_client:
+            return None
+
+        try:
+            data = await asyncio.to_thread(redis_client.get, key)
+        except Exception as e:
+            logger.warning(f"Transcript cache Redis get failed: {e}")
+            return None
+
+        if not data:
+            return None
+
+        cached = json.loads(data)
+        self.memory_store[key] = cached
+        return cached
+
+    async def set(self, interview_id: int, digest: str, answer: Dict[str, Any]):
+        """Cache a processed answer"""
+        key = self._get_key(interview_id, digest)
+        self.memory_store[key] = answer
+
+        redis_client = await self._get_redis()
+        if redis_client:
+            try:
+                await asyncio.to_thread(redis_client.setex, key, self.ttl, json.dumps(answer))
+            except Exception as e:
+                logger.warning(f"Transcript cache Redis set failed: {e}")
+
+    def clear(self):
+        """Drop every in-process entry"""
+        self.memory_store.clear()
+
+
+# Global transcript cache instance
+transcript_cache = TranscriptCache()
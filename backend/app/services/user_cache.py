@@ -0,0 +1,115 @@
+"""
+Short-lived cache of authenticated users
+
+get_current_user resolves the Clerk subject to the local user on every
+request. The cache maps the subject to a detached snapshot of the user so
+the common path needs no database round trip. Entries live in a bounded
+in-process TTL cache, optionally backed by Redis so workers share them,
+and are invalidated from the Clerk webhooks and the user migration path.
+Redis calls run in a worker thread so a slow Redis never blocks the
+event loop.
+"""
+import asyncio
+import json
+import redis
+from typing import Optional, Dict, Any
+from cachetools import TTLCache
+from app.config import settings
+from app.logging_config import logger
+
+
+class CachedUser:
+    """Detached snapshot of the user fields request handlers read"""
+
+    def __init__(self, id: str, email: str, full_name: Optional[str] = None):
+        self.id = id
+        self.email = email
+        self.full_name = full_name
+
+    @classmethod
+    def from_user(cls, user) -> "CachedUser":
+        return cls(id=user.id, email=user.email, full_name=user.full_name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"id": self.id, "email": self.email, "full_name": self.full_name}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CachedUser":
+        return cls(id=data["id"], email=data["email"], full_name=data.get("full_name"))
+
+
+class UserCache:
+    """Maps Clerk user IDs to cached user snapshots"""
+
+    def __init__(self):
+        self.ttl = settings.USER_CACHE_TTL_SECONDS
+        self.memory_store = TTLCache(maxsize=settings.USER_CACHE_MAX_SIZE, ttl=self.ttl)
+        self.redis_client = None
+
+        if settings.USER_CACHE_USE_REDIS:
+            try:
+                self.redis_client = redis.from_url(
+                    settings.REDIS_URL,
+                    decode_responses=True,
+                    socket_connect_timeout=2,
+                    socket_timeout=2,
+                )
+                self.redis_client.ping()
+            except Exception as e:
+                logger.warning(f"User cache Redis unavailable, using in-process cache only: {e}")
+                self.redis_client = None
+
+    def _get_key(self, user_id: str) -> str:
+        return f"auth_user:{user_id}"
+
+    async def get(self, user_id: str) -> Optional[CachedUser]:
+        """Get a cached user, or None on a miss"""
+        cached = self.memory_store.get(user_id)
+        if cached is not None or not self.redis_client:
+            return cached
+
+        try:
+            data = await asyncio.to_thread(self.redis_client.get, self._get_key(user_id))
+        except Exception as e:
+            logger.warning(f"User cache Redis get failed: {e}")
+            return None
+
+        if not data:
+            return None
+
+        cached = CachedUser.from_dict(json.loads(data))
+        self.memory_store[user_id] = cached
+        return cached
+
+    async def set(self, user) -> CachedUser:
+        """Cache a snapshot of a local user and return it"""
+        cached = CachedUser.from_user(user)
+        self.memory_store[cached.id] = cached
+
+        if self.redis_client:
+            try:
+                await asyncio.to_thread(
+                    self.redis_client.setex, self._get_key(cached.id), self.ttl, json.dumps(cached.to_dict())
+                )
+            except Exception as e:
+                logger.warning(f"User cache Redis set failed: {e}")
+
+        return cached
+
+    async def invalidate(self, user_id: str):
+        """Drop a user so the next request reloads it from the database"""
+        self.memory_store.pop(user_id, None)
+
+        if self.redis_client:
+            try:
+                await asyncio.to_thread(self.redis_client.delete, self._get_key(user_id))
+            except Exception as e:
+                logger.warning(f"User cache Redis delete failed: {e}")
+
+    def clear(self):
+        """Drop every in-process entry"""
+        self.memory_store.clear()
+
+
+# Global user cache instance
+user_cache = UserCache()
@@ -0,0 +1,96 @@
+"""
+Bounded file uploads
+
+UploadSizeLimitMiddleware rejects multipart requests whose body exceeds
+the upload limit, from Content-Length before anything is read or while
+the body streams in, so an oversized upload is never buffered whole.
+save_upload_to_tempfile then copies an accepted upload to disk in chunks,
+so handlers pass a file path downstream instead of the file's bytes.
+"""
+import os
+import tempfile
+from fastapi import HTTPException, UploadFile, status
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Allowance for multipart boundaries, headers and small form fields
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+def _too_large_detail(max_size: int) -> str:
+    return f"File size exceeds {max_size // (1024 * 1024)}MB limit"
+
+
+class UploadSizeLimitMiddleware:
+    """Reject multipart request bodies larger than max_upload_size"""
+
+    def __init__(self, app: ASGIApp, max_upload_size: int):
+        self.app = app
+        self.max_upload_size = max_upload_size
+        self.max_body_size = max_upload_size + MULTIPART_OVERHEAD
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        if not headers.get(b"content-type", b"").startswith(b"multipart/form-data"):
+            await self.app(scope, receive, send)
+            return
+
+        content_length = headers.get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_body_size:
+            response = JSONResponse(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                content={"detail": _too_large_detail(self.max_upload_size)}
+            )
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    # Raised inside form parsing, so the app turns it into a 413
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=_too_large_detail(self.max_upload_size)
+                    )
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+async def save_upload_to_tempfile(upload: UploadFile, max_size: int, suffix: str = "") -> str:
+    """
+    Copy an upload to a named temp file, enforcing max_size as it goes
+
+    The caller owns the returned path and must remove it.
+
+    Raises:
+        HTTPException: 413 as soon as the upload exceeds max_size
+    """
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
+    size = 0
+    try:
+        with temp_file:
+            while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_size:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=_too_large_detail(max_size)
+                    )
+                temp_file.write(chunk)
+    except BaseException:
+        os.unlink(temp_file.name)
+        raise
+
+    return temp_file.name
@@ -12,15 +12,19 @@ from sqlalchemy.exc import SQLAlchemyError
 from app.logging_config import logger
 
 from app.database import get_db, SessionLocal
-from app.models.interview import Interview
+from app.models.interview import Interview, InterviewStatus
 from app.models.question import Question
 from app.models.answer import Answer
 from app.models.resume import Resume
 from app.services.text_to_speech import text_to_speech_service
-from app.services.speech_to_text import speech_to_text_service
+from app.services.speech_to_text import speech_to_text_service, AudioTooLongError
 from app.services.storage_service import StorageService
+from app.services.audio_transcoder import measure_duration, transcode_to_opus
+from app.services.transcript_cache import transcript_cache, audio_hash
 from app.services.evaluation_service import evaluate_answer, calculate_overall_score, analyze_speaking_patterns
 from app.services.followup_service import should_ask_followup
+from app.services.ai_governor import NEAR_REAL_TIME, FAST_FAIL_ERRORS
+from app.services.analytics_service import record_interview_completed, record_interview_evaluation, question_category
 from app.websocket.session_manager import session_manager
 from app.config import settings
 from app.clerk_client import verify_clerk_token
@@ -56,10 +60,12 @@ async def precompute_followup(sid: str, question_id: int, transcript: str, quest
         if session.pending_followup:
             return
 
+        # The user is still reviewing the transcript, so this yields to live requests
         needs_followup, followup_data = await should_ask_followup(
             question_text=question_text,
             answer_transcript=transcript,
-            question_context=question_context
+            question_context=question_context,
+            priority=NEAR_REAL_TIME
         )
 
         # Re-fetch session — state may have changed while we were awaiting
@@ -375,6 +381,115 @@ async def begin_questions(sid, data):
         db.close()
 
 
+def _too_long_message() -> str:
+    return f'Your answer is too long. Please keep answers under {settings.MAX_AUDIO_DURATION // 60} minutes.'
+
+
+async def _transcribe_answer(
+    sid: str,
+    interview_id: int,
+    question_id: int,
+    audio_bytes: bytes,
+    audio_format: str
+) -> Optional[dict]:
+    """
+    Normalize, archive and transcribe a recorded answer
+
+    Returns the answer data to store in the session, or None if the
+    answer couldn't be transcribed (the client has been sent the error).
+    """
+    # Normalize to compact mono Opus; the whole recording is archived and a
+    # silence-trimmed copy is transcribed
+    transcoded = await transcode_to_opus(audio_bytes, audio_format)
+
+    # Check the length of the recording itself, before anything is stored or sent.
+    # If it can't be measured the answer is rejected rather than let through unchecked
+    duration = transcoded.duration
+    if duration is None:
+        duration = await measure_duration(audio_bytes, audio_format)
+    if duration is None:
+        logger.warning("Rejected answer whose duration could not be measured")
+        await sio.emit('error', {
+            'message': 'Could not read your recording. Please try recording again.'
+        }, room=sid)
+        return None
+    if duration > settings.MAX_AUDIO_DURATION:
+        logger.warning(f"Rejected {duration:.0f}s answer over MAX_AUDIO_DURATION")
+        await sio.emit('error', {'message': _too_long_message()}, room=sid)
+        return None
+    audio_format = transcoded.format
+
+    # Archive the audio through the configured storage backend
+    audio_path = None
+    try:
+        storage_service = StorageService()
+        file_name = f"answers/{interview_id}/q{question_id}_{sid}.{audio_format}"
+        audio_path = await storage_service.upload_audio(
+            audio_bytes=transcoded.audio,
+            file_name=file_name
+        )
+        logger.info(f"Uploaded answer audio: {audio_path}")
+    except Exception as upload_error:
+        logger.warning(f"Failed to upload answer audio: {upload_error}. Continuing without audio storage.")
+
+    with tempfile.NamedTemporaryFile(
+        delete=True,
+        suffix=f'.{audio_format}'
+    ) as temp_file:
+        temp_file.write(transcoded.transcription_audio)
+        temp_file.flush()
+
+        await sio.emit('transcribing', {
+            'message': 'Transcribing your answer...'
+        }, room=sid)
+
+        try:
+            # Long answers are split and transcribed in parallel; timeouts scale with length
+            transcription_result = await speech_to_text_service.transcribe_long_audio(
+                audio_file_path=temp_file.name,
+                language="en"
+            )
+            transcript = transcription_result['text']
+
+            if not transcript or len(transcript.strip()) < 3:
+                logger.warning(f"Empty or very short transcript: '{transcript}'")
+                await sio.emit('error', {
+                    'message': 'Could not understand your response. Please speak clearly and try again.'
+                }, room=sid)
+                return None
+
+        except Exception as stt_error:
+            error_message = str(stt_error)
+            logger.error(f"STT error: {error_message}")
+
+            # Provide specific error messages
+            if isinstance(stt_error, AudioTooLongError):
+                await sio.emit('error', {
+                    'message': _too_long_message()
+                }, room=sid)
+            elif "timeout" in error_message.lower():
+                await sio.emit('error', {
+                    'message': 'Transcription took too long. Your recording may be corrupted. Please try again.'
+                }, room=sid)
+            elif isinstance(stt_error, FAST_FAIL_ERRORS) or any(s in error_message.lower() for s in ("rate limit", "quota")):
+                await sio.emit('error', {
+                    'message': 'Service temporarily unavailable. Please try again in a moment.'
+                }, room=sid)
+            else:
+                await sio.emit('error', {
+                    'message': 'Failed to transcribe audio. Please try recording again.'
+                }, room=sid)
+            return None
+
+    return {
+        'transcript': transcript,
+        'audio_path': audio_path,
+        'format': audio_format,
+        'duration': transcription_result.get('duration'),
+        'pause_stats': transcoded.pause_stats
+    }
+
+
 @sio.event
 async def submit_answer(sid, data):
     """
@@ -436,93 +551,42 @@ async def submit_answer(sid, data):
             }, room=sid)
             return
 
-        # Upload audio to Supabase immediately to avoid memory issues
-        audio_url = None
-        try:
-            storage_service = StorageService()
-            file_name = f"answers/{session.interview_id}/q{question_id}_{sid}.{audio_format}"
-            audio_url = await storage_service.upload_audio(
-                audio_bytes=audio_bytes,
-                file_name=file_name
-            )
-            logger.info(f"Uploaded audio to Supabase: {audio_url}")
-        except Exception as upload_error:
-            logger.warning(f"Failed to upload audio to Supabase: {upload_error}. Continuing without audio storage.")
-
-        with tempfile.NamedTemporaryFile(
-            delete=True,
-            suffix=f'.{audio_format}'
-        ) as temp_file:
-            temp_file.write(audio_bytes)
-            temp_file.flush()
-
-            await sio.emit('transcribing', {
-                'message': 'Transcribing your answer...'
-            }, room=sid)
-
-            try:
-                # Increase timeout for longer recordings (up to 60 seconds)
-                transcription_result = await speech_to_text_service.transcribe_audio(
-                    audio_file_path=temp_file.name,
-                    language="en",
-                    timeout=60
-                )
-                transcript = transcription_result['text']
-
-                if not transcript or len(transcript.strip()) < 3:
-                    logger.warning(f"Empty or very short transcript: '{transcript}'")
-                    await sio.emit('error', {
-                        'message': 'Could not understand your response. Please speak clearly and try again.'
-                    }, room=sid)
-                    return
-
-            except Exception as stt_error:
-                error_message = str(stt_error)
-                logger.error(f"STT error: {error_message}")
-
-                # Provide specific error messages
-                if "timeout" in error_message.lower():
-                    await sio.emit('error', {
-                        'message': 'Transcription took too long. Your recording may be corrupted. Please try again.'
-                    }, room=sid)
-                elif "rate limit" in error_message.lower() or "quota" in error_message.lower():
-                    await sio.emit('error', {
-                        'message': 'Service temporarily unavailable. Please try again in a moment.'
-                    }, room=sid)
-                else:
-                    await sio.emit('error', {
-                        'message': 'Failed to transcribe audio. Please try recording again.'
-                    }, room=sid)
+        # Resubmissions of the same recording reuse the earlier result
+        recording_hash = audio_hash(audio_bytes)
+        answer_data = await transcript_cache.get(session.interview_id, recording_hash)
+        if answer_data:
+            logger.info(f"Reusing cached transcript for question {question_id}")
+        else:
+            answer_data = await _transcribe_answer(sid, session.interview_id, question_id, audio_bytes, audio_format)
+            if answer_data is None:
                 return
+            await transcript_cache.set(session.interview_id, recording_hash, answer_data)
 
-            await sio.emit('transcript_ready', {
-                'question_id': question_id,
-                'transcript': transcript,
-                'duration': transcription_result.get('duration')
-            }, room=sid)
+        transcript = answer_data['transcript']
 
-            # Pre-compute follow-up analysis in background while user reviews transcript.
-            # By the time they confirm, the result is likely ready — eliminating the wait.
-            precompute_session = session_manager.get_session(sid)
-            if (precompute_session
-                    and not precompute_session.pending_followup
-                    and precompute_session.followup_counts.get(question_id, 0) < 1
-                    and precompute_session.current_question_text):
-                asyncio.create_task(precompute_followup(
-                    sid=sid,
-                    question_id=question_id,
-                    transcript=transcript,
-                    question_text=precompute_session.current_question_text,
-                    question_context=precompute_session.current_question_context,
-                ))
-
-            # Store only transcript and audio URL (not the base64 data)
-            session_manager.add_answer(sid, question_id, {
-                'transcript': transcript,
-                'audio_url': audio_url,
-                'format': audio_format,
-                'duration': transcription_result.get('duration')
-            })
+        await sio.emit('transcript_ready', {
+            'question_id': question_id,
+            'transcript': transcript,
+            'duration': answer_data['duration']
+        }, room=sid)
+
+        # Pre-compute follow-up analysis in background while user reviews transcript.
+        # By the time they confirm, the result is likely ready — eliminating the wait.
+        precompute_session = session_manager.get_session(sid)
+        if (precompute_session
+                and not precompute_session.pending_followup
+                and precompute_session.followup_counts.get(question_id, 0) < 1
+                and precompute_session.current_question_text):
+            asyncio.create_task(precompute_followup(
+                sid=sid,
+                question_id=question_id,
+                transcript=transcript,
+                question_text=precompute_session.current_question_text,
+                question_context=precompute_session.current_question_context,
+            ))
+
+        # Store only transcript and audio path (not the base64 data)
+        session_manager.add_answer(sid, question_id, answer_data)
 
     except ValueError as ve:
         logger.error(f"Invalid input for answer submission: {ve}")
@@ -598,6 +662,8 @@ async def confirm_answer(sid, data):
                     question_id=question_id,
                     transcript=transcript,
                     audio_duration_seconds=answer_data.get('duration'),
+                    audio_path=answer_data.get('audio_path'),
+                    pause_stats=answer_data.get('pause_stats'),
                     score=None,
                     evaluation=None
                 )
@@ -608,6 +674,8 @@ async def confirm_answer(sid, data):
                 question_id=question_id,
                 transcript=transcript,
                 audio_duration_seconds=answer_data.get('duration'),
+                audio_path=answer_data.get('audio_path'),
+                pause_stats=answer_data.get('pause_stats'),
                 score=None,
                 evaluation=None
             )
@@ -742,6 +810,8 @@ async def evaluate_interview_async(interview_id: int, db: Session):
         logger.info(f"[EVALUATION] Found {total_questions} questions to evaluate")
 
         evaluations = []
+        score_changes = []
+        previous_overall_score = interview.overall_score
 
         for idx, question in enumerate(questions, 1):
             question_start = time.time()
@@ -764,12 +834,15 @@ async def evaluate_interview_async(interview_id: int, db: Session):
             # Analyze speaking patterns
             speaking_analysis = analyze_speaking_patterns(
                 transcript=answer.transcript,
-                audio_duration_seconds=answer.audio_duration_seconds
+                audio_duration_seconds=answer.audio_duration_seconds,
+                pause_stats=answer.pause_stats
             )
             evaluation['speaking_analysis'] = speaking_analysis
 
+            previous_score = answer.score
             answer.evaluation = evaluation
             answer.score = evaluation.get('score', 0)
+            score_changes.append((question_category(question), previous_score, answer.score))
             evaluations.append(evaluation)
 
             elapsed = time.time() - question_start
@@ -779,6 +852,8 @@ async def evaluate_interview_async(interview_id: int, db: Session):
         overall_score = await calculate_overall_score(evaluations)
         interview.overall_score = overall_score
 
+        record_interview_evaluation(db, interview, previous_overall_score, score_changes)
+
         db.commit()
 
         total_elapsed = time.time() - start_time
@@ -802,8 +877,12 @@ async def complete_interview(sid, session, db: Session):
 
         if interview:
             from datetime import datetime, timezone
+            newly_completed = interview.status != InterviewStatus.COMPLETED
             interview.status = "completed"
             interview.completed_at = datetime.now(timezone.utc)
+            if newly_completed:
+                question_count = db.query(Question).filter(Question.interview_id == interview.id).count()
+                record_interview_completed(db, interview, question_count)
             db.commit()
 
         session_manager.complete_session(sid)
@@ -15,6 +15,7 @@ os.environ["DATABASE_URL"] = "sqlite:///:memory:"
 
 from app.main import app
 from app.database import Base, get_db
+from app.dependencies import get_current_user, AuthenticatedUser
 
 
 # Create in-memory SQLite database for testing
@@ -39,6 +40,12 @@ def db_session():
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture
+def session_factory(db_session):
+    """Session factory for code that opens its own sessions, like background jobs"""
+    return TestingSessionLocal
+
+
 @pytest.fixture(scope="function")
 def client(db_session):
     """Create a test client with database override"""
@@ -54,6 +61,25 @@ def client(db_session):
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def test_user(db_session):
+    """Local user row for authenticated endpoint tests"""
+    from app.models.user import User
+
+    user = User(id="user_test123", email="test@example.com", full_name="Test User")
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+@pytest.fixture
+def auth_client(client, test_user):
+    """Test client with authentication resolved to test_user"""
+    app.dependency_overrides[get_current_user] = lambda: AuthenticatedUser(test_user, "test-token")
+    yield client
+    app.dependency_overrides.pop(get_current_user, None)
+
+
 @pytest.fixture
 def mock_supabase():
     """Mock Supabase client"""
@@ -86,6 +112,15 @@ def mock_supabase():
         yield supabase_mock
 
 
+@pytest.fixture(autouse=True)
+def reset_ai_governors():
+    """Give each test fresh provider limits and closed circuit breakers"""
+    from app.services import ai_governor
+    ai_governor._governors.clear()
+    yield
+    ai_governor._governors.clear()
+
+
 @pytest.fixture
 def mock_gemini():
     """Mock Gemini AI service"""
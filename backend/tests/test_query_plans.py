@@ -0,0 +1,82 @@
+"""
+Query-plan regression tests for the hot query shapes
+
+Each statement mirrors a query issued on a hot path and is run through
+EXPLAIN QUERY PLAN against the test schema (built from the model metadata,
+so it carries the same indexes as the migrations). A plan that scans a table
+or sorts in a temp b-tree means an index stopped matching the access pattern.
+"""
+import pytest
+from sqlalchemy import select, func, text
+
+from app.models.interview import Interview, InterviewStatus
+from app.models.question import Question
+from app.models.answer import Answer
+from app.models.resume import Resume
+from app.models.analytics import UserAnalytics
+
+USER_ID = "user_test123"
+
+HOT_QUERIES = {
+    "interviews_by_user_status_ordered": (
+        select(Interview.id, Interview.overall_score)
+        .where(Interview.user_id == USER_ID, Interview.status == InterviewStatus.COMPLETED)
+        .order_by(Interview.created_at)
+    ),
+    "interview_list_page": (
+        select(Interview.id, Interview.status, Interview.created_at)
+        .where(Interview.user_id == USER_ID, Interview.id < 1000)
+        .order_by(Interview.id.desc())
+        .limit(51)
+    ),
+    "resume_list_page": (
+        select(Resume.id, Resume.file_url)
+        .where(Resume.user_id == USER_ID)
+        .order_by(Resume.id.desc())
+        .limit(51)
+    ),
+    "resume_parse_cache_lookup": (
+        select(Resume.parsed_data)
+        .where(Resume.user_id == USER_ID, Resume.content_hash == "0" * 64)
+        .order_by(Resume.id.desc())
+        .limit(1)
+    ),
+    "questions_by_interview_ordered": (
+        select(Question)
+        .where(Question.interview_id == 1)
+        .order_by(Question.order_number)
+    ),
+    "next_question_lookup": (
+        select(Question)
+        .where(Question.interview_id == 1, Question.order_number == 3)
+    ),
+    "answer_by_question": (
+        select(Answer).where(Answer.question_id == 1)
+    ),
+    "questions_practiced_count": (
+        select(func.count(Question.id))
+        .join(Interview, Interview.id == Question.interview_id)
+        .where(Interview.user_id == USER_ID, Interview.status == InterviewStatus.COMPLETED)
+    ),
+    "analytics_rollup_row": (
+        select(UserAnalytics).where(UserAnalytics.user_id == USER_ID)
+    ),
+}
+
+
+def _query_plan(db_session, statement) -> list:
+    sql = statement.compile(dialect=db_session.get_bind().dialect, compile_kwargs={"literal_binds": True})
+    rows = db_session.execute(text(f"EXPLAIN QUERY PLAN {sql}")).fetchall()
+    return [row[-1] for row in rows]
+
+
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+def test_hot_query_uses_index(db_session, name):
+    """Hot queries must be served by an index search, never a scan or sort"""
+    plan = _query_plan(db_session, HOT_QUERIES[name])
+
+    scans = [step for step in plan if step.startswith("SCAN") and "CONSTANT ROW" not in step]
+    sorts = [step for step in plan if "TEMP B-TREE" in step]
+
+    assert not scans, f"{name} falls back to a scan: {plan}"
+    assert not sorts, f"{name} sorts without an index: {plan}"
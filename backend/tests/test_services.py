@@ -4,6 +4,8 @@ Unit tests for service layer functions
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 import json
+import os
+import time
 
 
 class TestGeminiService:
@@ -167,22 +169,298 @@ class TestEvaluationService:
         assert result == 0.0
 
 
+class TestAnalyticsService:
+    """Tests for the per-user analytics rollup"""
+
+    def _completed_interview(self, db_session, user_id, scores, question_type="technical"):
+        from app.models.resume import Resume
+        from app.models.interview import Interview, InterviewStatus
+        from app.models.question import Question
+        from app.models.answer import Answer
+
+        resume = Resume(user_id=user_id, file_url="https://example.com/r.pdf", parsed_data={})
+        db_session.add(resume)
+        db_session.flush()
+        interview = Interview(user_id=user_id, resume_id=resume.id, status=InterviewStatus.COMPLETED)
+        db_session.add(interview)
+        db_session.flush()
+        answers = []
+        for n, score in enumerate(scores):
+            question = Question(
+                interview_id=interview.id,
+                question_text=f"Q{n}",
+                question_context={"question_type": question_type},
+                question_type=question_type,
+                order_number=n
+            )
+            db_session.add(question)
+            db_session.flush()
+            answer = Answer(question_id=question.id, transcript="answer", score=score)
+            db_session.add(answer)
+            answers.append(answer)
+        db_session.commit()
+        return interview, answers
+
+    def test_rebuild_seeds_from_history(self, db_session, test_user):
+        """Test that the first read seeds the rollup from existing interviews"""
+        from app.services.analytics_service import get_user_analytics
+        from app.models.analytics import UserCategoryStats
+
+        interview, _ = self._completed_interview(db_session, test_user.id, [6, 8])
+        interview.overall_score = 7.0
+        db_session.commit()
+
+        rollup = get_user_analytics(test_user.id, db_session)
+
+        assert rollup.interviews_completed == 1
+        assert rollup.questions_practiced == 2
+        assert rollup.scored_interviews == 1
+        assert rollup.score_sum == 7.0
+        stats = db_session.query(UserCategoryStats).filter_by(user_id=test_user.id).one()
+        assert (stats.category, stats.score_sum, stats.answer_count) == ("technical", 14.0, 2)
+
+    def test_record_evaluation_is_incremental(self, db_session, test_user):
+        """Test that evaluations and re-evaluations update the rollup by delta"""
+        from app.services.analytics_service import (
+            get_user_analytics, record_interview_completed, record_interview_evaluation
+        )
+        from app.models.analytics import UserCategoryStats
+
+        get_user_analytics(test_user.id, db_session)
+        interview, answers = self._completed_interview(db_session, test_user.id, [None, None])
+        record_interview_completed(db_session, interview, 2)
+        db_session.commit()
+
+        for answer in answers:
+            answer.score = 5
+        interview.overall_score = 5.0
+        record_interview_evaluation(db_session, interview, None, [("technical", None, 5), ("technical", None, 5)])
+        db_session.commit()
+
+        # Re-evaluation only applies the score deltas
+        interview.overall_score = 7.0
+        record_interview_evaluation(db_session, interview, 5.0, [("technical", 5, 7), ("technical", 5, 7)])
+        db_session.commit()
+
+        rollup = get_user_analytics(test_user.id, db_session)
+        assert rollup.interviews_completed == 1
+        assert rollup.questions_practiced == 2
+        assert rollup.scored_interviews == 1
+        assert rollup.score_sum == 7.0
+        assert [e["score"] for e in rollup.recent_scores] == [7.0]
+        stats = db_session.query(UserCategoryStats).filter_by(user_id=test_user.id).one()
+        assert (stats.score_sum, stats.answer_count) == (14.0, 2)
+
+    def test_completion_counted_without_evaluation(self, db_session, test_user):
+        """Test that a completed interview is counted even if its evaluation never commits"""
+        from app.services.analytics_service import get_user_analytics, record_interview_completed
+
+        get_user_analytics(test_user.id, db_session)
+        interview, _ = self._completed_interview(db_session, test_user.id, [None, None, None])
+        record_interview_completed(db_session, interview, 3)
+        db_session.commit()
+
+        rollup = get_user_analytics(test_user.id, db_session)
+        assert rollup.interviews_completed == 1
+        assert rollup.questions_practiced == 3
+        assert rollup.scored_interviews == 0
+
+    def test_concurrent_seed_uses_existing_rollup(self, db_session, test_user):
+        """Test that losing the race to seed the rollup re-reads the winner's row"""
+        from sqlalchemy.exc import IntegrityError
+        from app.services.analytics_service import get_user_analytics
+        from app.models.analytics import UserAnalytics
+
+        def seeded_concurrently(user_id, db):
+            db.add(UserAnalytics(user_id=user_id, interviews_completed=4))
+            db.commit()
+            raise IntegrityError("INSERT INTO user_analytics", {}, Exception("duplicate key"))
+
+        with patch("app.services.analytics_service.rebuild_user_analytics", side_effect=seeded_concurrently):
+            rollup = get_user_analytics(test_user.id, db_session)
+
+        assert rollup.interviews_completed == 4
+
+
+class TestQuestionModel:
+    """Tests for question metadata normalization"""
+
+    def test_values_from_generated_promotes_metadata(self):
+        """Test that generated question metadata is copied into columns"""
+        from app.models.question import Question
+
+        values = Question.values_from_generated(0, {
+            "question_text": "Explain indexing",
+            "question_type": "technical_concept",
+            "category": "Databases",
+            "difficulty": "hard",
+            "skill_tags": ["sql", "sql", "postgres", ""],
+        })
+
+        assert (values["question_type"], values["category"], values["difficulty"]) == ("technical_concept", "Databases", "hard")
+        assert values["skill_tags"] == ["sql", "postgres"]
+
+    def test_values_from_generated_ignores_malformed_skill_tags(self):
+        """Test that skill tags other than a list of strings are dropped"""
+        from app.models.question import Question
+
+        as_string = Question.values_from_generated(0, {"question_text": "Q", "skill_tags": "sql"})
+        mixed = Question.values_from_generated(1, {"question_text": "Q", "skill_tags": ["sql", {"name": "x"}, ["y"], 3]})
+
+        assert as_string["skill_tags"] == []
+        assert mixed["skill_tags"] == ["sql"]
+
+    def test_values_from_generated_plain_text(self):
+        """Test that plain-text questions get a minimal context"""
+        from app.models.question import Question
+
+        values = Question.values_from_generated(2, "Tell me about yourself")
+
+        assert values["question_context"] == {"question_text": "Tell me about yourself"}
+        assert values["question_type"] is None
+        assert values["skill_tags"] == []
+
+    def test_values_from_generated_requires_text(self):
+        """Test that questions without text are rejected"""
+        from app.models.question import Question
+
+        with pytest.raises(ValueError):
+            Question.values_from_generated(0, {"question_type": "behavioral"})
+
+    def test_insert_generated_questions_is_bulk(self, db_session, test_user):
+        """Test that questions are saved with one INSERT regardless of count"""
+        from sqlalchemy import event
+        from app.models.resume import Resume
+        from app.models.interview import Interview
+        from app.models.question import Question, QuestionSkillTag
+        from app.routers.interviews import insert_generated_questions
+
+        resume = Resume(user_id=test_user.id, file_url="https://example.com/r.pdf", parsed_data={})
+        db_session.add(resume)
+        db_session.flush()
+        interview = Interview(user_id=test_user.id, resume_id=resume.id)
+        db_session.add(interview)
+        db_session.flush()
+
+        questions = [
+            {"question_text": f"Q{n}", "question_type": "behavioral", "skill_tags": ["communication", f"skill{n}"]}
+            for n in range(8)
+        ]
+
+        statements = []
+        engine = db_session.get_bind()
+        listener = lambda conn, cursor, stmt, params, ctx, many: statements.append(stmt)
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            question_ids = insert_generated_questions(db_session, interview.id, questions)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+        db_session.commit()
+
+        assert len(statements) == 2  # questions INSERT ... RETURNING, skill tags executemany
+        saved = db_session.query(Question).filter_by(interview_id=interview.id).order_by(Question.order_number).all()
+        assert [q.id for q in saved] == question_ids
+        assert [q.question_text for q in saved] == [f"Q{n}" for n in range(8)]
+        assert db_session.query(QuestionSkillTag).filter_by(skill="communication").count() == 8
+
+
 class TestPDFParser:
     """Tests for PDF parsing service"""
 
+    @staticmethod
+    def _make_pdf(pages: list) -> bytes:
+        """Build a minimal PDF with one line of Helvetica text per page"""
+        n = len(pages)
+        font_ref = 3 + 2 * n
+        objects = [
+            "<< /Type /Catalog /Pages 2 0 R >>",
+            f"<< /Type /Pages /Kids [{' '.join(f'{3 + 2 * i} 0 R' for i in range(n))}] /Count {n} >>",
+        ]
+        for i, text in enumerate(pages):
+            stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+            objects.append(
+                f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {4 + 2 * i} 0 R "
+                f"/Resources << /Font << /F1 {font_ref} 0 R >> >> >>"
+            )
+            objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+        pdf = b"%PDF-1.4\n"
+        offsets = []
+        for i, obj in enumerate(objects):
+            offsets.append(len(pdf))
+            pdf += f"{i + 1} 0 obj\n{obj}\nendobj\n".encode()
+        xref = len(pdf)
+        pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+        pdf += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+        pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+        return pdf
+
     def test_extract_text_from_pdf_success(self):
         """Test successful PDF text extraction"""
         from app.services.pdf_parser import extract_text_from_pdf
         from io import BytesIO
 
-        # Create a simple test PDF (would need actual PDF bytes in real test)
-        # For now, we'll skip this as it requires actual PDF generation
-        pytest.skip("Requires actual PDF file for testing")
+        text = extract_text_from_pdf(BytesIO(self._make_pdf(["Jane Doe", "Python Engineer"])))
+
+        assert text == "Jane Doe\nPython Engineer"
 
     def test_extract_text_handles_empty_pdf(self):
         """Test handling of empty PDF files"""
-        # Would test with an empty PDF
-        pytest.skip("Requires actual PDF file for testing")
+        from app.services.pdf_parser import extract_text_from_pdf
+        from io import BytesIO
+
+        with pytest.raises(Exception, match="empty"):
+            extract_text_from_pdf(BytesIO(self._make_pdf([])))
+
+    def test_extract_text_caps_pages(self):
+        """Test that pages past MAX_PDF_PAGES are not parsed"""
+        from app.services import pdf_parser
+        from io import BytesIO
+
+        with patch.object(pdf_parser, "MAX_PDF_PAGES", 2):
+            text = pdf_parser.extract_text_from_pdf(BytesIO(self._make_pdf(["one", "two", "three"])))
+
+        assert text == "one\ntwo"
+
+    @pytest.mark.asyncio
+    async def test_extract_text_async_runs_in_worker_process(self):
+        """Test extraction in a worker process"""
+        from app.services.pdf_parser import extract_text_from_pdf_async
+
+        text = await extract_text_from_pdf_async(self._make_pdf(["Jane Doe"]))
+
+        assert text == "Jane Doe"
+
+    @pytest.mark.asyncio
+    async def test_extract_text_async_timeout_kills_only_its_job(self):
+        """Test that a hung parse times out without failing a concurrent one"""
+        import asyncio
+        from app.services import pdf_parser
+
+        with patch.object(pdf_parser, "_extraction_worker", _hang_on_marker), \
+             patch.object(pdf_parser, "PDF_EXTRACTION_TIMEOUT_SECONDS", 10):
+            hung, parsed = await asyncio.gather(
+                pdf_parser.extract_text_from_pdf_async(b"hang"),
+                pdf_parser.extract_text_from_pdf_async(self._make_pdf(["Jane Doe"])),
+                return_exceptions=True
+            )
+
+        assert "timed out" in str(hung)
+        assert parsed == "Jane Doe"
+
+
+def _hang_on_marker(source, conn):
+    """Stand-in for pdf_parser._extraction_worker that hangs on the marker input
+
+    Module-level so a spawned worker process can import it.
+    """
+    import time
+    from app.services.pdf_parser import _extraction_worker
+
+    if source == b"hang":
+        time.sleep(60)
+    _extraction_worker(source, conn)
 
 
 class TestRetryLogic:
@@ -217,3 +495,868 @@ class TestRetryLogic:
 
         # Should have tried 3 times (initial + 2 retries)
         assert mock_gemini.generate_content.call_count == 3
+
+
+class TestClerkClient:
+    """Tests for Clerk token verification"""
+
+    @pytest.fixture
+    def signed_token(self):
+        """A freshly signed RS256 token plus the JWKS that verifies it"""
+        import time
+        import jwt
+        from cryptography.hazmat.primitives.asymmetric import rsa
+        from jwt.algorithms import RSAAlgorithm
+        from app import clerk_client
+
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+        jwk["kid"] = "test-kid"
+        token = jwt.encode(
+            {"sub": "user_test123", "exp": int(time.time()) + 300},
+            private_key,
+            algorithm="RS256",
+            headers={"kid": "test-kid"},
+        )
+
+        clerk_client._verified_tokens.clear()
+        clerk_client._signing_keys.clear()
+        with patch.object(clerk_client.settings, "CLERK_SECRET_KEY", "sk_test"), \
+             patch("app.clerk_client.get_jwks", AsyncMock(return_value={"keys": [jwk]})):
+            yield token
+        clerk_client._verified_tokens.clear()
+        clerk_client._signing_keys.clear()
+
+    @pytest.mark.asyncio
+    async def test_verified_token_is_cached(self, signed_token):
+        """Test that a reused token is only verified once"""
+        import jwt
+        from app.clerk_client import verify_clerk_token
+
+        with patch("app.clerk_client.jwt.decode", wraps=jwt.decode) as decode, \
+             patch("app.clerk_client.RSAAlgorithm.from_jwk", wraps=jwt.algorithms.RSAAlgorithm.from_jwk) as from_jwk:
+            first = await verify_clerk_token(signed_token)
+            second = await verify_clerk_token(signed_token)
+
+        assert first["sub"] == second["sub"] == "user_test123"
+        assert decode.call_count == 1
+        assert from_jwk.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_token_expires_with_exp(self, signed_token):
+        """Test that cached payloads are dropped once the token expires"""
+        from app import clerk_client
+
+        payload = await clerk_client.verify_clerk_token(signed_token)
+        cache = clerk_client._verified_tokens
+        cache_key = clerk_client._token_cache_key(signed_token)
+
+        cache.expire(payload["exp"])
+        assert cache_key in cache
+
+        cache.expire(payload["exp"] + clerk_client._TOKEN_LEEWAY)
+        assert cache_key not in cache
+
+    @pytest.fixture
+    def jwks_endpoint(self):
+        """Stub the pooled Clerk client with a slow JWKS endpoint"""
+        import asyncio
+        from app import clerk_client
+
+        async def slow_get(url, **kwargs):
+            await asyncio.sleep(0.01)
+            return Mock(status_code=200, json=Mock(return_value={"keys": []}))
+
+        client = Mock(get=AsyncMock(side_effect=slow_get))
+        with patch("app.clerk_client.get_http_client", return_value=client), \
+             patch.object(clerk_client, "_jwks_cache", None), \
+             patch.object(clerk_client, "_jwks_cache_time", 0.0), \
+             patch.object(clerk_client, "_jwks_refresh_task", None):
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_concurrent_jwks_misses_fetch_once(self, jwks_endpoint):
+        """Test that concurrent cold-cache callers share a single JWKS fetch"""
+        import asyncio
+        from app.clerk_client import get_jwks
+
+        results = await asyncio.gather(*(get_jwks() for _ in range(5)))
+
+        assert all(r == {"keys": []} for r in results)
+        assert jwks_endpoint.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_jwks_refreshes_in_background_before_expiry(self, jwks_endpoint):
+        """Test that a nearly expired JWKS is served while a refresh runs"""
+        import time
+        from app import clerk_client
+
+        stale = {"keys": [{"kid": "old"}]}
+        clerk_client._jwks_cache = stale
+        clerk_client._jwks_cache_time = time.monotonic() - clerk_client._JWKS_REFRESH_AFTER - 1
+
+        assert await clerk_client.get_jwks() is stale
+        await clerk_client._jwks_refresh_task
+
+        assert jwks_endpoint.get.await_count == 1
+        assert await clerk_client.get_jwks() == {"keys": []}
+
+
+class TestUserCache:
+    """Tests for the authenticated user cache"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        from app.services.user_cache import user_cache
+        user_cache.clear()
+        yield
+        user_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_cached_user_skips_database(self, db_session, test_user):
+        """Test that a repeat request for the same user does no database work"""
+        from fastapi.security import HTTPAuthorizationCredentials
+        from app import dependencies
+
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="token")
+        db = Mock(wraps=db_session)
+
+        with patch.object(dependencies.settings, "CLERK_SECRET_KEY", "sk_test"), \
+             patch("app.dependencies.verify_clerk_token", AsyncMock(return_value={"sub": test_user.id})):
+            first = await dependencies.get_current_user(credentials, db)
+            second = await dependencies.get_current_user(credentials, db)
+
+        assert first.id == second.id == test_user.id
+        assert second.email == test_user.email
+        assert db.query.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_user(self, test_user):
+        """Test that invalidation forces the next lookup to miss"""
+        from app.services.user_cache import user_cache
+
+        await user_cache.set(test_user)
+        assert (await user_cache.get(test_user.id)).email == test_user.email
+
+        await user_cache.invalidate(test_user.id)
+        assert await user_cache.get(test_user.id) is None
+
+
+class TestTranscriptCache:
+    """Tests for the transcript cache"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        from app.services.transcript_cache import transcript_cache
+        transcript_cache.clear()
+        yield
+        transcript_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_resubmitted_recording_skips_transcription(self):
+        """Test that resending the same recording reuses the first transcript"""
+        import base64
+        from app.websocket import interview_handler
+        from app.websocket.session_manager import InterviewSession
+
+        answer = {"transcript": "I led the migration", "audio_path": None, "format": "ogg", "duration": 4.2, "pause_stats": None}
+        data = {"question_id": 3, "audio_data": base64.b64encode(b"\x1aE" * 100).decode(), "format": "webm"}
+
+        with patch.object(interview_handler.session_manager, "get_session", return_value=InterviewSession(7, "user_1")), \
+             patch.object(interview_handler.session_manager, "add_answer") as add_answer, \
+             patch.object(interview_handler.sio, "emit", AsyncMock()) as emit, \
+             patch("app.websocket.interview_handler._transcribe_answer", AsyncMock(return_value=answer)) as transcribe:
+            await interview_handler.submit_answer("sid", data)
+            await interview_handler.submit_answer("sid", data)
+
+        transcribe.assert_awaited_once()
+        assert add_answer.call_count == 2
+        assert add_answer.call_args.args == ("sid", 3, answer)
+        assert emit.await_args.args[1]["transcript"] == "I led the migration"
+
+    @pytest.mark.asyncio
+    async def test_entries_are_scoped_to_interview(self):
+        """Test that the same recording in another interview misses"""
+        from app.services.transcript_cache import transcript_cache, audio_hash
+
+        digest = audio_hash(b"recording")
+        await transcript_cache.set(1, digest, {"transcript": "hello"})
+
+        assert await transcript_cache.get(1, digest) == {"transcript": "hello"}
+        assert await transcript_cache.get(2, digest) is None
+
+    @pytest.mark.asyncio
+    async def test_redis_connects_on_first_use(self):
+        """Test that creating the cache doesn't touch Redis and a failed connect is tried once"""
+        from app.services.transcript_cache import TranscriptCache
+
+        with patch("app.services.transcript_cache.settings.TRANSCRIPT_CACHE_USE_REDIS", True), \
+             patch("app.services.transcript_cache.redis.from_url", side_effect=ConnectionError("down")) as from_url:
+            cache = TranscriptCache()
+            from_url.assert_not_called()
+
+            await cache.set(1, "abc", {"transcript": "hello"})
+            assert await cache.get(1, "def") is None
+
+        from_url.assert_called_once()
+        assert await cache.get(1, "abc") == {"transcript": "hello"}
+
+
+class TestSubscriptionService:
+    """Tests for plan entitlements"""
+
+    @pytest.fixture(autouse=True)
+    def clear_entitlements(self):
+        from app.services import subscription_service
+        subscription_service._entitlements.clear()
+        yield
+        subscription_service._entitlements.clear()
+
+    def test_plan_checks_share_one_query(self, db_session, test_user):
+        """Test that all plan checks in a request resolve the entitlement once"""
+        from sqlalchemy import event
+        from app.models.subscription import Subscription
+        from app.services.subscription_service import (
+            check_interview_limit, check_question_limit, check_premium_feature
+        )
+
+        db_session.add(Subscription(user_id=test_user.id, plan="premium", status="active"))
+        db_session.commit()
+        db_session.refresh(test_user)
+
+        statements = []
+        engine = db_session.get_bind()
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            check_interview_limit(test_user.id, db_session)
+            check_question_limit(10, test_user.id, db_session)
+            check_premium_feature(test_user.id, db_session, "company_prep")
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert len(statements) == 1
+
+    def test_invalidate_entitlement_reloads_plan(self, db_session, test_user):
+        """Test that an invalidated entitlement picks up plan changes"""
+        from app.models.subscription import Subscription
+        from app.services.subscription_service import get_entitlement, invalidate_entitlement
+
+        assert get_entitlement(test_user.id, db_session).plan == "free"
+
+        db_session.add(Subscription(user_id=test_user.id, plan="premium", status="active"))
+        db_session.commit()
+        assert not get_entitlement(test_user.id, db_session).is_premium
+
+        invalidate_entitlement(test_user.id)
+        assert get_entitlement(test_user.id, db_session).is_premium
+
+    def test_record_interview_created_maintains_counter(self, db_session, test_user):
+        """Test that interview creation bumps the lifetime counter the limit reads"""
+        from fastapi import HTTPException
+        from app.models.subscription import Subscription
+        from app.services.subscription_service import (
+            record_interview_created, check_interview_limit, invalidate_entitlement
+        )
+
+        record_interview_created(test_user.id, db_session)
+        db_session.commit()
+        sub = db_session.query(Subscription).filter_by(user_id=test_user.id).one()
+        assert sub.plan == "free"
+        assert sub.interviews_created == 1
+
+        check_interview_limit(test_user.id, db_session)
+
+        record_interview_created(test_user.id, db_session)
+        db_session.commit()
+        invalidate_entitlement(test_user.id)
+
+        with pytest.raises(HTTPException) as exc_info:
+            check_interview_limit(test_user.id, db_session)
+        assert exc_info.value.detail["interviews_used"] == 2
+
+    def test_record_interview_created_enforces_limit(self, db_session, test_user):
+        """Test that the counter refuses to pass the free limit even with a stale cache"""
+        from fastapi import HTTPException
+        from app.models.subscription import Subscription
+        from app.services.subscription_service import get_entitlement, record_interview_created
+
+        db_session.add(Subscription(user_id=test_user.id, plan="free", status="active", interviews_created=1))
+        db_session.commit()
+        assert get_entitlement(test_user.id, db_session).interviews_used == 1
+
+        # Another worker created the second interview; this worker's cache is stale
+        db_session.query(Subscription).filter_by(user_id=test_user.id).update({"interviews_created": 2})
+        db_session.commit()
+
+        with pytest.raises(HTTPException) as exc_info:
+            record_interview_created(test_user.id, db_session)
+        assert exc_info.value.status_code == 403
+        assert db_session.query(Subscription.interviews_created).filter_by(user_id=test_user.id).scalar() == 2
+
+    def test_record_interview_created_unlimited_for_premium(self, db_session, test_user):
+        """Test that premium users are counted past the free limit"""
+        from app.models.subscription import Subscription
+        from app.services.subscription_service import record_interview_created
+
+        db_session.add(Subscription(user_id=test_user.id, plan="premium", status="active", interviews_created=5))
+        db_session.commit()
+
+        record_interview_created(test_user.id, db_session)
+        db_session.commit()
+        assert db_session.query(Subscription.interviews_created).filter_by(user_id=test_user.id).scalar() == 6
+
+
+class TestStorageService:
+    """Tests for file storage"""
+
+    @pytest.fixture
+    def backend(self):
+        """Route StorageService to an in-memory backend"""
+        from app.services.storage_backends import MemoryStorageBackend
+
+        backend = MemoryStorageBackend()
+        with patch("app.services.storage_service.get_storage_backend", return_value=backend):
+            yield backend
+
+    @pytest.mark.asyncio
+    async def test_storage_client_is_reused(self):
+        """Test that Supabase uploads and deletes share one client"""
+        from app.services import storage_backends
+        from app.services.storage_backends import SupabaseStorageBackend
+
+        supabase = Mock()
+        bucket = supabase.storage.from_.return_value
+        bucket.get_public_url.return_value = "https://x.supabase.co/storage/v1/object/public/resumes/u/f.pdf"
+        backend = SupabaseStorageBackend()
+
+        with patch.object(storage_backends, "_storage_client", None), \
+             patch("app.services.storage_backends.create_client", return_value=supabase) as create_client:
+            url = await backend.upload("resumes", "u/f.pdf", b"%PDF", "application/pdf")
+            await backend.upload("resumes", "u/g.pdf", b"%PDF", "application/pdf")
+            await backend.delete("resumes", backend.path_from_url("resumes", url))
+
+        create_client.assert_called_once()
+        assert bucket.upload.call_count == 2
+        bucket.remove.assert_called_once_with(["u/f.pdf"])
+
+    @pytest.mark.asyncio
+    async def test_resume_round_trip(self, backend):
+        """Test uploading and deleting a resume through the backend"""
+        from app.services.storage_service import StorageService
+
+        url = await StorageService.upload_resume(b"%PDF", "cv.pdf", "user_1", "token")
+        path = backend.path_from_url(StorageService.BUCKET_NAME, url)
+        assert path.startswith("user_1/") and path.endswith(".pdf")
+        assert await backend.download(StorageService.BUCKET_NAME, path) == b"%PDF"
+
+        assert await StorageService.delete_resume(url, "token")
+        assert backend.files == {}
+
+    @pytest.mark.asyncio
+    async def test_upload_audio(self, backend):
+        """Test archiving answer audio with its content type"""
+        from app.services.storage_service import StorageService
+
+        path = await StorageService().upload_audio(audio_bytes=b"RIFF", file_name="answers/1/q2_sid.webm")
+
+        assert path == "answers/1/q2_sid.webm"
+        assert backend.files[(StorageService.AUDIO_BUCKET_NAME, path)] == (b"RIFF", "audio/webm")
+
+    @pytest.mark.asyncio
+    async def test_audio_served_through_signed_url(self, backend):
+        """Test that archived answers get expiring signed links instead of public ones"""
+        from app.services.storage_service import StorageService
+
+        url = await StorageService.get_audio_url("answers/1/q2_sid.webm")
+
+        assert url.startswith(f"memory://{StorageService.AUDIO_BUCKET_NAME}/answers/1/q2_sid.webm?expires=")
+
+    @pytest.mark.asyncio
+    async def test_local_backend_streams_to_disk(self, tmp_path):
+        """Test the local disk backend and its path checks"""
+        from io import BytesIO
+        from app.services.storage_backends import LocalStorageBackend
+
+        backend = LocalStorageBackend(str(tmp_path), "http://localhost:8000/storage")
+
+        url = await backend.upload_file("resumes", "u/cv.pdf", BytesIO(b"%PDF"), "application/pdf")
+        assert url == "http://localhost:8000/storage/resumes/u/cv.pdf"
+        assert (tmp_path / "resumes" / "u" / "cv.pdf").read_bytes() == b"%PDF"
+
+        with pytest.raises(ValueError):
+            await backend.upload("resumes", "../../escape.pdf", b"x", "application/pdf")
+
+        await backend.delete("resumes", backend.path_from_url("resumes", url))
+        assert not (tmp_path / "resumes" / "u" / "cv.pdf").exists()
+
+
+class TestAudioTranscoder:
+    """Tests for answer audio transcoding"""
+
+    @pytest.mark.asyncio
+    async def test_transcodes_to_opus(self):
+        """Test that recorded audio is replaced by the smaller Opus output"""
+        from app.services.audio_transcoder import transcode_to_opus
+
+        with patch("app.services.audio_transcoder.settings.AUDIO_TRIM_SILENCE", False), \
+             patch("app.services.audio_transcoder.shutil.which", return_value="/usr/bin/ffmpeg"), \
+             patch("app.services.audio_transcoder._run_ffmpeg", AsyncMock(return_value=(b"OggS" * 10, None, ""))) as run:
+            result = await transcode_to_opus(b"\x1aE" * 1000, "webm")
+
+        assert tuple(result) == (b"OggS" * 10, "ogg", b"OggS" * 10, None, None)
+        input_path = run.await_args.args[0]
+        assert input_path.endswith(".webm") and not os.path.exists(input_path)
+
+    @pytest.mark.asyncio
+    async def test_archives_untrimmed_and_transcribes_trimmed(self):
+        """Test that the whole recording is archived and the trimmed copy is transcribed"""
+        from app.services.audio_transcoder import transcode_to_opus
+
+        log = "  Duration: 00:00:10.00, start: 0.000000, bitrate: 128 kb/s"
+        with patch("app.services.audio_transcoder.settings.AUDIO_TRIM_SILENCE", True), \
+             patch("app.services.audio_transcoder.shutil.which", return_value="/usr/bin/ffmpeg"), \
+             patch("app.services.audio_transcoder._run_ffmpeg", AsyncMock(return_value=(b"full" * 10, b"trim", log))):
+            result = await transcode_to_opus(b"\x1aE" * 1000, "webm")
+
+        assert (result.audio, result.format, result.transcription_audio) == (b"full" * 10, "ogg", b"trim")
+        assert result.duration == 10.0
+        assert result.pause_stats["recording_seconds"] == 10.0
+
+    @pytest.mark.asyncio
+    async def test_overlong_answer_rejected_before_upload(self):
+        """Test that MAX_AUDIO_DURATION is checked on the recording before it is archived or transcribed"""
+        from app.services.audio_transcoder import TranscodedAnswer
+        from app.websocket import interview_handler
+
+        transcoded = TranscodedAnswer(b"full", "ogg", b"trim", 400.0, None)
+        with patch("app.websocket.interview_handler.transcode_to_opus", AsyncMock(return_value=transcoded)), \
+             patch("app.websocket.interview_handler.StorageService.upload_audio", AsyncMock()) as upload, \
+             patch.object(interview_handler.speech_to_text_service, "transcribe_long_audio", AsyncMock()) as transcribe, \
+             patch.object(interview_handler.sio, "emit", AsyncMock()) as emit:
+            result = await interview_handler._transcribe_answer("sid", 1, 2, b"\x1aE" * 100, "webm")
+
+        assert result is None
+        upload.assert_not_awaited()
+        transcribe.assert_not_awaited()
+        assert "too long" in emit.await_args.args[1]["message"]
+
+    @pytest.mark.asyncio
+    async def test_unmeasured_answer_rejected_before_upload(self):
+        """Test that an answer is rejected when its duration can't be measured"""
+        from app.services.audio_transcoder import TranscodedAnswer
+        from app.websocket import interview_handler
+
+        transcoded = TranscodedAnswer(b"\x1aE" * 100, "webm", b"\x1aE" * 100, None, None)
+        with patch("app.websocket.interview_handler.transcode_to_opus", AsyncMock(return_value=transcoded)), \
+             patch("app.websocket.interview_handler.measure_duration", AsyncMock(return_value=None)) as measure, \
+             patch("app.websocket.interview_handler.StorageService.upload_audio", AsyncMock()) as upload, \
+             patch.object(interview_handler.speech_to_text_service, "transcribe_long_audio", AsyncMock()) as transcribe, \
+             patch.object(interview_handler.sio, "emit", AsyncMock()) as emit:
+            result = await interview_handler._transcribe_answer("sid", 1, 2, b"\x1aE" * 100, "webm")
+
+        assert result is None
+        measure.assert_awaited_once_with(b"\x1aE" * 100, "webm")
+        upload.assert_not_awaited()
+        transcribe.assert_not_awaited()
+        assert "Could not read" in emit.await_args.args[1]["message"]
+
+    def test_trim_command_archives_full_recording(self):
+        """Test that silence removal only applies to the transcription output"""
+        from app.services.audio_transcoder import _ffmpeg_command
+
+        with patch("app.services.audio_transcoder.settings.AUDIO_TRIM_SILENCE", True):
+            command = _ffmpeg_command("in.webm", "in.webm.ogg")
+
+        graph = command[command.index("-filter_complex") + 1]
+        assert graph.startswith("[0:a]asplit=2[full][speech];[speech]silencedetect")
+        assert command[command.index("[full]") + 1:].index("in.webm.ogg") < command.index("[trimmed]")
+        assert command[-1] == "pipe:1"
+
+    @pytest.mark.asyncio
+    async def test_keeps_original_without_ffmpeg(self):
+        """Test that audio is stored as recorded when ffmpeg is unavailable"""
+        from app.services.audio_transcoder import transcode_to_opus
+
+        with patch("app.services.audio_transcoder.shutil.which", return_value=None):
+            assert tuple(await transcode_to_opus(b"RIFF" * 100, "wav")) == (b"RIFF" * 100, "wav", b"RIFF" * 100, None, None)
+
+    @pytest.mark.asyncio
+    async def test_keeps_original_on_failure(self):
+        """Test that a failed transcode falls back to the recorded audio"""
+        from app.services.audio_transcoder import transcode_to_opus
+
+        with patch("app.services.audio_transcoder.shutil.which", return_value="/usr/bin/ffmpeg"), \
+             patch("app.services.audio_transcoder._run_ffmpeg", AsyncMock(side_effect=Exception("bad input"))):
+            assert tuple(await transcode_to_opus(b"RIFF" * 100, "wav")) == (b"RIFF" * 100, "wav", b"RIFF" * 100, None, None)
+
+    def test_parses_pause_stats(self):
+        """Test that silencedetect output becomes leading/trailing silence and pauses"""
+        from app.services.audio_transcoder import _parse_pause_stats
+
+        log = "\n".join([
+            "  Duration: 00:00:20.00, start: 0.000000, bitrate: 128 kb/s",
+            "[silencedetect @ 0x1] silence_start: -0.01",
+            "[silencedetect @ 0x1] silence_end: 1.5 | silence_duration: 1.51",
+            "[silencedetect @ 0x1] silence_start: 6",
+            "[silencedetect @ 0x1] silence_end: 9 | silence_duration: 3",
+            "[silencedetect @ 0x1] silence_start: 12",
+            "[silencedetect @ 0x1] silence_end: 12.5 | silence_duration: 0.5",
+            "[silencedetect @ 0x1] silence_start: 18",
+        ])
+
+        assert _parse_pause_stats(log) == {
+            "recording_seconds": 20.0,
+            "speaking_seconds": 13.0,
+            "leading_silence_seconds": 1.5,
+            "trailing_silence_seconds": 2.0,
+            "pause_count": 2,
+            "total_pause_seconds": 3.5,
+            "longest_pause_seconds": 3.0,
+        }
+        assert _parse_pause_stats("no duration here") is None
+
+    def test_pause_stats_without_container_duration(self):
+        """Test that a WebM log with Duration: N/A takes the length from the final progress line"""
+        from app.services.audio_transcoder import _parse_pause_stats
+
+        log = "\n".join([
+            "  Duration: N/A, start: 0.000000, bitrate: N/A",
+            "size=       2kB time=00:00:08.00 bitrate=   2.1kbits/s speed=  16x",
+            "[silencedetect @ 0x1] silence_start: 6",
+            "[silencedetect @ 0x1] silence_end: 9 | silence_duration: 3",
+            "size=      20kB time=00:00:20.00 bitrate=   8.2kbits/s speed=  17x",
+        ])
+
+        stats = _parse_pause_stats(log)
+        assert stats["recording_seconds"] == 20.0
+        assert stats["pause_count"] == 1
+        assert stats["longest_pause_seconds"] == 3.0
+
+    def test_speaking_analysis_reports_pauses(self):
+        """Test that measured pauses are included in the speaking analysis"""
+        from app.services.evaluation_service import analyze_speaking_patterns
+
+        analysis = analyze_speaking_patterns(
+            "I built the service in Python",
+            audio_duration_seconds=3,
+            pause_stats={"pause_count": 2, "total_pause_seconds": 3.5, "longest_pause_seconds": 3.0}
+        )
+
+        assert analysis["words_per_minute"] == 120.0
+        assert analysis["pause_count"] == 2
+        assert analysis["longest_pause_seconds"] == 3.0
+
+
+class TestSpeechToText:
+    """Tests for long-audio transcription"""
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_error_is_not_wrapped(self):
+        """Test that fast-fail errors reach the caller unchanged"""
+        from app.services import ai_governor
+        from app.services.speech_to_text import speech_to_text_service
+
+        governor = ai_governor.get_governor(ai_governor.GROQ)
+        for _ in range(governor.breaker.failure_threshold):
+            governor.breaker.record_failure()
+
+        with pytest.raises(ai_governor.ProviderUnavailableError):
+            await speech_to_text_service.transcribe_audio("answer.ogg")
+
+    def test_cuts_prefer_pauses_near_boundaries(self):
+        """Test that chunks are cut at the pause closest to each boundary"""
+        from app.services.speech_to_text import choose_cut_points
+
+        silences = [(20.0, 21.0), (57.0, 58.0), (63.0, 64.0), (118.0, 119.0)]
+
+        # 57.5 is nearest 60; the next boundary is 57.5 + 60 = 117.5, nearest pause 118.5;
+        # the next target, 178.5, falls in the final CUT_SEARCH_SECONDS and isn't cut
+        assert choose_cut_points(190.0, silences) == [57.5, 118.5]
+        assert choose_cut_points(150.0, []) == [60, 120]
+
+    @pytest.mark.asyncio
+    async def test_long_audio_is_chunked_and_stitched(self):
+        """Test that long audio is transcribed in concurrent chunks with offset timestamps"""
+        from app.services.speech_to_text import speech_to_text_service
+
+        chunk_results = {
+            "a.ogg": {"text": "First part.", "language": "en", "segments": [{"start": 1.0, "end": 4.0, "text": "First part."}]},
+            "b.ogg": {"text": "Second part.", "language": "en", "segments": [{"start": 0.5, "end": 2.0, "text": "Second part."}]},
+        }
+
+        async def transcribe(path, language, timeout):
+            assert timeout <= 90
+            return chunk_results[path]
+
+        with patch("app.services.speech_to_text.shutil.which", return_value="/usr/bin/ffmpeg"), \
+             patch("app.services.speech_to_text.detect_silences", AsyncMock(return_value=(100.0, [(59.0, 61.0)]))), \
+             patch("app.services.speech_to_text.split_audio", AsyncMock(return_value=["a.ogg", "b.ogg"])) as split, \
+             patch.object(speech_to_text_service, "transcribe_audio", side_effect=transcribe):
+            result = await speech_to_text_service.transcribe_long_audio("answer.ogg")
+
+        assert split.await_args.args[1] == [60.0]
+        assert result["text"] == "First part. Second part."
+        assert result["duration"] == 100.0
+        assert [(s["start"], s["end"]) for s in result["segments"]] == [(1.0, 4.0), (60.5, 62.0)]
+
+    @pytest.mark.asyncio
+    async def test_rejects_audio_over_max_duration(self):
+        """Test that MAX_AUDIO_DURATION is enforced before calling the API"""
+        from app.services.speech_to_text import speech_to_text_service, AudioTooLongError
+
+        with patch("app.services.speech_to_text.shutil.which", return_value="/usr/bin/ffmpeg"), \
+             patch("app.services.speech_to_text.detect_silences", AsyncMock(return_value=(301.0, []))), \
+             patch.object(speech_to_text_service, "transcribe_audio", AsyncMock()) as transcribe:
+            with pytest.raises(AudioTooLongError):
+                await speech_to_text_service.transcribe_long_audio("answer.ogg")
+
+        transcribe.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_short_audio_uses_adaptive_timeout(self):
+        """Test that short audio is one request with a length-based timeout"""
+        from app.services.speech_to_text import speech_to_text_service
+
+        with patch("app.services.speech_to_text.shutil.which", return_value="/usr/bin/ffmpeg"), \
+             patch("app.services.speech_to_text.detect_silences", AsyncMock(return_value=(20.0, []))), \
+             patch.object(speech_to_text_service, "transcribe_audio", AsyncMock(return_value={"text": "hi"})) as transcribe:
+            await speech_to_text_service.transcribe_long_audio("answer.ogg")
+
+        assert transcribe.await_args.kwargs["timeout"] == 25
+
+
+class TestAIGovernor:
+    """Tests for provider concurrency and rate limits"""
+
+    @pytest.mark.asyncio
+    async def test_interactive_calls_go_first(self):
+        """Test that a queued interactive call is admitted before earlier batch calls"""
+        import asyncio
+        from app.services.ai_governor import ProviderGovernor, INTERACTIVE, BATCH
+
+        governor = ProviderGovernor("test", max_concurrent=2, requests_per_minute=1000)
+        order = []
+        release = asyncio.Event()
+
+        async def call(name, priority):
+            async with governor.slot(priority):
+                order.append(name)
+                await release.wait()
+
+        tasks = [asyncio.create_task(call("batch-1", BATCH))]
+        await asyncio.sleep(0)
+        tasks += [asyncio.create_task(call(f"batch-{i}", BATCH)) for i in (2, 3)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(call("interactive", INTERACTIVE)))
+        await asyncio.sleep(0)
+
+        # Batch work may only hold half the slots, so the interactive call got the other one
+        assert order == ["batch-1", "interactive"]
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert order == ["batch-1", "interactive", "batch-2", "batch-3"]
+        assert governor.active == 0
+
+    @pytest.mark.asyncio
+    async def test_each_class_keeps_headroom_above_it(self):
+        """Test that batch and near-real-time work leave slots for higher classes"""
+        import asyncio
+        from app.services.ai_governor import ProviderGovernor, INTERACTIVE, NEAR_REAL_TIME, BATCH
+
+        governor = ProviderGovernor("test", max_concurrent=4, requests_per_minute=1000)
+        release = asyncio.Event()
+        running = []
+
+        async def call(name, priority):
+            async with governor.slot(priority):
+                running.append(name)
+                await release.wait()
+
+        tasks = [asyncio.create_task(call(f"batch-{i}", BATCH)) for i in range(3)]
+        tasks += [asyncio.create_task(call(f"nrt-{i}", NEAR_REAL_TIME)) for i in range(2)]
+        tasks.append(asyncio.create_task(call("interactive", INTERACTIVE)))
+        await asyncio.sleep(0)
+
+        # Batch holds at most 2 of 4 slots, batch + near-real-time at most 3
+        assert running == ["batch-0", "batch-1", "nrt-0", "interactive"]
+        assert governor.queued == {INTERACTIVE: 0, NEAR_REAL_TIME: 1, BATCH: 1}
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert running[4:] == ["nrt-1", "batch-2"]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_fails_fast(self):
+        """Test that a class whose queue is full rejects new calls"""
+        import asyncio
+        from app.services import ai_governor
+        from app.services.ai_governor import ProviderGovernor, ProviderBusyError, BATCH
+
+        governor = ProviderGovernor("test", max_concurrent=1, requests_per_minute=1000)
+        await governor.acquire(BATCH)
+
+        with patch.dict(ai_governor.MAX_QUEUED, {BATCH: 1}):
+            waiting = asyncio.create_task(governor.acquire(BATCH))
+            await asyncio.sleep(0)
+            with pytest.raises(ProviderBusyError):
+                await governor.acquire(BATCH)
+
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert governor.queued[BATCH] == 0
+
+    @pytest.mark.asyncio
+    async def test_requests_per_minute_is_enforced(self):
+        """Test that calls past the request budget wait for the bucket to refill"""
+        import asyncio
+        from app.services.ai_governor import ProviderGovernor
+
+        governor = ProviderGovernor("test", max_concurrent=10, requests_per_minute=2)
+        await governor.acquire()
+        await governor.acquire()
+
+        third = asyncio.create_task(governor.acquire())
+        await asyncio.sleep(0.05)
+        assert not third.done()
+        assert governor.requests.wait_time(1) > 25
+
+        third.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await third
+        assert governor.active == 2
+
+    @pytest.mark.asyncio
+    async def test_gemini_calls_run_through_governor(self, mock_gemini):
+        """Test that a Gemini call is counted against the Gemini governor"""
+        from app.services import ai_governor
+        from app.services.gemini_service import parse_resume_text
+
+        governor = ai_governor.ProviderGovernor("gemini", max_concurrent=1, requests_per_minute=60)
+        mock_gemini.generate_content.return_value.text = '{"name": "Test"}'
+
+        with patch.dict(ai_governor._governors, {ai_governor.GEMINI: governor}):
+            assert (await parse_resume_text("resume"))["name"] == "Test"
+
+        assert governor.requests.tokens < 60
+        assert governor.active == 0
+
+
+class TestCircuitBreaker:
+    """Tests for failing fast during provider outages"""
+
+    @pytest.fixture
+    def governor(self):
+        from app.services import ai_governor
+
+        governor = ai_governor.ProviderGovernor("gemini", max_concurrent=4, requests_per_minute=1000)
+        governor.breaker.failure_threshold = 2
+        governor.breaker.recovery_seconds = 30
+        with patch.dict(ai_governor._governors, {ai_governor.GEMINI: governor}):
+            yield governor
+
+    @pytest.mark.asyncio
+    async def test_opens_after_consecutive_failures(self, governor):
+        """Test that calls stop reaching the provider once the breaker opens"""
+        from app.services.ai_governor import ProviderUnavailableError
+
+        from google.api_core.exceptions import ServiceUnavailable
+
+        failing = Mock(side_effect=ServiceUnavailable("Service Unavailable"))
+        for _ in range(2):
+            with pytest.raises(ServiceUnavailable):
+                await governor.call(failing)
+
+        with pytest.raises(ProviderUnavailableError):
+            await governor.call(failing)
+        assert failing.call_count == 2
+        assert governor.active == 0
+
+    @pytest.mark.asyncio
+    async def test_request_errors_do_not_open_breaker(self, governor):
+        """Test that errors that aren't provider failures leave the breaker closed"""
+        from google.api_core.exceptions import InvalidArgument
+        from app.services.ai_governor import CircuitBreaker
+
+        for error in (InvalidArgument("bad prompt"), ValueError("could not parse response"), KeyError("text")):
+            for _ in range(3):
+                with pytest.raises(type(error)):
+                    await governor.call(Mock(side_effect=error))
+
+        assert governor.breaker.state == CircuitBreaker.CLOSED
+        assert governor.breaker.failures == 0
+
+    def test_is_provider_failure(self):
+        """Test which errors count as provider failures"""
+        import asyncio
+        import httpx
+        from google.api_core.exceptions import ResourceExhausted, PermissionDenied
+        from app.services.ai_governor import is_provider_failure
+
+        request = httpx.Request("POST", "https://api.groq.com/openai/v1/audio/transcriptions")
+
+        assert is_provider_failure(asyncio.TimeoutError())
+        assert is_provider_failure(httpx.ConnectError("refused", request=request))
+        assert is_provider_failure(ResourceExhausted("quota"))
+        assert is_provider_failure(Mock(spec=Exception, status_code=502))
+        assert not is_provider_failure(PermissionDenied("bad key"))
+        assert not is_provider_failure(Mock(spec=Exception, status_code=400))
+        assert not is_provider_failure(Exception("Service Unavailable"))
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_closes_breaker(self, governor):
+        """Test that one probe is allowed after the cooldown and success closes the breaker"""
+        import asyncio
+        from app.services.ai_governor import CircuitBreaker, ProviderUnavailableError
+
+        breaker = governor.breaker
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+        breaker.opened_at -= 31
+        probe_started = asyncio.Event()
+        finish_probe = asyncio.Event()
+
+        def probe():
+            return "ok"
+
+        async def slow_probe():
+            async with governor.slot():
+                probe_started.set()
+                await finish_probe.wait()
+                return probe()
+
+        probe_task = asyncio.create_task(slow_probe())
+        await probe_started.wait()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        with pytest.raises(ProviderUnavailableError):
+            await governor.call(probe)
+
+        finish_probe.set()
+        assert await probe_task == "ok"
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert await governor.call(probe) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_skips_retries_and_uses_fallback(self, governor, mock_gemini):
+        """Test that an open breaker fails resume parsing at once and evaluation falls back"""
+        from app.services.ai_governor import ProviderUnavailableError
+        from app.services.gemini_service import parse_resume_text
+        from app.services.evaluation_service import evaluate_answer
+
+        governor.breaker.record_failure()
+        governor.breaker.record_failure()
+
+        # Without fast-fail the retries alone would back off for 3s
+        start = time.monotonic()
+        with pytest.raises(ProviderUnavailableError):
+            await parse_resume_text("resume")
+        assert time.monotonic() - start < 0.5
+        mock_gemini.generate_content.assert_not_called()
+
+        evaluation = await evaluate_answer("Q?", {}, "answer", {}, {})
+        assert evaluation["score"] == 5
+        assert "technical error" in evaluation["feedback"]
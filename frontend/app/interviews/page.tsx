@@ -40,6 +40,8 @@ export default function InterviewsPage() {
   const [interviews, setInterviews] = useState<Interview[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
+  const [nextCursor, setNextCursor] = useState<number | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   // Search and filter states
   const [searchQuery, setSearchQuery] = useState('');
@@ -65,6 +67,7 @@ export default function InterviewsPage() {
       if (!token) return;
       const data = await api.getInterviews(token);
       setInterviews(data.interviews || []);
+      setNextCursor(data.next_cursor ?? null);
     } catch (err) {
       setError(err instanceof Error ? err.message : String(err));
     } finally {
@@ -72,6 +75,22 @@ export default function InterviewsPage() {
     }
   };
 
+  const loadMoreInterviews = async () => {
+    if (nextCursor === null) return;
+    try {
+      setLoadingMore(true);
+      const token = await getToken();
+      if (!token) return;
+      const data = await api.getInterviews(token, nextCursor);
+      setInterviews(prev => [...prev, ...(data.interviews || [])]);
+      setNextCursor(data.next_cursor ?? null);
+    } catch (err) {
+      setError(err instanceof Error ? err.message : String(err));
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleDelete = async (interviewId: number) => {
     setInterviewToDelete(interviewId);
     setDeleteModalOpen(true);
@@ -486,6 +505,17 @@ export default function InterviewsPage() {
               })}
             </div>
           )}
+
+          {nextCursor !== null && (
+            <div style={{ padding: '16px 24px', borderTop: '1px solid rgba(255,255,255,0.06)', textAlign: 'center' }}>
+              <p style={{ fontSize: '12px', color: '#7a6f62', marginBottom: '10px' }}>
+                Showing your {interviews.length} most recent interviews
+              </p>
+              <GlassButton variant="neutral" size="sm" onClick={loadMoreInterviews} disabled={loadingMore}>
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </GlassButton>
+            </div>
+          )}
         </div>
       </div>
 
@@ -30,6 +30,8 @@ export default function ResumesPage() {
   const [loading, setLoading] = useState(true);
   const [uploading, setUploading] = useState(false);
   const [error, setError] = useState('');
+  const [nextCursor, setNextCursor] = useState<number | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [selectedFile, setSelectedFile] = useState<File | null>(null);
   const [dragActive, setDragActive] = useState(false);
   const [modalState, setModalState] = useState<{
@@ -60,6 +62,7 @@ export default function ResumesPage() {
       if (!token) return;
       const data = await api.getResumes(token);
       setResumes(data.resumes || []);
+      setNextCursor(data.next_cursor ?? null);
     } catch (err) {
       setError(err instanceof Error ? err.message : String(err));
     } finally {
@@ -67,6 +70,22 @@ export default function ResumesPage() {
     }
   };
 
+  const loadMoreResumes = async () => {
+    if (nextCursor === null) return;
+    try {
+      setLoadingMore(true);
+      const token = await getToken();
+      if (!token) return;
+      const data = await api.getResumes(token, nextCursor);
+      setResumes(prev => [...prev, ...(data.resumes || [])]);
+      setNextCursor(data.next_cursor ?? null);
+    } catch (err) {
+      setError(err instanceof Error ? err.message : String(err));
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleDrag = (e: React.DragEvent) => {
     e.preventDefault();
     e.stopPropagation();
@@ -378,6 +397,14 @@ export default function ResumesPage() {
               ))}
             </div>
           )}
+
+          {nextCursor !== null && (
+            <div style={{ padding: '16px 24px', borderTop: '1px solid rgba(255,255,255,0.06)', textAlign: 'center' }}>
+              <GlassButton variant="neutral" size="sm" onClick={loadMoreResumes} disabled={loadingMore}>
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </GlassButton>
+            </div>
+          )}
         </motion.div>
       </div>
 
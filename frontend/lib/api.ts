@@ -104,11 +104,42 @@ export const api = {
       throw new Error(error.detail || 'Resume upload failed');
     }
 
+    // Parsing runs in the background; wait for it to finish, up to 2 minutes
+    const upload = await response.json();
+    const deadline = Date.now() + 2 * 60 * 1000;
+    let result = upload;
+    while (result.status === 'processing') {
+      if (Date.now() >= deadline) {
+        throw new Error('Resume processing is taking too long. Please try uploading again.');
+      }
+      await new Promise((resolve) => setTimeout(resolve, 1500));
+      result = await api.getResumeStatus(upload.id, token);
+    }
+
+    if (result.status === 'failed') {
+      throw new Error(result.error || 'Resume processing failed');
+    }
+
+    return result;
+  },
+
+  async getResumeStatus(resumeId: number, token: string) {
+    const response = await fetch(`${API_URL}/resumes/${resumeId}/status`, {
+      headers: {
+        'Authorization': `Bearer ${token}`,
+      },
+    });
+
+    if (!response.ok) {
+      throw new Error('Failed to fetch resume status');
+    }
+
     return response.json();
   },
 
-  async getResumes(token: string) {
-    const response = await fetch(`${API_URL}/resumes/`, {
+  async getResumes(token: string, cursor?: number) {
+    const query = cursor !== undefined ? `?cursor=${cursor}` : '';
+    const response = await fetch(`${API_URL}/resumes/${query}`, {
       headers: {
         'Authorization': `Bearer ${token}`,
       },
@@ -162,8 +193,9 @@ export const api = {
     return response.json();
   },
 
-  async getInterviews(token: string) {
-    const response = await fetch(`${API_URL}/interviews/`, {
+  async getInterviews(token: string, cursor?: number) {
+    const query = cursor !== undefined ? `?cursor=${cursor}` : '';
+    const response = await fetch(`${API_URL}/interviews/${query}`, {
       headers: {
         'Authorization': `Bearer ${token}`,
       },